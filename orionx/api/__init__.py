@@ -1,8 +1,13 @@
 """OneX API Module - FastAPI endpoints."""
 
-from .routes import router, get_engine
+from .routes import router, get_engine, close_engine
+from .webhook_batcher import WebhookBatcher
+from .asgi_middleware import PureCORSMiddleware
 
 __all__ = [
     "router",
     "get_engine",
+    "close_engine",
+    "WebhookBatcher",
+    "PureCORSMiddleware",
 ]
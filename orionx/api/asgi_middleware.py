@@ -0,0 +1,144 @@
+"""
+OneX ASGI Middleware
+
+Pure ASGI middleware operating on (scope, receive, send) directly.
+CORS header values are encoded once at startup; per request the only
+work is one pass over the raw request headers, and requests without an
+Origin header pass straight through.
+"""
+
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+RawHeaders = List[Tuple[bytes, bytes]]
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+class PureCORSMiddleware:
+    """
+    CORS middleware without Request/Response or Headers objects.
+
+    Preflight requests are answered here with 204 and never reach the
+    router. For other cross-origin requests the CORS headers are appended
+    to the http.response.start message. With allow_credentials, the
+    request's origin is echoed back, since browsers reject "*" there.
+    
+    With path_prefixes, only matching paths get CORS handling; all other
+    requests (docs, the root document) go straight to the app.
+
+    Usage:
+        app.add_middleware(PureCORSMiddleware, allow_origins=["*"])
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+        path_prefixes: Sequence[str] = (),
+    ):
+        self.app = app
+        self._path_prefixes = tuple(path_prefixes)
+        self._allow_all_origins = "*" in allow_origins
+        self._allowed_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self._allow_all_headers = "*" in allow_headers
+        self._echo_origin = allow_credentials or not self._allow_all_origins
+
+        methods = ALL_METHODS if "*" in allow_methods else allow_methods
+
+        # Headers shared by every CORS response
+        common: RawHeaders = []
+        if allow_credentials:
+            common.append((b"access-control-allow-credentials", b"true"))
+        if self._echo_origin:
+            common.append((b"vary", b"Origin"))
+
+        self._simple_headers = common
+        self._preflight_headers = common + [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self._allow_all_headers and allow_headers:
+            self._preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1"))
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self._path_prefixes and not scope["path"].startswith(self._path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self._allow_all_origins or origin in self._allowed_origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, allowed, request_headers, send)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._simple_headers + [self._allow_origin(origin)]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        allowed: bool,
+        request_headers: Optional[bytes],
+        send: Send,
+    ) -> None:
+        """Answer a preflight request without dispatching to the app."""
+        if not allowed:
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = self._preflight_headers + [self._allow_origin(origin)]
+        if self._allow_all_headers and request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    def _allow_origin(self, origin: bytes) -> Tuple[bytes, bytes]:
+        return (b"access-control-allow-origin", origin if self._echo_origin else b"*")
@@ -10,15 +10,20 @@ Implements the public API contract:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import time
 
 from ..core.executor import OneXEngine
 from ..schemas.execution import ExecutionContext, ExecutionStatus
-from ..schemas.workflow import Workflow, TriggerType
+from ..schemas.workflow import Workflow, StepType, TriggerType
+from ..utils.serialization import dumps, fingerprint
 
 
 # =============================================================================
@@ -71,6 +76,10 @@ class ExecutionStatusResponse(BaseModel):
     steps: List[Dict[str, Any]]
     output: Optional[Any]
     error: Optional[Dict[str, Any]]
+    page_info: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Set for paged queries: has_next_page and end_cursor",
+    )
 
 
 class CancelWorkflowResponse(BaseModel):
@@ -130,6 +139,136 @@ def get_engine() -> OneXEngine:
     return _engine
 
 
+async def close_engine() -> None:
+    """Close the engine singleton's resources (called on shutdown)."""
+    if _engine is not None:
+        await _engine.close()
+
+
+# Parsed workflows keyed by content fingerprint (LRU)
+_WORKFLOW_CACHE_SIZE = 1024
+_workflow_cache: "OrderedDict[str, Workflow]" = OrderedDict()
+
+
+def _parse_workflow(data: Dict[str, Any]) -> Workflow:
+    """
+    Validate a workflow definition, reusing the parsed model for repeat submits.
+    
+    Workflows are immutable per content, so an identical definition maps to
+    the same validated Workflow instance.
+    """
+    key = fingerprint(data)
+    workflow = _workflow_cache.get(key)
+    if workflow is not None:
+        _workflow_cache.move_to_end(key)
+        return workflow
+    
+    workflow = Workflow.model_validate(data)
+    _workflow_cache[key] = workflow
+    if len(_workflow_cache) > _WORKFLOW_CACHE_SIZE:
+        _workflow_cache.popitem(last=False)
+    return workflow
+
+
+# ISO timestamps keyed by epoch second (tiny, cleared when full)
+_ISO_CACHE_SIZE = 4
+_iso_cache: Dict[int, str] = {}
+
+
+def _iso_now() -> str:
+    """Get the current UTC time as an ISO string, formatted once per second."""
+    epoch_sec = time.time_ns() // 1_000_000_000
+    iso = _iso_cache.get(epoch_sec)
+    if iso is None:
+        if len(_iso_cache) >= _ISO_CACHE_SIZE:
+            _iso_cache.clear()
+        iso = datetime.utcfromtimestamp(epoch_sec).isoformat()
+        _iso_cache[epoch_sec] = iso
+    return iso
+
+
+# Serialized responses for executions in a terminal state (LRU with TTL)
+_EXECUTION_CACHE_SIZE = 4096
+_EXECUTION_CACHE_TTL_SECONDS = 300.0
+_execution_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+# CANCELLED is left out: cancel() only flags a running execution, which
+# later finishes with its own final status.
+_TERMINAL_STATUSES = frozenset({
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.TIMEOUT,
+})
+
+
+def _get_cached_execution(execution_id: str) -> Optional[bytes]:
+    """Get a cached execution response body, dropping it if expired."""
+    entry = _execution_cache.get(execution_id)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at < time.monotonic():
+        del _execution_cache[execution_id]
+        return None
+    _execution_cache.move_to_end(execution_id)
+    return body
+
+
+# Steps serialized per chunk when streaming an execution
+STREAM_CHUNK_SIZE = 100
+
+
+def _cache_execution(execution_id: str, body: bytes) -> None:
+    """Cache a terminal execution response body."""
+    _execution_cache[execution_id] = (time.monotonic() + _EXECUTION_CACHE_TTL_SECONDS, body)
+    _execution_cache.move_to_end(execution_id)
+    if len(_execution_cache) > _EXECUTION_CACHE_SIZE:
+        _execution_cache.popitem(last=False)
+
+
+# Static schema documentation
+STEP_TYPE_DOCS = {
+    "create_entity": "Create a database entity",
+    "update_entity": "Update a database entity",
+    "delete_entity": "Delete a database entity",
+    "query_entity": "Query database entities",
+    "api_call": "Make an external API call",
+    "send_email": "Send an email",
+    "condition": "Conditional branching",
+    "loop": "Loop over a collection",
+    "schedule_workflow": "Schedule a workflow for later",
+    "call_workflow": "Call another workflow",
+    "transform_data": "Transform data using a mapping",
+    "validate_data": "Validate data against rules",
+    "plugin_action": "Execute a plugin action",
+    "set_execution_state": "Set execution state",
+    "log": "Log a message",
+}
+
+TRIGGER_TYPE_DOCS = {
+    "data_event": "Triggered by database change",
+    "scheduled": "Triggered by schedule (cron)",
+    "api_webhook": "Triggered by external API call",
+    "workflow_call": "Triggered by another workflow",
+    "manual": "Triggered programmatically",
+}
+
+
+@lru_cache(maxsize=1)
+def _schema_response_body() -> bytes:
+    """Serialize the schema info once; it is static for the process lifetime."""
+    return SchemaInfoResponse(
+        step_types=[
+            StepTypeInfo(name=t.value, description=STEP_TYPE_DOCS.get(t.value, ""))
+            for t in StepType
+        ],
+        trigger_types=[
+            TriggerTypeInfo(name=t.value, description=TRIGGER_TYPE_DOCS.get(t.value, ""))
+            for t in TriggerType
+        ],
+    ).model_dump_json().encode()
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -145,7 +284,7 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         version="0.1.0",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_iso_now(),
     )
 
 
@@ -157,44 +296,7 @@ async def health_check():
 )
 async def get_schema_info():
     """Get schema information."""
-    from ..schemas.workflow import StepType, TriggerType
-    
-    step_docs = {
-        "create_entity": "Create a database entity",
-        "update_entity": "Update a database entity",
-        "delete_entity": "Delete a database entity",
-        "query_entity": "Query database entities",
-        "api_call": "Make an external API call",
-        "send_email": "Send an email",
-        "condition": "Conditional branching",
-        "loop": "Loop over a collection",
-        "schedule_workflow": "Schedule a workflow for later",
-        "call_workflow": "Call another workflow",
-        "transform_data": "Transform data using a mapping",
-        "validate_data": "Validate data against rules",
-        "plugin_action": "Execute a plugin action",
-        "set_execution_state": "Set execution state",
-        "log": "Log a message",
-    }
-    
-    trigger_docs = {
-        "data_event": "Triggered by database change",
-        "scheduled": "Triggered by schedule (cron)",
-        "api_webhook": "Triggered by external API call",
-        "workflow_call": "Triggered by another workflow",
-        "manual": "Triggered programmatically",
-    }
-    
-    return SchemaInfoResponse(
-        step_types=[
-            StepTypeInfo(name=t.value, description=step_docs.get(t.value, ""))
-            for t in StepType
-        ],
-        trigger_types=[
-            TriggerTypeInfo(name=t.value, description=trigger_docs.get(t.value, ""))
-            for t in TriggerType
-        ],
-    )
+    return Response(content=_schema_response_body(), media_type="application/json")
 
 
 @router.post(
@@ -215,8 +317,8 @@ async def submit_workflow(
     to query the status.
     """
     try:
-        # Parse workflow
-        workflow = Workflow(**request.workflow)
+        # Parse workflow (validated once per distinct definition)
+        workflow = _parse_workflow(request.workflow)
         
         # Build context
         context = ExecutionContext()
@@ -226,17 +328,14 @@ async def submit_workflow(
             if "user" in request.context:
                 context.user = request.context["user"]
         
-        # Execute (synchronous for now, can be made async with background_tasks)
-        execution_id = await engine.submit_workflow(
-            workflow,
-            context,
-            request.user_uid,
-        )
+        # Register now, execute after the response is sent
+        execution_id = engine.create_execution(workflow, context, request.user_uid)
+        background_tasks.add_task(engine.run_execution, execution_id, workflow, context)
         
         return SubmitWorkflowResponse(
             execution_id=execution_id,
-            status="running",
-            submitted_at=datetime.utcnow().isoformat(),
+            status=ExecutionStatus.PENDING.value,
+            submitted_at=_iso_now(),
         )
         
     except Exception as e:
@@ -250,15 +349,72 @@ async def submit_workflow(
     description="Get the status and results of a workflow execution.",
 )
 async def query_execution(
+    execution_id: str,
+    first: Optional[int] = Query(default=None, ge=1, le=1000, description="Page size for steps"),
+    after: Optional[str] = Query(default=None, description="Cursor from page_info.end_cursor"),
+    engine: OneXEngine = Depends(get_engine),
+):
+    """
+    Query execution status by ID.
+    
+    Without `first`, all steps are returned. With `first`, steps are paged:
+    pass the previous page_info.end_cursor as `after` while has_next_page is true.
+    """
+    paged = first is not None
+    
+    if not paged:
+        cached = _get_cached_execution(execution_id)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
+    result = engine.query_execution(execution_id)
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    
+    steps = result.steps
+    page_info = None
+    if paged:
+        start = _decode_cursor(after)
+        end = start + first
+        page_info = {
+            "has_next_page": end < len(steps),
+            "end_cursor": str(min(end, len(steps))),
+        }
+        steps = steps[start:end]
+    
+    response = _status_response(result, [s.to_summary() for s in steps])
+    response.page_info = page_info
+    
+    # Finished executions never change, so serve them from cache afterwards
+    if not paged and result.status in _TERMINAL_STATUSES:
+        body = response.model_dump_json().encode()
+        _cache_execution(execution_id, body)
+        return Response(content=body, media_type="application/json")
+    
+    return response
+
+
+@router.get(
+    "/executions/{execution_id}/stream",
+    summary="Stream Execution",
+    description="Stream the status and results of a workflow execution as chunked JSON.",
+)
+async def stream_execution(
     execution_id: str,
     engine: OneXEngine = Depends(get_engine),
 ):
-    """Query execution status by ID."""
+    """Stream execution status by ID, serializing steps in chunks."""
     result = engine.query_execution(execution_id)
     
     if result is None:
         raise HTTPException(status_code=404, detail="Execution not found")
     
+    return StreamingResponse(_stream_status(result), media_type="application/json")
+
+
+def _status_response(result, steps: List[Dict[str, Any]]) -> ExecutionStatusResponse:
+    """Build a status response from a WorkflowResult and step summaries."""
     return ExecutionStatusResponse(
         execution_id=result.execution_id,
         workflow_uid=result.workflow_uid,
@@ -266,21 +422,39 @@ async def query_execution(
         status=result.status.value,
         started_at=result.started_at.isoformat(),
         completed_at=result.completed_at.isoformat() if result.completed_at else None,
-        steps=[
-            {
-                "step_uid": s.step_uid,
-                "step_type": s.step_type,
-                "success": s.success,
-                "duration_ms": s.duration_ms,
-                "error": s.error,
-            }
-            for s in result.steps
-        ],
+        steps=steps,
         output=result.output,
         error=result.error,
     )
 
 
+def _decode_cursor(cursor: Optional[str]) -> int:
+    """Decode a step page cursor (the index of the next step)."""
+    if cursor is None:
+        return 0
+    try:
+        index = int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if index < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return index
+
+
+def _stream_status(result) -> Iterator[bytes]:
+    """Yield a status response as JSON, with steps emitted last in chunks."""
+    header = _status_response(result, []).model_dump(mode="json", exclude={"steps", "page_info"})
+    yield dumps(header)[:-1].encode() + b',"steps":['
+    
+    steps = result.steps
+    for start in range(0, len(steps), STREAM_CHUNK_SIZE):
+        chunk = dumps([s.to_summary() for s in steps[start:start + STREAM_CHUNK_SIZE]])[1:-1]
+        prefix = b"," if start else b""
+        yield prefix + chunk.encode()
+    
+    yield b"]}"
+
+
 @router.post(
     "/executions/{execution_id}/cancel",
     response_model=CancelWorkflowResponse,
@@ -0,0 +1,117 @@
+"""
+OneX Webhook Batcher
+
+Coalesces outbound execution events into batched webhook POSTs.
+Events queued within a short window (or up to a max batch size) are
+delivered as a single {"events": [...]} payload per subscriber.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Any, Optional
+import asyncio
+import hashlib
+import hmac
+import logging
+
+import aiohttp
+
+from .routes import WebhookConfig
+from ..utils.batching import drain_batches
+from ..utils.http import create_http_session
+from ..utils.serialization import dumps
+
+
+logger = logging.getLogger(__name__)
+
+
+# Header carrying the HMAC-SHA256 signature of the batch body
+SIGNATURE_HEADER = "X-OrionX-Signature"
+
+
+class WebhookBatcher:
+    """
+    Batching dispatcher for webhook events.
+
+    Usage:
+        batcher = WebhookBatcher()
+        batcher.subscribe(WebhookConfig(url="https://example.com/hook"))
+        await batcher.start()
+        batcher.emit({"event": "step_completed", "execution_id": "exec_abc"})
+        await batcher.stop()
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 10,
+        batch_interval_ms: int = 10,
+        http_client: Optional[aiohttp.ClientSession] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval_ms / 1000.0
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._subscriptions: List[WebhookConfig] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, config: WebhookConfig) -> None:
+        """Register a webhook endpoint."""
+        self._subscriptions.append(config)
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is not None:
+            return
+        if self._http is None:
+            self._http = create_http_session()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush pending events and stop the background task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
+        if self._owns_http and self._http:
+            await self._http.close()
+            self._http = None
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """Queue an event for delivery."""
+        if self._queue is None:
+            raise RuntimeError("WebhookBatcher is not started")
+        self._queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until stopped."""
+        await drain_batches(self._queue, self.max_batch_size, self.batch_interval, self._flush)
+
+    async def _flush(self, events: List[Dict[str, Any]]) -> None:
+        """POST a batch to every subscriber interested in its events."""
+        for config in self._subscriptions:
+            matching = [e for e in events if self._is_subscribed(config, e)]
+            if not matching:
+                continue
+
+            body = dumps({"events": matching}).encode()
+            headers = dict(self._headers)
+            if config.secret:
+                headers[SIGNATURE_HEADER] = "sha256=" + hmac.new(
+                    config.secret.encode(), body, hashlib.sha256
+                ).hexdigest()
+
+            try:
+                async with self._http.post(config.url, data=body, headers=headers) as response:
+                    if response.status >= 400:
+                        logger.warning("Webhook %s returned HTTP %s", config.url, response.status)
+            except Exception as e:
+                logger.error("Webhook delivery to %s failed: %s", config.url, e)
+
+    @staticmethod
+    def _is_subscribed(config: WebhookConfig, event: Dict[str, Any]) -> bool:
+        return "all" in config.events or event.get("event") in config.events
@@ -1,12 +1,13 @@
 """OneX Compiler Module - Workflow compilation and validation."""
 
-from .workflow_compiler import WorkflowCompiler, workflow_compiler
+from .workflow_compiler import WorkflowCompiler, workflow_compiler, compiler_cache_stats
 from .execution_plan import ExecutionPlan, ExecutionGroup, ValidationResult
 from .ir_types import IR_Workflow, IR_Step, IR_Expr, Opcode
 
 __all__ = [
     "WorkflowCompiler",
     "workflow_compiler",
+    "compiler_cache_stats",
     "ExecutionPlan",
     "ExecutionGroup",
     "ValidationResult",
@@ -6,10 +6,13 @@ Copied from OrionX with minimal changes.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
 
+from ..utils.compat import DATACLASS_SLOTS
+
 
 # =============================================================================
 # Validation
@@ -22,7 +25,7 @@ class ValidationSeverity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationIssue:
     """A single validation issue."""
     code: str
@@ -32,53 +35,153 @@ class ValidationIssue:
     edges: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Result of workflow validation."""
     valid: bool
     errors: List[ValidationIssue] = field(default_factory=list)
     warnings: List[ValidationIssue] = field(default_factory=list)
     
+    # Maintained by add_error(); seeded from errors passed to the constructor
+    _has_blocking: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._has_blocking = any(e.severity == ValidationSeverity.BLOCKING for e in self.errors)
+    
+    def add_error(self, issue: ValidationIssue) -> None:
+        """Record an error, tracking whether any are blocking."""
+        self._has_blocking |= issue.severity == ValidationSeverity.BLOCKING
+        self.errors.append(issue)
+    
+    def add_warning(self, issue: ValidationIssue) -> None:
+        """Record a warning."""
+        self.warnings.append(issue)
+    
     def has_blocking(self) -> bool:
         """Check if there are blocking errors."""
-        return any(e.severity == ValidationSeverity.BLOCKING for e in self.errors)
+        return self._has_blocking
 
 
 # =============================================================================
 # Execution Plan
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExecutionGroup:
-    """Group of steps that can execute in parallel."""
+    """
+    Group of steps that can execute in parallel.
+    
+    Groups are immutable; ExecutionPlan.finalize() sorts them by uid and
+    interns them so identical plans share group instances.
+    """
     depth: int
-    node_uids: List[str] = field(default_factory=list)
+    node_uids: Tuple[str, ...] = ()
+    
+    # Dense node ids (trigger is 0, then IR node order), parallel to node_uids
+    node_ids: Tuple[int, ...] = ()
+
 
+# Interned groups shared across plans (cleared when it grows past the cap)
+_GROUP_INTERN_SIZE = 4096
+_GROUP_INTERN: Dict[ExecutionGroup, ExecutionGroup] = {}
+
+
+def intern_group(group: ExecutionGroup) -> ExecutionGroup:
+    """Get the shared, uid-sorted instance equal to a group."""
+    pairs = sorted(zip(group.node_uids, group.node_ids)) if group.node_ids else None
+    if pairs is not None:
+        node_uids = tuple(uid for uid, _ in pairs)
+        node_ids = tuple(node_id for _, node_id in pairs)
+    else:
+        node_uids, node_ids = tuple(sorted(group.node_uids)), ()
+    
+    key = ExecutionGroup(depth=group.depth, node_uids=node_uids, node_ids=node_ids)
+    shared = _GROUP_INTERN.get(key)
+    if shared is None:
+        if len(_GROUP_INTERN) >= _GROUP_INTERN_SIZE:
+            _GROUP_INTERN.clear()
+        _GROUP_INTERN[key] = shared = key
+    return shared
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionPlan:
     """
     Compiled execution plan for a workflow.
     
     Contains parallel execution groups and validation results.
+    
+    The compile time is stored as compiled_at_ts and formatted as ISO
+    on first access to compiled_at. Passing an ISO compiled_at string
+    is still accepted; it is kept as given and also sets compiled_at_ts.
     """
     workflow_uid: str
     version: int
     groups: List[ExecutionGroup] = field(default_factory=list)
     variable_bindings: Dict[str, Any] = field(default_factory=dict)
     validation: Optional[ValidationResult] = None
-    compiled_at: str = ""
+    compiled_at: InitVar[Optional[str]] = None  # read back through the property below
     compiler_version: str = "1.0.0"
     
+    # Integrity (content hash of the source IR)
+    checksum: Optional[str] = None
+    
+    compiled_at_ts: float = 0.0  # epoch seconds (UTC)
+    
+    # Derived counts (cached by finalize())
+    _total_steps: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _max_parallelism: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    # ISO form of compiled_at_ts (formatted on first access)
+    _compiled_at: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, compiled_at: Optional[str]) -> None:
+        if compiled_at:
+            self._compiled_at = compiled_at
+            if not self.compiled_at_ts:
+                try:
+                    parsed = datetime.fromisoformat(compiled_at)
+                except ValueError:
+                    return
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                self.compiled_at_ts = parsed.timestamp()
+    
+    def finalize(self) -> "ExecutionPlan":
+        """Intern groups and cache derived counts once groups are final."""
+        self.groups = [intern_group(g) for g in self.groups]
+        self._total_steps = sum(len(g.node_uids) for g in self.groups)
+        self._max_parallelism = max(len(g.node_uids) for g in self.groups) if self.groups else 0
+        return self
+    
     @property
     def total_steps(self) -> int:
         """Get total number of steps."""
-        return sum(len(g.node_uids) for g in self.groups)
+        if self._total_steps is None:
+            return sum(len(g.node_uids) for g in self.groups)
+        return self._total_steps
     
     @property
     def max_parallelism(self) -> int:
         """Get maximum parallel steps."""
-        return max(len(g.node_uids) for g in self.groups) if self.groups else 0
+        if self._max_parallelism is None:
+            return max(len(g.node_uids) for g in self.groups) if self.groups else 0
+        return self._max_parallelism
+
+
+def _compiled_at(plan: ExecutionPlan) -> str:
+    """Get the compile time as a naive-UTC ISO timestamp ("" if unset)."""
+    if plan._compiled_at is None:
+        ts = plan.compiled_at_ts
+        plan._compiled_at = (
+            datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat() if ts else ""
+        )
+    return plan._compiled_at
+
+
+# Installed after class creation: the name is also the InitVar above,
+# whose default the generated __init__ has already captured
+ExecutionPlan.compiled_at = property(_compiled_at)
 
 
 # =============================================================================
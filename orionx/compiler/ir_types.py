@@ -21,10 +21,15 @@ ADDED:
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, Mapping, Awaitable
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
 from datetime import datetime
+from array import array
+from types import MappingProxyType
+
+from .execution_plan import CompilationError
+from ..utils.compat import DATACLASS_SLOTS
 
 
 # =============================================================================
@@ -108,23 +113,56 @@ class IR_Type(IntEnum):
     REFERENCE = 8
 
 
-@dataclass
+# Opcode names indexed by opcode value (index 0 is unused)
+_OPCODE_NAMES: Tuple[str, ...] = ("",) + tuple(op.name for op in Opcode)
+
+
+@dataclass(repr=False, eq=False, frozen=True, **DATACLASS_SLOTS)
 class IR_Instruction:
-    """A single IR instruction."""
+    """A single IR instruction (immutable, compared by identity)."""
     opcode: Opcode
     operand: Any = None
     
     def __repr__(self) -> str:
         if self.operand is not None:
-            return f"{self.opcode.name} {self.operand}"
-        return self.opcode.name
+            return f"{_OPCODE_NAMES[self.opcode]} {self.operand}"
+        return _OPCODE_NAMES[self.opcode]
 
 
 # =============================================================================
 # Compiled Expression
 # =============================================================================
 
-@dataclass
+# Opcodes lowered to Python operators by IR_Expr.to_python_source()
+_BINARY_OPS: Dict[Opcode, str] = {
+    Opcode.ADD: "+",
+    Opcode.SUB: "-",
+    Opcode.MUL: "*",
+    Opcode.DIV: "/",
+    Opcode.MOD: "%",
+    Opcode.EQ: "==",
+    Opcode.NEQ: "!=",
+    Opcode.LT: "<",
+    Opcode.LTE: "<=",
+    Opcode.GT: ">",
+    Opcode.GTE: ">=",
+    Opcode.AND: "and",
+    Opcode.OR: "or",
+}
+
+_UNARY_OPS: Dict[Opcode, str] = {
+    Opcode.NEG: "-",
+    Opcode.NOT: "not ",
+}
+
+# Result types eligible for native compilation
+_NATIVE_RESULT_TYPES = {IR_Type.BOOL, IR_Type.INT, IR_Type.FLOAT}
+
+# Largest workflow that gets single-word dependency bitmasks
+BITSET_MAX_STEPS = 64
+
+
+@dataclass(**DATACLASS_SLOTS)
 class IR_Expr:
     """Compiled expression as IR bytecode."""
     uid: str
@@ -136,11 +174,110 @@ class IR_Expr:
     compiled_at: datetime = field(default_factory=datetime.utcnow)
     constants: List[Any] = field(default_factory=list)
     
+    # Frozen bytecode (parallel arrays, built by freeze())
+    opcodes: Optional[array] = field(default=None, init=False, repr=False, compare=False)
+    operands: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Native evaluator for pure expressions (built by compile_pure())
+    _compiled: Optional[Callable[[], Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def add(self, opcode: Opcode, operand: Any = None) -> "IR_Expr":
         """Add an instruction (fluent interface)."""
         self.instructions.append(IR_Instruction(opcode, operand))
+        self.opcodes = None
+        self.operands = None
+        self._compiled = None
+        return self
+    
+    def freeze(self) -> "IR_Expr":
+        """
+        Materialize instructions as parallel arrays for dispatch.
+        
+        opcodes is a byte array of Opcode values and operands the matching
+        operand tuple. instructions is kept for debugging.
+        """
+        self.opcodes = array("B", [inst.opcode for inst in self.instructions])
+        self.operands = tuple(inst.operand for inst in self.instructions)
         return self
     
+    @property
+    def frozen(self) -> bool:
+        """Check if the parallel arrays are current."""
+        return self.opcodes is not None
+    
+    def to_python_source(self) -> Optional[str]:
+        """
+        Lower the opcode stream to a straight-line Python function.
+        
+        Constants are read from the `_k` operand tuple by instruction index.
+        Returns None if the stream uses an opcode that cannot be lowered
+        (context loads, jumps, calls, object construction).
+        """
+        lines = ["def _evaluate():"]
+        stack: List[str] = []
+        
+        for index, inst in enumerate(self.instructions):
+            opcode = inst.opcode
+            name = f"_v{index}"
+            
+            if opcode == Opcode.PUSH_CONST:
+                lines.append(f"    {name} = _k[{index}]")
+                stack.append(name)
+            elif opcode in _BINARY_OPS:
+                if len(stack) < 2:
+                    return None
+                right = stack.pop()
+                left = stack.pop()
+                lines.append(f"    {name} = {left} {_BINARY_OPS[opcode]} {right}")
+                stack.append(name)
+            elif opcode in _UNARY_OPS:
+                if not stack:
+                    return None
+                lines.append(f"    {name} = {_UNARY_OPS[opcode]}{stack.pop()}")
+                stack.append(name)
+            elif opcode == Opcode.DUP:
+                if not stack:
+                    return None
+                stack.append(stack[-1])
+            elif opcode == Opcode.POP:
+                if not stack:
+                    return None
+                stack.pop()
+            elif opcode == Opcode.NOP:
+                continue
+            elif opcode == Opcode.HALT:
+                break
+            else:
+                return None
+        
+        if len(stack) != 1:
+            return None
+        
+        lines.append(f"    return {stack[0]}")
+        return "\n".join(lines)
+    
+    def compile_pure(self) -> Optional[Callable[[], Any]]:
+        """
+        Compile a pure numeric expression to a native Python callable.
+        
+        The callable is cached on the expression. Returns None for impure
+        or non-numeric expressions, which stay on the interpreter path.
+        """
+        if self._compiled is not None:
+            return self._compiled
+        
+        if not self.pure or self.result_type not in _NATIVE_RESULT_TYPES:
+            return None
+        
+        source = self.to_python_source()
+        if source is None:
+            return None
+        
+        namespace: Dict[str, Any] = {"_k": tuple(inst.operand for inst in self.instructions)}
+        exec(compile(source, f"<ir_expr {self.uid}>", "exec"), namespace)
+        self._compiled = namespace["_evaluate"]
+        return self._compiled
+    
     def __len__(self) -> int:
         return len(self.instructions)
 
@@ -149,7 +286,7 @@ class IR_Expr:
 # Compiled Step
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IR_Step:
     """
     Compiled workflow step.
@@ -179,13 +316,43 @@ class IR_Step:
     
     # Timeout (ms)
     timeout_ms: int = 30000
+    
+    # Resolved expression references (set by resolve_refs())
+    _condition: Optional[IR_Expr] = field(default=None, init=False, repr=False, compare=False)
+    _dynamic_exprs: Dict[str, IR_Expr] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.resolve_refs(self.expressions)
+    
+    def resolve_refs(self, expressions: Mapping[str, IR_Expr]) -> None:
+        """
+        Point condition_expr and dynamic_params at their IR_Expr objects.
+        
+        References already resolved are kept; unknown UIDs are left for a
+        later call with a wider expression table.
+        """
+        if self.condition_expr and self._condition is None:
+            self._condition = expressions.get(self.condition_expr)
+        for param, expr_uid in self.dynamic_params.items():
+            if param not in self._dynamic_exprs and expr_uid in expressions:
+                self._dynamic_exprs[param] = expressions[expr_uid]
+    
+    @property
+    def condition(self) -> Optional[IR_Expr]:
+        """Get the resolved condition expression."""
+        return self._condition
+    
+    @property
+    def dynamic_exprs(self) -> Dict[str, IR_Expr]:
+        """Get resolved dynamic param expressions by param name."""
+        return self._dynamic_exprs
 
 
 # =============================================================================
 # Compiled Workflow
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IR_Workflow:
     """
     Compiled workflow - the final artifact for execution.
@@ -218,9 +385,170 @@ class IR_Workflow:
     # Integrity
     checksum: Optional[str] = None
     
+    # Index-based layout (built by freeze())
+    step_ids: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    steps_by_id: List[IR_Step] = field(default_factory=list, init=False, repr=False, compare=False)
+    execution_order_ids: array = field(default_factory=lambda: array("i"), init=False, repr=False, compare=False)
+    dep_indptr: array = field(default_factory=lambda: array("i"), init=False, repr=False, compare=False)
+    dep_indices: array = field(default_factory=lambda: array("i"), init=False, repr=False, compare=False)
+    
+    # Dependency bitmasks (bit j of dep_masks[i]: step i depends on step j).
+    # Only built for workflows of up to BITSET_MAX_STEPS steps.
+    dep_masks: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    
+    # Read-only stats snapshot (built by freeze())
+    _stats: Optional[MappingProxyType] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Straight-line runner for static workflows (built by specialize())
+    _specialized: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def freeze(self) -> "IR_Workflow":
+        """
+        Build the dense index layout used for dispatch.
+        
+        Each step gets an int id in `steps` order. Dependencies are stored
+        in CSR form: the deps of step i are
+        dep_indices[dep_indptr[i]:dep_indptr[i + 1]].
+        """
+        self.step_ids = {uid: i for i, uid in enumerate(self.steps)}
+        self.steps_by_id = list(self.steps.values())
+        self.execution_order_ids = array("i", [self.step_ids[uid] for uid in self.execution_order])
+        
+        indptr = array("i", [0])
+        indices = array("i")
+        for uid in self.steps:
+            deps = self.dependency_graph.get(uid, ())
+            indices.extend(sorted(self.step_ids[d] for d in deps if d in self.step_ids))
+            indptr.append(len(indices))
+        self.dep_indptr = indptr
+        self.dep_indices = indices
+        
+        self.dep_masks = []
+        if len(self.steps_by_id) <= BITSET_MAX_STEPS:
+            for step_id in range(len(self.steps_by_id)):
+                mask = 0
+                for dep_id in self.dependencies_of(step_id):
+                    mask |= 1 << dep_id
+                self.dep_masks.append(mask)
+        
+        for expr in self.expressions.values():
+            expr.freeze()
+        for step in self.steps_by_id:
+            for expr in step.expressions.values():
+                expr.freeze()
+        
+        self.resolve_refs()
+        self._stats = MappingProxyType(self._build_stats())
+        return self
+    
+    def resolve_refs(self) -> "IR_Workflow":
+        """
+        Resolve step expression UIDs to IR_Expr objects.
+        
+        Step-local expressions are resolved at construction; this fills in
+        references to workflow-level expressions. Raises CompilationError
+        for references that exist in neither table.
+        """
+        for step in self.steps.values():
+            step.resolve_refs(self.expressions)
+            
+            missing = [
+                expr_uid for param, expr_uid in step.dynamic_params.items()
+                if param not in step._dynamic_exprs
+            ]
+            if step.condition_expr and step._condition is None:
+                missing.append(step.condition_expr)
+            if missing:
+                raise CompilationError(
+                    code="E_MISSING_REF",
+                    message=f"Step {step.uid} references unknown expressions: {', '.join(missing)}",
+                    nodes=[step.uid],
+                )
+        return self
+    
+    def dependencies_of(self, step_id: int) -> array:
+        """Get dependency step ids for a step id (requires freeze())."""
+        return self.dep_indices[self.dep_indptr[step_id]:self.dep_indptr[step_id + 1]]
+    
+    def ready_ids(self, completed_mask: int) -> List[int]:
+        """
+        Get ids of steps whose dependencies are all completed (requires freeze()).
+        
+        completed_mask has bit i set when step i has completed; completed
+        steps are not returned.
+        """
+        if self.dep_masks:
+            return [
+                step_id for step_id, mask in enumerate(self.dep_masks)
+                if not (mask & ~completed_mask) and not (completed_mask >> step_id) & 1
+            ]
+        
+        return [
+            step_id for step_id in range(len(self.steps_by_id))
+            if not (completed_mask >> step_id) & 1
+            and all((completed_mask >> dep_id) & 1 for dep_id in self.dependencies_of(step_id))
+        ]
+    
+    def to_python_source(self) -> Optional[str]:
+        """
+        Generate an async runner that calls each step handler inline.
+        
+        Handlers are looked up once per step type; static params are read
+        from the `_params` tuple by position in execution order. Returns
+        None if any step needs runtime evaluation (conditions or dynamic
+        params) and must stay on the executor's dispatch loop.
+        """
+        order = self.execution_order or list(self.steps)
+        lines = ["async def _run(ctx, handlers):"]
+        handler_names: Dict[str, str] = {}
+        
+        for step_type in dict.fromkeys(self.steps[uid].type for uid in order):
+            name = f"_h{len(handler_names)}"
+            handler_names[step_type] = name
+            lines.append(f"    {name} = handlers[{step_type!r}]")
+        
+        lines.append("    results = {}")
+        for index, uid in enumerate(order):
+            step = self.steps[uid]
+            if step.condition_expr or step.dynamic_params:
+                return None
+            lines.append(f"    results[{uid!r}] = await {handler_names[step.type]}(ctx, _params[{index}])")
+        
+        lines.append("    return results")
+        return "\n".join(lines)
+    
+    def specialize(self) -> Optional[Callable[..., Awaitable[Dict[str, Any]]]]:
+        """
+        Compile the workflow to a specialized async runner.
+        
+        The runner is called as `await runner(ctx, handlers)`, where
+        handlers maps step type to `async (ctx, params) -> result`, and
+        returns results keyed by step uid. It is cached on the workflow.
+        Returns None for workflows that need runtime evaluation.
+        """
+        if self._specialized is not None:
+            return self._specialized
+        
+        source = self.to_python_source()
+        if source is None:
+            return None
+        
+        order = self.execution_order or list(self.steps)
+        namespace: Dict[str, Any] = {"_params": tuple(self.steps[uid].static_params for uid in order)}
+        exec(compile(source, f"<workflow {self.uid}>", "exec"), namespace)
+        self._specialized = namespace["_run"]
+        return self._specialized
+    
     @property
-    def stats(self) -> Dict[str, int]:
+    def stats(self) -> Mapping[str, int]:
         """Get compilation statistics."""
+        if self._stats is None:
+            return self._build_stats()
+        return self._stats
+    
+    def _build_stats(self) -> Dict[str, int]:
         return {
             "steps": len(self.steps),
             "expressions": len(self.expressions),
@@ -7,9 +7,12 @@ Addresses audit finding: "Hardcoded ExecutionBudget limits"
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from enum import Enum
 
+from .utils.compat import DATACLASS_SLOTS
+
 
 class PersistenceBackend(str, Enum):
     """Supported persistence backends."""
@@ -18,7 +21,7 @@ class PersistenceBackend(str, Enum):
     REDIS = "redis"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionLimits:
     """Configurable execution limits (was hardcoded in ExecutionBudget)."""
     max_db_queries: int = 100
@@ -27,9 +30,11 @@ class ExecutionLimits:
     max_steps: int = 100
     workflow_timeout_seconds: float = 300.0
     step_timeout_seconds: float = 30.0
+    log_step_inputs: bool = True  # record evaluated params on each StepResult
+    max_input_bytes: int = 0  # per-param cap on recorded inputs (0 = no cap)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PersistenceConfig:
     """Persistence layer configuration."""
     backend: PersistenceBackend = PersistenceBackend.SQLITE
@@ -37,15 +42,18 @@ class PersistenceConfig:
     redis_url: Optional[str] = None
     redis_prefix: str = "orionx:"
     redis_ttl_seconds: int = 86400 * 7  # 7 days
+    redis_cache_reads: bool = False  # only for single-writer deployments
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrionXConfig:
     """Main configuration container."""
     limits: ExecutionLimits
     persistence: PersistenceConfig
     debug: bool = False
     log_level: str = "INFO"
+    worker_threads: int = min(32, (os.cpu_count() or 1) + 4)
+    cpu_workers: int = os.cpu_count() or 1
 
 
 def load_config() -> OrionXConfig:
@@ -59,11 +67,18 @@ def load_config() -> OrionXConfig:
         ORIONX_MAX_STEPS: Max steps per workflow (default: 100)
         ORIONX_WORKFLOW_TIMEOUT: Workflow timeout in seconds (default: 300)
         ORIONX_STEP_TIMEOUT: Step timeout in seconds (default: 30)
+        ORIONX_LOG_STEP_INPUTS: Record step inputs in execution logs (default: true)
+        ORIONX_MAX_INPUT_BYTES: Summarize recorded inputs larger than this (default: 0, no cap)
         ORIONX_PERSISTENCE_BACKEND: Persistence backend (memory|sqlite|redis)
         ORIONX_SQLITE_PATH: SQLite database path (default: ./orionx_executions.db)
         ORIONX_REDIS_URL: Redis URL (e.g., redis://localhost:6379/0)
+        ORIONX_REDIS_CACHE_READS: Cache execution statuses locally (default: false)
         ORIONX_DEBUG: Enable debug mode (default: false)
         ORIONX_LOG_LEVEL: Log level (default: INFO)
+        ORIONX_WORKER_THREADS: Threads for sync handlers and blocking I/O
+            (default: min(32, cpu_count + 4))
+        ORIONX_CPU_WORKERS: Processes for CPU-bound work such as custom rule
+            evaluation (default: cpu_count)
     """
     limits = ExecutionLimits(
         max_db_queries=int(os.getenv("ORIONX_MAX_DB_QUERIES", "100")),
@@ -72,6 +87,8 @@ def load_config() -> OrionXConfig:
         max_steps=int(os.getenv("ORIONX_MAX_STEPS", "100")),
         workflow_timeout_seconds=float(os.getenv("ORIONX_WORKFLOW_TIMEOUT", "300")),
         step_timeout_seconds=float(os.getenv("ORIONX_STEP_TIMEOUT", "30")),
+        log_step_inputs=os.getenv("ORIONX_LOG_STEP_INPUTS", "true").lower() in ("true", "1", "yes"),
+        max_input_bytes=int(os.getenv("ORIONX_MAX_INPUT_BYTES", "0")),
     )
     
     backend_str = os.getenv("ORIONX_PERSISTENCE_BACKEND", "sqlite").lower()
@@ -86,6 +103,7 @@ def load_config() -> OrionXConfig:
         redis_url=os.getenv("ORIONX_REDIS_URL"),
         redis_prefix=os.getenv("ORIONX_REDIS_PREFIX", "orionx:"),
         redis_ttl_seconds=int(os.getenv("ORIONX_REDIS_TTL", str(86400 * 7))),
+        redis_cache_reads=os.getenv("ORIONX_REDIS_CACHE_READS", "false").lower() in ("true", "1", "yes"),
     )
     
     return OrionXConfig(
@@ -93,22 +111,27 @@ def load_config() -> OrionXConfig:
         persistence=persistence,
         debug=os.getenv("ORIONX_DEBUG", "false").lower() in ("true", "1", "yes"),
         log_level=os.getenv("ORIONX_LOG_LEVEL", "INFO").upper(),
+        worker_threads=max(1, int(os.getenv(
+            "ORIONX_WORKER_THREADS", str(min(32, (os.cpu_count() or 1) + 4))
+        ))),
+        cpu_workers=max(1, int(os.getenv("ORIONX_CPU_WORKERS", str(os.cpu_count() or 1)))),
     )
 
 
-# Singleton config instance
-_config: Optional[OrionXConfig] = None
+@lru_cache(maxsize=None)
+def get_config() -> OrionXConfig:
+    """Get the global configuration (loaded once, then served from cache)."""
+    return load_config()
 
 
-def get_config() -> OrionXConfig:
-    """Get the global configuration (lazy-loaded singleton)."""
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+@lru_cache(maxsize=1)
+def get_budget_limits() -> Tuple[int, int, int, int]:
+    """Per-execution budget limits: (db_queries, api_calls, emails, steps)."""
+    limits = get_config().limits
+    return (limits.max_db_queries, limits.max_api_calls, limits.max_emails, limits.max_steps)
 
 
 def reset_config() -> None:
     """Reset configuration (useful for testing)."""
-    global _config
-    _config = None
+    get_config.cache_clear()
+    get_budget_limits.cache_clear()
@@ -24,14 +24,20 @@ KEPT (Server-side):
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional, Callable, Awaitable
+from typing import Dict, Any, Optional, Callable, Awaitable, List, Tuple, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 import aiohttp
 import asyncio
 
+from ..compiler.execution_plan import ExecutionGroup
 from ..schemas.execution import ExecutionContext
 from ..schemas.workflow import StepType
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.http import create_http_session
+from ..utils.serialization import dumps_bytes, loads
 
 
 logger = logging.getLogger(__name__)
@@ -41,7 +47,7 @@ logger = logging.getLogger(__name__)
 # Step Result
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StepResult:
     """Result of a step execution."""
     success: bool
@@ -54,11 +60,52 @@ class StepResult:
             "data": self.data,
             "error": self.error,
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes without building an intermediate dict (with orjson)."""
+        return dumps_bytes(self)
 
 
 StepHandler = Callable[[Dict[str, Any], ExecutionContext], Awaitable[StepResult]]
 
 
+# Param specs: (names, defaults). Defaults are shared, so mappings are read-only.
+ParamSpec = Tuple[Tuple[str, ...], Tuple[Any, ...]]
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+_QUERY_ENTITY_PARAMS: ParamSpec = (("entity_type", "filters", "limit", "offset"), (None, _EMPTY, 100, 0))
+_SEND_EMAIL_PARAMS: ParamSpec = (("to", "subject", "body"), (None, "", ""))
+_API_CALL_PARAMS: ParamSpec = (("url", "method", "headers", "body", "timeout"), (None, "GET", _EMPTY, None, 30))
+_LOG_PARAMS: ParamSpec = (("message", "level", "data"), ("", "info", None))
+
+
+def _unpack(params: Dict[str, Any], spec: ParamSpec) -> Tuple[Any, ...]:
+    """Read several params with defaults in one pass."""
+    names, defaults = spec
+    return tuple(map(params.get, names, defaults))
+
+
+@lru_cache(maxsize=32)
+def _client_timeout(total: float) -> aiohttp.ClientTimeout:
+    """Get a shared ClientTimeout for a total timeout (ClientTimeout is immutable)."""
+    return aiohttp.ClientTimeout(total=total)
+
+
+def _decode_body(raw: bytes, content_type: str) -> Any:
+    """Decode a response body read once: JSON when declared (and valid), else text."""
+    if "json" in content_type:
+        try:
+            return loads(raw)
+        except ValueError:
+            pass
+    return raw.decode("utf-8", errors="replace")
+
+
+async def _unknown_step(step_type: Any) -> StepResult:
+    return StepResult(success=False, error=f"Unknown step type: {step_type}")
+
+
 # =============================================================================
 # Step Handlers
 # =============================================================================
@@ -81,11 +128,27 @@ class StepHandlers:
         self._email = email_service
         self._http = http_client
         self._owns_http = http_client is None
+        
+        # Dispatch table, built once per instance
+        self._handlers: Mapping[StepType, StepHandler] = MappingProxyType({
+            StepType.CREATE_ENTITY: self.create_entity,
+            StepType.UPDATE_ENTITY: self.update_entity,
+            StepType.DELETE_ENTITY: self.delete_entity,
+            StepType.QUERY_ENTITY: self.query_entity,
+            StepType.SEND_EMAIL: self.send_email,
+            StepType.API_CALL: self.api_call,
+            StepType.SCHEDULE_WORKFLOW: self.schedule_workflow,
+            StepType.CALL_WORKFLOW: self.call_workflow,
+            StepType.TRANSFORM_DATA: self.transform_data,
+            StepType.VALIDATE_DATA: self.validate_data,
+            StepType.LOG: self.log,
+        })
     
     async def _get_http(self) -> aiohttp.ClientSession:
-        """Get or create HTTP client."""
-        if self._http is None:
-            self._http = aiohttp.ClientSession()
+        """Get or create the pooled HTTP client (reused across api_call steps)."""
+        if self._http is None or self._http.closed:
+            self._http = create_http_session()
+            self._owns_http = True
         return self._http
     
     async def close(self) -> None:
@@ -118,7 +181,7 @@ class StepHandlers:
         
         try:
             # Would use actual DB here
-            logger.info(f"Created {entity_type}: {data}")
+            logger.info("Created %s: %s", entity_type, data)
             return StepResult(
                 success=True,
                 data={"uid": f"{entity_type.lower()}_created", **data}
@@ -145,7 +208,7 @@ class StepHandlers:
             return StepResult(success=False, error="Missing entity_uid")
         
         try:
-            logger.info(f"Updated {entity_uid}: {data}")
+            logger.info("Updated %s: %s", entity_uid, data)
             return StepResult(success=True, data={"uid": entity_uid, **data})
         except Exception as e:
             return StepResult(success=False, error=str(e))
@@ -167,7 +230,7 @@ class StepHandlers:
             return StepResult(success=False, error="Missing entity_uid")
         
         try:
-            logger.info(f"Deleted {entity_uid}")
+            logger.info("Deleted %s", entity_uid)
             return StepResult(success=True, data={"deleted": entity_uid})
         except Exception as e:
             return StepResult(success=False, error=str(e))
@@ -186,17 +249,14 @@ class StepHandlers:
             limit: Max results
             offset: Pagination offset
         """
-        entity_type = params.get("entity_type")
-        filters = params.get("filters", {})
-        limit = params.get("limit", 100)
-        offset = params.get("offset", 0)
+        entity_type, filters, limit, offset = _unpack(params, _QUERY_ENTITY_PARAMS)
         
         if not entity_type:
             return StepResult(success=False, error="Missing entity_type")
         
         try:
             # Would use actual DB here
-            logger.info(f"Query {entity_type}: filters={filters}, limit={limit}")
+            logger.info("Query %s: filters=%s, limit=%s", entity_type, filters, limit)
             return StepResult(
                 success=True,
                 data={"results": [], "total": 0}
@@ -222,16 +282,14 @@ class StepHandlers:
             body: Email body (HTML or text)
             from_name: Sender name
         """
-        to = params.get("to")
-        subject = params.get("subject", "")
-        body = params.get("body", "")
+        to, subject, body = _unpack(params, _SEND_EMAIL_PARAMS)
         
         if not to:
             return StepResult(success=False, error="Missing recipient")
         
         try:
             # Would use email service here
-            logger.info(f"Email sent to {to}: {subject}")
+            logger.info("Email sent to %s: %s", to, subject)
             return StepResult(
                 success=True,
                 data={"sent_to": to, "subject": subject}
@@ -254,11 +312,8 @@ class StepHandlers:
             body: Request body (for POST/PUT)
             timeout: Request timeout in seconds
         """
-        url = params.get("url")
-        method = params.get("method", "GET").upper()
-        headers = params.get("headers", {})
-        body = params.get("body")
-        timeout = params.get("timeout", 30)
+        url, method, headers, body, timeout = _unpack(params, _API_CALL_PARAMS)
+        method = method.upper()
         
         if not url:
             return StepResult(success=False, error="Missing URL")
@@ -270,12 +325,10 @@ class StepHandlers:
                 url,
                 headers=headers,
                 json=body if method in ["POST", "PUT", "PATCH"] else None,
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                timeout=_client_timeout(timeout),
             ) as response:
-                try:
-                    data = await response.json()
-                except:
-                    data = await response.text()
+                raw = await response.read()
+                data = _decode_body(raw, response.headers.get("Content-Type", ""))
                 
                 return StepResult(
                     success=response.status < 400,
@@ -315,7 +368,7 @@ class StepHandlers:
         
         try:
             # Would use scheduler here
-            logger.info(f"Scheduled {workflow_uid} in {delay_seconds}s")
+            logger.info("Scheduled %s in %ss", workflow_uid, delay_seconds)
             return StepResult(
                 success=True,
                 data={"scheduled": workflow_uid, "delay": delay_seconds}
@@ -343,7 +396,7 @@ class StepHandlers:
         
         try:
             # Would load and execute workflow here
-            logger.info(f"Called {workflow_uid} with {input_params}")
+            logger.info("Called %s with %s", workflow_uid, input_params)
             return StepResult(
                 success=True,
                 data={"called": workflow_uid}
@@ -432,9 +485,7 @@ class StepHandlers:
             level: Log level (debug, info, warning, error)
             data: Additional data to log
         """
-        message = params.get("message", "")
-        level = params.get("level", "info")
-        data = params.get("data")
+        message, level, data = _unpack(params, _LOG_PARAMS)
         
         log_fn = {
             "debug": logger.debug,
@@ -450,18 +501,38 @@ class StepHandlers:
     # Handler Registry
     # =========================================================================
     
-    def get_handlers(self) -> Dict[StepType, StepHandler]:
-        """Get all step handlers."""
-        return {
-            StepType.CREATE_ENTITY: self.create_entity,
-            StepType.UPDATE_ENTITY: self.update_entity,
-            StepType.DELETE_ENTITY: self.delete_entity,
-            StepType.QUERY_ENTITY: self.query_entity,
-            StepType.SEND_EMAIL: self.send_email,
-            StepType.API_CALL: self.api_call,
-            StepType.SCHEDULE_WORKFLOW: self.schedule_workflow,
-            StepType.CALL_WORKFLOW: self.call_workflow,
-            StepType.TRANSFORM_DATA: self.transform_data,
-            StepType.VALIDATE_DATA: self.validate_data,
-            StepType.LOG: self.log,
-        }
+    async def execute_group(
+        self,
+        group: ExecutionGroup,
+        steps: Dict[str, Tuple[StepType, Dict[str, Any]]],
+        context: ExecutionContext,
+    ) -> List[StepResult]:
+        """
+        Run every step in a compiled group concurrently.
+        
+        steps maps node uid to (step type, evaluated params); group nodes
+        without an entry (such as the trigger) are skipped. Results follow
+        group order. Exceptions are reported as failed results.
+        """
+        handlers = self._handlers
+        calls = []
+        for uid in group.node_uids:
+            spec = steps.get(uid)
+            if spec is None:
+                continue
+            step_type, params = spec
+            handler = handlers.get(step_type)
+            if handler is None:
+                calls.append(_unknown_step(step_type))
+            else:
+                calls.append(handler(params, context))
+        
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        return [
+            StepResult(success=False, error=str(outcome)) if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
+    
+    def get_handlers(self) -> Mapping[StepType, StepHandler]:
+        """Get all step handlers (read-only view of the shared table)."""
+        return self._handlers
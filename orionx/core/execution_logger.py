@@ -7,11 +7,20 @@ Copied from OrionX with minimal UI-related changes.
 
 from __future__ import annotations
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
+import asyncio
 import logging
+import sys
+from time import perf_counter_ns
 
 from ..schemas.execution import ExecutionStatus, StepResult
+from ..utils.batching import drain_batches
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.ids import next_id
+from ..utils.serialization import dumps_bytes, loads
 
 
 logger = logging.getLogger(__name__)
@@ -21,7 +30,7 @@ logger = logging.getLogger(__name__)
 # Step Log (replaces ActionLog)
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StepLog:
     """Log entry for a single step execution."""
     step_uid: str
@@ -36,7 +45,7 @@ class StepLog:
     skip_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionLog:
     """Complete log for a workflow execution."""
     execution_id: str
@@ -50,11 +59,44 @@ class ExecutionLog:
     input_snapshot: Optional[Dict] = None
 
 
+def encode_log(log: ExecutionLog) -> bytes:
+    """Serialize an execution log to JSON bytes (directly from the dataclass with orjson)."""
+    return dumps_bytes(log)
+
+
+def decode_log(data: bytes) -> ExecutionLog:
+    """Deserialize an execution log produced by encode_log()."""
+    raw = loads(data)
+    return ExecutionLog(
+        execution_id=raw["execution_id"],
+        workflow_uid=raw["workflow_uid"],
+        user_uid=raw["user_uid"],
+        started_at=datetime.fromisoformat(raw["started_at"]),
+        completed_at=_parse_datetime(raw["completed_at"]),
+        status=ExecutionStatus(raw["status"]),
+        step_logs=[
+            StepLog(**{
+                **step,
+                "step_type": sys.intern(step["step_type"]),
+                "started_at": datetime.fromisoformat(step["started_at"]),
+                "completed_at": _parse_datetime(step["completed_at"]),
+            })
+            for step in raw["step_logs"]
+        ],
+        error=raw["error"],
+        input_snapshot=raw["input_snapshot"],
+    )
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
 # =============================================================================
 # Expression Trace
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExpressionStep:
     """Single step in expression evaluation."""
     step_number: int
@@ -65,7 +107,7 @@ class ExpressionStep:
     duration_us: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExpressionTrace:
     """Full trace of expression evaluation."""
     expression_raw: str
@@ -77,18 +119,23 @@ class ExpressionTrace:
     error: Optional[str] = None
 
 
+# Finished traces kept per tracer (oldest evicted first)
+MAX_TRACES = 256
+
+
 class ExpressionTracer:
     """Traces expression evaluation for debugging."""
     
-    def __init__(self):
-        self._traces: Dict[str, ExpressionTrace] = {}
+    def __init__(self, max_traces: int = MAX_TRACES):
+        # Finished traces by expression UID, bounded LRU
+        self._traces: OrderedDict[str, ExpressionTrace] = OrderedDict()
+        self._max_traces = max_traces
         self._current: Optional[ExpressionTrace] = None
-        self._start_time: Optional[float] = None
+        self._start_time: Optional[int] = None  # perf_counter_ns()
     
     def start(self, expr_raw: str, expr_uid: Optional[str] = None):
         """Start tracing an expression."""
-        import time
-        self._start_time = time.perf_counter()
+        self._start_time = perf_counter_ns()
         self._current = ExpressionTrace(
             expression_raw=expr_raw,
             expression_uid=expr_uid,
@@ -106,12 +153,11 @@ class ExpressionTracer:
         if not self._current:
             return
         
-        import time
-        elapsed_us = int((time.perf_counter() - self._start_time) * 1_000_000)
+        elapsed_us = (perf_counter_ns() - self._start_time) // 1000
         
         self._current.steps.append(ExpressionStep(
             step_number=step_num,
-            node_type=node_type,
+            node_type=sys.intern(node_type),
             input_repr=input_repr,
             output_value=output,
             output_repr=output_repr,
@@ -123,8 +169,7 @@ class ExpressionTracer:
         if not self._current:
             return ExpressionTrace(expression_raw="", steps=[])
         
-        import time
-        self._current.total_duration_ms = (time.perf_counter() - self._start_time) * 1000
+        self._current.total_duration_ms = (perf_counter_ns() - self._start_time) / 1_000_000
         self._current.final_result = result
         self._current.final_type = type(result).__name__
         
@@ -132,6 +177,7 @@ class ExpressionTracer:
         self._current = None
         self._start_time = None
         
+        self._remember(trace)
         return trace
     
     def error(self, message: str) -> ExpressionTrace:
@@ -143,7 +189,24 @@ class ExpressionTracer:
         trace = self._current
         self._current = None
         
+        self._remember(trace)
+        return trace
+    
+    def get_trace(self, expr_uid: str) -> Optional[ExpressionTrace]:
+        """Get the most recent finished trace for an expression UID."""
+        trace = self._traces.get(expr_uid)
+        if trace is not None:
+            self._traces.move_to_end(expr_uid)
         return trace
+    
+    def _remember(self, trace: ExpressionTrace) -> None:
+        """Keep a finished trace, evicting the least recently used past the bound."""
+        if trace.expression_uid is None:
+            return
+        self._traces[trace.expression_uid] = trace
+        self._traces.move_to_end(trace.expression_uid)
+        if len(self._traces) > self._max_traces:
+            self._traces.popitem(last=False)
 
 
 # =============================================================================
@@ -164,7 +227,7 @@ class DebugSession:
     """Debugging session state."""
     session_id: str
     workflow_uid: str
-    breakpoints: List[DebugBreakpoint] = field(default_factory=list)
+    breakpoints: Dict[str, DebugBreakpoint] = field(default_factory=dict)  # by step_uid
     paused_at: Optional[str] = None
     step_mode: bool = False
     variable_watches: List[str] = field(default_factory=list)
@@ -182,16 +245,15 @@ class WorkflowDebugger:
         breakpoints: Optional[List[str]] = None,
     ) -> str:
         """Create a new debug session."""
-        import uuid
-        session_id = f"debug_{uuid.uuid4().hex[:8]}"
+        session_id = next_id("debug")
         
         session = DebugSession(
             session_id=session_id,
             workflow_uid=workflow_uid,
-            breakpoints=[
-                DebugBreakpoint(step_uid=uid)
+            breakpoints={
+                uid: DebugBreakpoint(step_uid=uid)
                 for uid in (breakpoints or [])
-            ],
+            },
         )
         
         self._sessions[session_id] = session
@@ -201,19 +263,16 @@ class WorkflowDebugger:
         """Add a breakpoint."""
         session = self._sessions.get(session_id)
         if session:
-            session.breakpoints.append(DebugBreakpoint(
+            session.breakpoints[step_uid] = DebugBreakpoint(
                 step_uid=step_uid,
                 condition=condition,
-            ))
+            )
     
     def remove_breakpoint(self, session_id: str, step_uid: str):
         """Remove a breakpoint."""
         session = self._sessions.get(session_id)
         if session:
-            session.breakpoints = [
-                bp for bp in session.breakpoints
-                if bp.step_uid != step_uid
-            ]
+            session.breakpoints.pop(step_uid, None)
     
     def check_breakpoint(
         self,
@@ -230,11 +289,11 @@ class WorkflowDebugger:
             session.paused_at = step_uid
             return True
         
-        for bp in session.breakpoints:
-            if bp.step_uid == step_uid and bp.enabled:
-                bp.hit_count += 1
-                session.paused_at = step_uid
-                return True
+        bp = session.breakpoints.get(step_uid)
+        if bp is not None and bp.enabled:
+            bp.hit_count += 1
+            session.paused_at = step_uid
+            return True
         
         return False
     
@@ -268,6 +327,11 @@ class ExecutionLogStorage:
         """Save an execution log."""
         raise NotImplementedError
     
+    async def save_logs(self, logs: List[ExecutionLog]) -> None:
+        """Save several execution logs (override for a single bulk write)."""
+        for log in logs:
+            await self.save_log(log)
+    
     async def get_log(self, execution_id: str) -> Optional[ExecutionLog]:
         """Get an execution log by ID."""
         raise NotImplementedError
@@ -290,14 +354,41 @@ class ExecutionLogStorage:
 
 
 class InMemoryLogStorage(ExecutionLogStorage):
-    """In-memory implementation for testing."""
+    """
+    In-memory implementation for testing.
+    
+    Keeps per-workflow and per-user id indexes (in insertion order) so
+    listing is O(limit) rather than a scan of every log. Each index is a
+    dict used as an ordered set, so re-indexing a log is O(1) too.
+    """
     
     def __init__(self):
         self._logs: Dict[str, ExecutionLog] = {}
+        self._by_workflow: Dict[str, Dict[str, None]] = {}
+        self._by_user: Dict[str, Dict[str, None]] = {}
     
     async def save_log(self, log: ExecutionLog) -> None:
+        self._index(log)
         self._logs[log.execution_id] = log
     
+    async def save_logs(self, logs: List[ExecutionLog]) -> None:
+        for log in logs:
+            self._index(log)
+        self._logs.update((log.execution_id, log) for log in logs)
+    
+    def _index(self, log: ExecutionLog) -> None:
+        previous = self._logs.get(log.execution_id)
+        if previous is not None:
+            if previous.workflow_uid == log.workflow_uid and previous.user_uid == log.user_uid:
+                return
+            self._unindex(previous)
+        self._by_workflow.setdefault(log.workflow_uid, {})[log.execution_id] = None
+        self._by_user.setdefault(log.user_uid, {})[log.execution_id] = None
+    
+    def _unindex(self, log: ExecutionLog) -> None:
+        del self._by_workflow[log.workflow_uid][log.execution_id]
+        del self._by_user[log.user_uid][log.execution_id]
+    
     async def get_log(self, execution_id: str) -> Optional[ExecutionLog]:
         return self._logs.get(execution_id)
     
@@ -306,17 +397,128 @@ class InMemoryLogStorage(ExecutionLogStorage):
         workflow_uid: str,
         limit: int = 100,
     ) -> List[ExecutionLog]:
-        return [
-            log for log in self._logs.values()
-            if log.workflow_uid == workflow_uid
-        ][:limit]
+        ids = self._by_workflow.get(workflow_uid, ())
+        return [self._logs[execution_id] for execution_id in islice(ids, limit)]
     
     async def get_logs_for_user(
         self,
         user_uid: str,
         limit: int = 100,
     ) -> List[ExecutionLog]:
-        return [
-            log for log in self._logs.values()
-            if log.user_uid == user_uid
-        ][:limit]
+        ids = self._by_user.get(user_uid, ())
+        return [self._logs[execution_id] for execution_id in islice(ids, limit)]
+
+
+class BatchedLogStorage(ExecutionLogStorage):
+    """
+    Write-behind wrapper that batches saves into bulk backend writes.
+    
+    save_log() only queues the log; a background task flushes queued
+    logs with one save_logs() call when max_batch_size is reached or
+    flush_interval_ms passes. Reads see queued logs immediately.
+    
+    A batch the backend fails to write is kept and retried with the
+    next flush; logs leave the pending map only once persisted.
+    
+    Usage:
+        storage = BatchedLogStorage(InMemoryLogStorage())
+        await storage.start()
+        await storage.save_log(log)
+        await storage.stop()  # flushes pending logs
+    """
+    
+    def __init__(
+        self,
+        backend: ExecutionLogStorage,
+        max_batch_size: int = 100,
+        flush_interval_ms: int = 100,
+    ):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self._pending: Dict[str, ExecutionLog] = {}
+        self._failed: Dict[str, ExecutionLog] = {}  # unwritten logs, retried next flush
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Flush pending logs and stop the background task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
+    
+    async def save_log(self, log: ExecutionLog) -> None:
+        if self._queue is None:
+            await self.backend.save_log(log)
+            return
+        self._pending[log.execution_id] = log
+        self._queue.put_nowait(log)
+    
+    async def flush(self) -> None:
+        """Write every queued log to the backend now."""
+        if self._queue is None:
+            return
+        batch = []
+        while not self._queue.empty():
+            log = self._queue.get_nowait()
+            if log is None:
+                # Keep the stop sentinel for the background task
+                self._queue.put_nowait(None)
+                break
+            batch.append(log)
+        await self._write(batch)
+    
+    async def get_log(self, execution_id: str) -> Optional[ExecutionLog]:
+        pending = self._pending.get(execution_id)
+        if pending is not None:
+            return pending
+        return await self.backend.get_log(execution_id)
+    
+    async def get_logs_for_workflow(
+        self,
+        workflow_uid: str,
+        limit: int = 100,
+    ) -> List[ExecutionLog]:
+        await self.flush()
+        return await self.backend.get_logs_for_workflow(workflow_uid, limit)
+    
+    async def get_logs_for_user(
+        self,
+        user_uid: str,
+        limit: int = 100,
+    ) -> List[ExecutionLog]:
+        await self.flush()
+        return await self.backend.get_logs_for_user(user_uid, limit)
+    
+    async def _run(self) -> None:
+        """Drain the queue in batches until stopped."""
+        await drain_batches(self._queue, self.max_batch_size, self.flush_interval, self._write)
+    
+    async def _write(self, batch: List[ExecutionLog]) -> None:
+        if self._failed:
+            for log in batch:
+                self._failed[log.execution_id] = log
+            batch = list(self._failed.values())
+            self._failed = {}
+        if not batch:
+            return
+        try:
+            await self.backend.save_logs(batch)
+        except Exception as e:
+            logger.error("Failed to persist %s execution logs, will retry: %s", len(batch), e)
+            for log in batch:
+                self._failed[log.execution_id] = log
+            return
+        for log in batch:
+            if self._pending.get(log.execution_id) is log:
+                del self._pending[log.execution_id]
@@ -17,19 +17,25 @@ Audit Remediation:
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Set, Callable, Awaitable
+from array import array
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, Mapping
 from dataclasses import dataclass, field
 from collections import deque
-from datetime import datetime
+from datetime import datetime, timedelta
 import asyncio
+import copy
 import logging
-import uuid
+import time
 
-from async_timeout import timeout as async_timeout
+import aiohttp
 
 from ..schemas.execution import ExecutionContext, ExecutionStatus, StepResult, WorkflowResult
 from ..schemas.workflow import Workflow, WorkflowStep, StepType, ErrorStrategy
-from ..config import get_config
+from ..config import get_budget_limits, get_config
+from ..utils.compat import DATACLASS_SLOTS, async_timeout
+from ..utils.http import create_http_session
+from ..utils.ids import token_id
+from ..utils.serialization import dumps_bytes, loads
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +45,15 @@ logger = logging.getLogger(__name__)
 # Execution Budget
 # =============================================================================
 
+# Budget counter kinds (indexes into ExecutionBudget.counts / limits)
+BUDGET_DB_QUERY = 0
+BUDGET_API_CALL = 1
+BUDGET_EMAIL = 2
+BUDGET_STEP = 3
+
+_BUDGET_LABELS = ("database queries", "external API calls", "emails", "steps")
+
+
 @dataclass
 class ExecutionBudget:
     """
@@ -46,38 +61,50 @@ class ExecutionBudget:
     
     Limits are now loaded from configuration (not hardcoded).
     Addresses audit finding: "Hardcoded ExecutionBudget limits"
+    
+    Counters live in one list indexed by BUDGET_* kind, so every check is
+    the same increment-and-compare.
     """
-    db_queries: int = 0
-    api_calls: int = 0
-    emails_sent: int = 0
-    steps_executed: int = 0
+    counts: List[int] = field(default_factory=lambda: [0, 0, 0, 0])
     
     def __post_init__(self):
-        config = get_config()
-        self.MAX_DB_QUERIES = config.limits.max_db_queries
-        self.MAX_API_CALLS = config.limits.max_api_calls
-        self.MAX_EMAILS = config.limits.max_emails
-        self.MAX_STEPS = config.limits.max_steps
+        self.limits = get_budget_limits()
+        self.MAX_DB_QUERIES, self.MAX_API_CALLS, self.MAX_EMAILS, self.MAX_STEPS = self.limits
+    
+    def check(self, kind: int) -> None:
+        """Charge one unit of a BUDGET_* kind, raising once over the limit."""
+        counts = self.counts
+        counts[kind] += 1
+        if counts[kind] > self.limits[kind]:
+            raise BudgetExceededError(f"Too many {_BUDGET_LABELS[kind]} (max: {self.limits[kind]})")
     
     def check_db_query(self) -> None:
-        self.db_queries += 1
-        if self.db_queries > self.MAX_DB_QUERIES:
-            raise BudgetExceededError(f"Too many database queries (max: {self.MAX_DB_QUERIES})")
+        self.check(BUDGET_DB_QUERY)
     
     def check_api_call(self) -> None:
-        self.api_calls += 1
-        if self.api_calls > self.MAX_API_CALLS:
-            raise BudgetExceededError(f"Too many external API calls (max: {self.MAX_API_CALLS})")
+        self.check(BUDGET_API_CALL)
     
     def check_email(self) -> None:
-        self.emails_sent += 1
-        if self.emails_sent > self.MAX_EMAILS:
-            raise BudgetExceededError(f"Too many emails (max: {self.MAX_EMAILS})")
+        self.check(BUDGET_EMAIL)
     
     def check_step(self) -> None:
-        self.steps_executed += 1
-        if self.steps_executed > self.MAX_STEPS:
-            raise BudgetExceededError(f"Too many steps (max: {self.MAX_STEPS})")
+        self.check(BUDGET_STEP)
+    
+    @property
+    def db_queries(self) -> int:
+        return self.counts[BUDGET_DB_QUERY]
+    
+    @property
+    def api_calls(self) -> int:
+        return self.counts[BUDGET_API_CALL]
+    
+    @property
+    def emails_sent(self) -> int:
+        return self.counts[BUDGET_EMAIL]
+    
+    @property
+    def steps_executed(self) -> int:
+        return self.counts[BUDGET_STEP]
 
 
 class BudgetExceededError(Exception):
@@ -85,6 +112,17 @@ class BudgetExceededError(Exception):
     pass
 
 
+# Budget kind charged per step type (one dict probe per step)
+STEP_BUDGET_KIND: Dict[StepType, int] = {
+    StepType.CREATE_ENTITY: BUDGET_DB_QUERY,
+    StepType.UPDATE_ENTITY: BUDGET_DB_QUERY,
+    StepType.DELETE_ENTITY: BUDGET_DB_QUERY,
+    StepType.QUERY_ENTITY: BUDGET_DB_QUERY,
+    StepType.API_CALL: BUDGET_API_CALL,
+    StepType.SEND_EMAIL: BUDGET_EMAIL,
+}
+
+
 # =============================================================================
 # Execution Log
 # =============================================================================
@@ -102,6 +140,28 @@ class ExecutionLog:
     error: Optional[Dict[str, Any]] = None
     input_snapshot: Optional[Dict] = None
     output: Optional[Any] = None
+    input_snapshot_bytes: Optional[bytes] = None  # JSON encoding of input_snapshot
+    
+    def __post_init__(self) -> None:
+        """
+        Freeze the input snapshot as JSON.
+        
+        A given snapshot is encoded into input_snapshot_bytes and replaced
+        by its decoded copy, so later changes to the source context cannot
+        leak in. The snapshot is therefore JSON-normalized: datetimes and
+        enums become strings, tuples become lists and, with the stdlib
+        encoder, non-string keys become strings (orjson rejects them). A
+        snapshot that cannot be encoded is kept as given. Given only the
+        bytes, the snapshot is decoded from them.
+        """
+        if self.input_snapshot_bytes is None:
+            if self.input_snapshot is None:
+                return
+            try:
+                self.input_snapshot_bytes = dumps_bytes(self.input_snapshot)
+            except TypeError:
+                return
+        self.input_snapshot = loads(self.input_snapshot_bytes)
     
     def to_workflow_result(self) -> WorkflowResult:
         """Convert to WorkflowResult for API response."""
@@ -119,17 +179,121 @@ class ExecutionLog:
         )
 
 
+# Log step "level" param -> logging level
+WORKFLOW_LOG_LEVELS: Dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 # =============================================================================
 # Step Handler Type
 # =============================================================================
 
 StepHandler = Callable[[Dict[str, Any], ExecutionContext], Awaitable[Any]]
 
+# Compiled step params: (key, kind, payload) per param, see _compile_params()
+PARAM_LITERAL = 0
+PARAM_REF = 1
+PARAM_MUTABLE = 2  # literal container, deep-copied per execution
+
+# Literal types that can be shared between executions as-is
+IMMUTABLE_LITERALS = (str, int, float, bool, type(None))
+ParamPlan = Tuple[Tuple[str, int, Any], ...]
+
+
+def _dynamic_only(plan: ParamPlan) -> Optional[ParamPlan]:
+    """Return the plan if any param needs per-execution work, else None."""
+    for _, kind, _ in plan:
+        if kind != PARAM_LITERAL:
+            return plan
+    return None
+
+
+# =============================================================================
+# Compiled Workflow
+# =============================================================================
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class CompiledWorkflow:
+    """
+    Static scheduling data for a workflow, built once and reused.
+    
+    Everything here is a pure function of the steps' dependencies, so it
+    is cached on the Workflow and rebuilt when its version, its steps, or
+    a step's depends_on list changes. Indexed by step position, with
+    integer arrays for the graph; in_degree is a template that each
+    execution copies (a memcpy). Param plans are not kept here: they are
+    looked up per step at dispatch, so replacing step.params takes effect.
+    """
+    steps: List[WorkflowStep]
+    version: int
+    in_degree: array
+    dependents: Tuple[array, ...]
+    step_deps: Tuple[Tuple[WorkflowStep, List[str], int], ...]  # (step, depends_on, len)
+    
+    def matches(self, workflow: Workflow) -> bool:
+        """Check that this was compiled from the workflow as it is now."""
+        if self.steps is not workflow.steps or self.version != workflow.version:
+            return False
+        if len(self.steps) != len(self.step_deps):
+            return False
+        for step, (built, depends_on, count) in zip(self.steps, self.step_deps):
+            if step is not built or step.depends_on is not depends_on or len(depends_on) != count:
+                return False
+        return True
+
 
 # =============================================================================
 # Workflow Executor
 # =============================================================================
 
+def _truncate_inputs(params: Dict[str, Any], max_bytes: int) -> Dict[str, Any]:
+    """Replace params whose JSON encoding exceeds max_bytes with a size summary."""
+    try:
+        if len(dumps_bytes(params)) <= max_bytes:
+            return params
+    except TypeError:
+        pass  # not JSON-encodable as a whole; measure per value
+    
+    truncated = {}
+    for key, value in params.items():
+        try:
+            size = len(dumps_bytes(value))
+        except TypeError:
+            truncated[key] = value
+            continue
+        truncated[key] = {"_truncated": True, "bytes": size} if size > max_bytes else value
+    return truncated
+
+
+def _step_result(
+    step: WorkflowStep,
+    started_at: datetime,
+    start_ns: int,
+    inputs: Optional[Dict[str, Any]],
+    result: Any = None,
+    error: Optional[str] = None,
+) -> StepResult:
+    """Build a finished StepResult, timed from a perf_counter_ns() start."""
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    return StepResult(
+        step_uid=step.uid,
+        step_type=step.type.value,  # the enum's own str: shared, not copied
+        started_at=started_at,
+        completed_at=started_at + timedelta(microseconds=elapsed_ns // 1000),
+        duration_ms=elapsed_ns // 1_000_000,
+        inputs=inputs,
+        result=result,
+        error=error,
+    )
+
+
 class WorkflowExecutor:
     """
     Executes OrionX workflows.
@@ -145,15 +309,17 @@ class WorkflowExecutor:
     
     def __init__(
         self,
-        step_handlers: Optional[Dict[StepType, StepHandler]] = None,
+        step_handlers: Optional[Mapping[StepType, StepHandler]] = None,
     ):
-        self._handlers = step_handlers or {}
+        self._handlers: Dict[StepType, StepHandler] = dict(step_handlers) if step_handlers else {}
         self._active_executions: Dict[str, ExecutionLog] = {}
         
         # Load timeouts from config
         config = get_config()
         self.default_step_timeout = config.limits.step_timeout_seconds
         self.max_workflow_timeout = config.limits.workflow_timeout_seconds
+        self._capture_inputs = config.limits.log_step_inputs
+        self._max_input_bytes = config.limits.max_input_bytes
     
     def register_handler(self, step_type: StepType, handler: StepHandler) -> None:
         """Register a handler for a step type."""
@@ -164,6 +330,7 @@ class WorkflowExecutor:
         workflow: Workflow,
         context: ExecutionContext,
         user_uid: Optional[str] = None,
+        log: Optional[ExecutionLog] = None,
     ) -> ExecutionLog:
         """
         Execute a workflow.
@@ -172,35 +339,29 @@ class WorkflowExecutor:
             workflow: The workflow to execute
             context: Initial execution context
             user_uid: Executing user's UID
+            log: Pending log from create_log() to execute into (optional)
             
         Returns:
             Execution log with results
         """
-        execution_id = f"exec_{uuid.uuid4().hex[:12]}"
+        if log is None:
+            log = self.create_log(workflow, context, user_uid)
+        
+        execution_id = log.execution_id
         budget = ExecutionBudget()
         
-        log = ExecutionLog(
-            execution_id=execution_id,
-            workflow_uid=workflow.uid,
-            user_uid=user_uid,
-            started_at=datetime.utcnow(),
-            status=ExecutionStatus.RUNNING,
-            input_snapshot=self._serialize_context(context),
-        )
+        log.status = ExecutionStatus.RUNNING
+        log.started_at = datetime.utcnow()
         
         self._active_executions[execution_id] = log
         
         try:
-            # Build dependency graph
-            step_graph = self._build_dependency_graph(workflow.steps)
-            
             # Track results for each step
             results: Dict[str, Any] = {}
             
             # Execute in dependency order
             await self._execute_graph(
-                workflow.steps,
-                step_graph,
+                self._compile_workflow(workflow),
                 results,
                 context,
                 log,
@@ -225,108 +386,142 @@ class WorkflowExecutor:
             log.status = ExecutionStatus.FAILED
             log.error = {"type": "error", "message": str(e)}
             log.completed_at = datetime.utcnow()
-            logger.exception(f"Workflow execution failed: {execution_id}")
+            logger.exception("Workflow execution failed: %s", execution_id)
         
         finally:
             self._active_executions.pop(execution_id, None)
         
         return log
     
-    def _build_dependency_graph(
+    def create_log(
         self,
-        steps: List[WorkflowStep]
-    ) -> Dict[str, Set[str]]:
-        """Build adjacency list of step dependencies."""
-        graph: Dict[str, Set[str]] = {}
+        workflow: Workflow,
+        context: ExecutionContext,
+        user_uid: Optional[str] = None,
+    ) -> ExecutionLog:
+        """Create a pending execution log with a fresh execution ID."""
+        return ExecutionLog(
+            execution_id=token_id("exec"),
+            workflow_uid=workflow.uid,
+            user_uid=user_uid,
+            started_at=datetime.utcnow(),
+            status=ExecutionStatus.PENDING,
+            input_snapshot=self._serialize_context(context),  # frozen as JSON
+        )
+    
+    def _compile_workflow(self, workflow: Workflow) -> CompiledWorkflow:
+        """
+        Get the workflow's CompiledWorkflow, building it on first use.
+        
+        Building is synchronous, so concurrent executions on one event loop
+        cannot race on it.
+        """
+        compiled = workflow._compiled
+        if compiled is not None and compiled.matches(workflow):
+            return compiled
         
-        for step in steps:
-            graph[step.uid] = set(step.depends_on) if step.depends_on else set()
+        # One pass over the steps builds everything the scheduler needs:
+        # in_degree: number of dependencies for each step
+        # dependents: steps that depend on each step
+        steps = workflow.steps
+        uid_to_idx = {step.uid: i for i, step in enumerate(steps)}
+        in_degree = array("I", [0]) * len(steps)
+        dependents = [array("I") for _ in steps]
+        for i, step in enumerate(steps):
+            in_degree[i] = len(step.depends_on)
+            for dep in step.depends_on:
+                dep_idx = uid_to_idx.get(dep)
+                # Unknown deps are never satisfied, so the step never runs
+                if dep_idx is not None:
+                    dependents[dep_idx].append(i)
         
-        return graph
+        compiled = CompiledWorkflow(
+            steps=steps,
+            version=workflow.version,
+            in_degree=in_degree,
+            dependents=tuple(dependents),
+            step_deps=tuple((step, step.depends_on, len(step.depends_on)) for step in steps),
+        )
+        workflow._compiled = compiled
+        return compiled
     
     async def _execute_graph(
         self,
-        steps: List[WorkflowStep],
-        graph: Dict[str, Set[str]],
+        compiled: CompiledWorkflow,
         results: Dict[str, Any],
         context: ExecutionContext,
         log: ExecutionLog,
         budget: ExecutionBudget,
     ) -> None:
         """Execute steps respecting dependency graph."""
-        step_map = {s.uid: s for s in steps}
-        completed: Set[str] = set()
+        steps = compiled.steps
+        dependents = compiled.dependents
+        in_degree = compiled.in_degree[:]
         
-        # Pre-process graph for O(1) ready check
-        # in_degree: number of dependencies remaining for each step
-        in_degree: Dict[str, int] = {uid: len(deps) for uid, deps in graph.items()}
-
-        # dependents: adjacency list mapping step -> steps that depend on it
-        dependents: Dict[str, List[str]] = {uid: [] for uid in graph}
-        for uid, deps in graph.items():
-            for dep in deps:
-                if dep in dependents:
-                    dependents[dep].append(uid)
-
         # Initial ready steps
-        ready_queue = deque([uid for uid, d in in_degree.items() if d == 0])
+        ready_queue = deque([i for i, d in enumerate(in_degree) if d == 0])
+        completed = 0
 
-        # Track running tasks: {task: step_uid}
-        running_tasks: Dict[asyncio.Task, str] = {}
+        # Step tasks by step index, so bookkeeping is list indexing only
+        tasks: List[Optional[asyncio.Task]] = [None] * len(steps)
+        running = 0
+        
+        # Finished tasks report their index here, so each completion is O(1)
+        # instead of asyncio.wait() re-registering on every running task
+        done_queue: asyncio.Queue = asyncio.Queue()
 
         # Apply overall timeout
         try:
             async with async_timeout(self.max_workflow_timeout):
-                while len(completed) < len(steps):
+                while completed < len(steps):
                     # Submit newly ready steps
                     while ready_queue:
-                        uid = ready_queue.popleft()
+                        idx = ready_queue.popleft()
                         task = asyncio.create_task(
                             self._execute_step(
-                                step_map[uid],
+                                steps[idx],
                                 context,
                                 results,
                                 log,
                                 budget,
                             )
                         )
-                        running_tasks[task] = uid
+                        task.add_done_callback(lambda _task, i=idx: done_queue.put_nowait(i))
+                        tasks[idx] = task
+                        running += 1
 
-                    if not running_tasks:
+                    if not running:
                         raise RuntimeError("Workflow execution stuck - possible cycle")
 
-                    # Wait for at least one task to complete
-                    done, _ = await asyncio.wait(
-                        running_tasks.keys(),
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    # Process completed tasks
-                    for task in done:
-                        uid = running_tasks.pop(task)
-                        try:
-                            result = task.result()
-                            results[uid] = result
-                            context.set_result(uid, result)
-                        except Exception as e:
-                            step = step_map[uid]
-                            if step.on_error == ErrorStrategy.STOP:
-                                raise e
-                            results[uid] = {"error": str(e)}
-
-                        completed.add(uid)
-
-                        # Update dependencies
-                        for dependent in dependents[uid]:
-                            in_degree[dependent] -= 1
-                            if in_degree[dependent] == 0:
-                                ready_queue.append(dependent)
-
-        except Exception:
-            # Ensure pending tasks are cancelled on error or timeout
-            for task in running_tasks:
-                if not task.done():
-                    task.cancel()
+                    # Wait for the next task to complete
+                    idx = await done_queue.get()
+                    running -= 1
+                    step = steps[idx]
+                    try:
+                        result = tasks[idx].result()
+                        results[step.uid] = result
+                        context.set_result(step.uid, result)
+                    except Exception as e:
+                        if step.on_error == ErrorStrategy.STOP:
+                            raise e
+                        results[step.uid] = {"error": str(e)}
+
+                    completed += 1
+
+                    # Update dependencies
+                    for dependent in dependents[idx]:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready_queue.append(dependent)
+
+        except BaseException:
+            # On error, timeout or cancellation, cancel unfinished steps and
+            # wait for them, so none outlives the execution
+            pending = [t for t in tasks if t is not None and not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
             raise
     
     async def _execute_step(
@@ -338,13 +533,13 @@ class WorkflowExecutor:
         budget: ExecutionBudget,
     ) -> Any:
         """Execute a single step."""
-        budget.check_step()
+        budget.check(BUDGET_STEP)
         
-        step_log = StepResult(
-            step_uid=step.uid,
-            step_type=step.type.value,
-            started_at=datetime.utcnow(),
-        )
+        # StepResults escape into the returned log, so they are built once,
+        # fully populated, rather than mutated field by field
+        start_ns = time.perf_counter_ns()
+        started_at = datetime.utcnow()
+        params: Optional[Dict[str, Any]] = None
         
         try:
             # Check only_when condition
@@ -352,36 +547,34 @@ class WorkflowExecutor:
                 # Would evaluate expression here
                 pass
             
-            # Evaluate parameters
-            params = self._evaluate_params(step.params, context, results)
-            step_log.inputs = params
+            # Evaluate parameters (None plan: all immutable literals)
+            param_plan = _dynamic_only(self._compile_params(step))
+            if param_plan is None:
+                params = step.params.copy()  # all literals
+            else:
+                params = self._evaluate_params(param_plan, context, results)
             
             # Check budget based on step type
-            if step.type in [StepType.CREATE_ENTITY, StepType.UPDATE_ENTITY, StepType.DELETE_ENTITY, StepType.QUERY_ENTITY]:
-                budget.check_db_query()
-            elif step.type == StepType.API_CALL:
-                budget.check_api_call()
-            elif step.type == StepType.SEND_EMAIL:
-                budget.check_email()
+            budget_kind = STEP_BUDGET_KIND.get(step.type)
+            if budget_kind is not None:
+                budget.check(budget_kind)
             
-            # Execute with timeout
+            # Execute with timeout; one no tighter than the workflow's own
+            # timeout is already enforced by _execute_graph
             timeout = step.timeout_ms / 1000.0 if step.timeout_ms else self.default_step_timeout
-            async with async_timeout(timeout):
+            if timeout < self.max_workflow_timeout:
+                async with async_timeout(timeout):
+                    result = await self._dispatch_step(step.type, params, context)
+            else:
                 result = await self._dispatch_step(step.type, params, context)
             
-            step_log.result = result
-            step_log.completed_at = datetime.utcnow()
-            step_log.duration_ms = int(
-                (step_log.completed_at - step_log.started_at).total_seconds() * 1000
-            )
-            
-            log.step_logs.append(step_log)
+            log.step_logs.append(_step_result(step, started_at, start_ns, self._recorded_inputs(params), result=result))
             return result
             
         except Exception as e:
-            step_log.error = str(e)
-            step_log.completed_at = datetime.utcnow()
-            log.step_logs.append(step_log)
+            log.step_logs.append(
+                _step_result(step, started_at, start_ns, self._recorded_inputs(params or {}), error=str(e))
+            )
             raise
     
     async def _dispatch_step(
@@ -415,29 +608,59 @@ class WorkflowExecutor:
     def _handle_log(self, params: Dict) -> Dict:
         """Handle log step."""
         message = params.get("message", "")
-        level = params.get("level", "info")
-        log_fn = getattr(logger, level, logger.info)
-        log_fn(f"[WorkflowLog] {message}")
+        levelno = WORKFLOW_LOG_LEVELS.get(params.get("level", "info"), logging.INFO)
+        # Skip record creation and formatting entirely for filtered levels
+        if logger.isEnabledFor(levelno):
+            logger.log(levelno, "[WorkflowLog] %s", message)
         return {"logged": message}
     
+    def _recorded_inputs(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Inputs to keep on the StepResult, per the log_step_inputs/max_input_bytes config."""
+        if not self._capture_inputs:
+            return None
+        if self._max_input_bytes:
+            return _truncate_inputs(params, self._max_input_bytes)
+        return params
+    
+    def _compile_params(self, step: WorkflowStep) -> ParamPlan:
+        """
+        Compile a step's params into a resolution plan.
+        
+        {"x": "$foo", "y": 1} becomes (("x", PARAM_REF, "foo"), ("y", PARAM_LITERAL, 1)).
+        Container literals are PARAM_MUTABLE and deep-copied per execution, so
+        handlers never share objects with the (possibly shared) workflow
+        definition. The plan is cached on the step and rebuilt when its params
+        dict is replaced.
+        """
+        cached = step._param_plan
+        if cached is not None and cached[0] is step.params:
+            return cached[1]
+        
+        plan: ParamPlan = tuple(
+            (key, PARAM_REF, value[1:])
+            if isinstance(value, str) and value.startswith("$")
+            else (key, PARAM_LITERAL if isinstance(value, IMMUTABLE_LITERALS) else PARAM_MUTABLE, value)
+            for key, value in step.params.items()
+        )
+        step._param_plan = (step.params, plan)
+        return plan
+    
     def _evaluate_params(
         self,
-        params: Dict[str, Any],
+        plan: ParamPlan,
         context: ExecutionContext,
         results: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Evaluate parameter expressions."""
+        """Evaluate a compiled param plan."""
         evaluated = {}
-        for key, value in params.items():
-            if isinstance(value, str) and value.startswith("$"):
-                # Simple variable reference
-                var_name = value[1:]
-                if var_name in results:
-                    evaluated[key] = results[var_name]
-                else:
-                    evaluated[key] = context.get(var_name)
+        for key, kind, payload in plan:
+            if kind == PARAM_REF:
+                # Simple variable reference: step result first, then context
+                evaluated[key] = results[payload] if payload in results else context.get(payload)
+            elif kind == PARAM_MUTABLE:
+                evaluated[key] = copy.deepcopy(payload)
             else:
-                evaluated[key] = value
+                evaluated[key] = payload
         return evaluated
     
     def _serialize_context(self, context: ExecutionContext) -> Dict:
@@ -457,13 +680,18 @@ class WorkflowExecutor:
         """Cancel an active execution."""
         log = self._active_executions.get(execution_id)
         if log and log.status == ExecutionStatus.RUNNING:
-            log.status = ExecutionStatus.CANCELLED
-            log.completed_at = datetime.utcnow()
-            log.error = {"type": "cancelled", "message": "Execution was cancelled"}
+            _mark_cancelled(log)
             return True
         return False
 
 
+def _mark_cancelled(log: ExecutionLog) -> None:
+    """Record an execution as cancelled."""
+    log.status = ExecutionStatus.CANCELLED
+    log.completed_at = datetime.utcnow()
+    log.error = {"type": "cancelled", "message": "Execution was cancelled"}
+
+
 # =============================================================================
 # OneX Engine (High-Level API)
 # =============================================================================
@@ -483,6 +711,20 @@ class OneXEngine:
         self._executor = WorkflowExecutor()
         self._execution_logs: Dict[str, ExecutionLog] = {}
         self._event_handlers: Dict[str, List[Callable]] = {}
+        self._http: Optional[aiohttp.ClientSession] = None
+    
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        """Shared pooled HTTP session for outbound calls (created on first use)."""
+        if self._http is None or self._http.closed:
+            self._http = create_http_session()
+        return self._http
+    
+    async def close(self) -> None:
+        """Release engine resources."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
     
     async def submit_workflow(
         self,
@@ -511,9 +753,45 @@ class OneXEngine:
         
         return log.execution_id
     
+    def create_execution(
+        self,
+        workflow: Workflow,
+        context: Optional[ExecutionContext] = None,
+        user_uid: Optional[str] = None,
+    ) -> str:
+        """
+        Register a pending execution without running it.
+        
+        The execution is queryable immediately (status PENDING) and is
+        started with run_execution().
+        
+        Returns:
+            Execution ID
+        """
+        ctx = context or ExecutionContext()
+        log = self._executor.create_log(workflow, ctx, user_uid)
+        self._execution_logs[log.execution_id] = log
+        return log.execution_id
+    
+    async def run_execution(
+        self,
+        execution_id: str,
+        workflow: Workflow,
+        context: Optional[ExecutionContext] = None,
+    ) -> None:
+        """Run a pending execution created by create_execution()."""
+        log = self._execution_logs.get(execution_id)
+        if log is None or log.status != ExecutionStatus.PENDING:
+            return
+        
+        await self._executor.execute(workflow, context or ExecutionContext(), log.user_uid, log)
+    
     async def cancel_workflow(self, execution_id: str) -> bool:
         """
-        Cancel a running workflow.
+        Cancel a pending or running workflow.
+        
+        A pending execution is marked cancelled here, and run_execution()
+        then never starts it.
         
         Args:
             execution_id: Execution ID to cancel
@@ -521,6 +799,10 @@ class OneXEngine:
         Returns:
             True if cancelled, False if not found or already complete
         """
+        log = self._execution_logs.get(execution_id)
+        if log is not None and log.status == ExecutionStatus.PENDING:
+            _mark_cancelled(log)
+            return True
         return await self._executor.cancel(execution_id)
     
     async def retry_workflow(
@@ -4,11 +4,21 @@ OneX Main Application
 FastAPI application entry point for the OneX execution engine.
 """
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from fastapi import FastAPI, Response
+import anyio.to_thread
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
 import logging
+import queue
 
-from .api.routes import router
+from .api.asgi_middleware import PureCORSMiddleware
+from .api.routes import router, close_engine
+from .config import get_config
+from .persistence import close_execution_store
+from .utils.pools import shutdown_pools
+from .utils.serialization import dumps_bytes
 
 
 # Configure logging
@@ -17,6 +27,35 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+# While the app runs, records go to a background thread so formatting and
+# handler I/O stay off the event loop. The swap happens in startup, not at
+# import, so importing the app leaves global logging untouched.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+_root_handlers: List[logging.Handler] = []
+
+
+def _start_log_listener() -> None:
+    """Move the root handlers onto a QueueListener thread."""
+    global _log_listener, _root_handlers
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    _root_handlers = root.handlers[:]
+    _log_listener = QueueListener(_log_queue, *_root_handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(_log_queue)]
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    """Flush the listener and give the root logger its handlers back."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    logging.getLogger().handlers = _root_handlers
+
 # Create FastAPI app
 app = FastAPI(
     title="OneX Execution Engine",
@@ -62,13 +101,15 @@ OneX is a horizontal execution engine whose ONLY responsibility is:
     openapi_url="/openapi.json",
 )
 
-# Add CORS middleware
+# Add CORS middleware (pure ASGI; preflights never reach the router).
+# Scoped to the API, so docs and the root document skip it entirely.
 app.add_middleware(
-    CORSMiddleware,
+    PureCORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    path_prefixes=[router.prefix],
 )
 
 # Include router
@@ -78,22 +119,38 @@ app.include_router(router)
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup."""
+    _start_log_listener()
     logging.info("OneX Execution Engine starting...")
+    
+    # Bound the threads used by sync endpoints/handlers and run_in_executor
+    workers = get_config().worker_threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = workers
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orionx-worker")
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logging.info("OneX Execution Engine shutting down...")
+    await close_engine()
+    shutdown_pools()
+    await close_execution_store()
+    _stop_log_listener()
+
+
+# Static, so encoded once rather than per request
+_ROOT_BODY = dumps_bytes({
+    "name": "OneX Execution Engine",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "health": "/api/v1/health",
+})
 
 
 # Health check at root
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
-    return {
-        "name": "OneX Execution Engine",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "health": "/api/v1/health",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -7,10 +7,15 @@ Copied from OrionX with EvaluationContext → ExecutionContext.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
+from itertools import compress, repeat
+import asyncio
 import logging
+import operator
+import pickle
 
 from ..schemas.data_types import (
     DataType,
@@ -20,11 +25,50 @@ from ..schemas.data_types import (
     DataField,
 )
 from ..schemas.execution import ExecutionContext
+from ..utils.pools import run_cpu
 
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Row Masks
+# =============================================================================
+
+def _creator_of(entity: Dict[str, Any]) -> Any:
+    return entity.get("created_by") or entity.get("creator_id") or entity.get("owner_id")
+
+
+def creator_mask(entities: List[Dict[str, Any]], user_id: Any) -> List[bool]:
+    """
+    Return one bool per entity: whether user_id is its creator.
+    
+    The loop, the comparison and (in filter_list) the selection run in C
+    via map() and compress(); the only Python call per row is the creator
+    key lookup. Ids are compared directly, never hashed, so a collision
+    can never widen access.
+    """
+    return list(map(operator.eq, map(_creator_of, entities), repeat(user_id)))
+
+
+def _first_truthy(*values: Any) -> Any:
+    """Columnwise `a or b or c`."""
+    for value in values:
+        if value:
+            return value
+    return value
+
+
+def _coalesce_columns(columns: Dict[str, List[Any]], keys: Tuple[str, ...], length: int) -> List[Any]:
+    """Coalesce the named columns row by row, as the row-wise `or` chain would."""
+    present = [columns[key] for key in keys if key in columns]
+    if not present:
+        return [None] * length
+    if len(present) == 1:
+        return present[0]
+    return list(map(_first_truthy, *present))
+
+
 # =============================================================================
 # Permission Results
 # =============================================================================
@@ -61,6 +105,120 @@ class PermissionResult:
         return cls(decision=PermissionDecision.FILTER, allowed_fields=allowed_fields)
 
 
+# Shared results, so checks allocate nothing on their common paths;
+# treat as read-only
+_ALLOW = PermissionResult.allow()
+_DENY_AUTH = PermissionResult.deny("Authentication required")
+_DENY_UNKNOWN_LEVEL = PermissionResult.deny("Unknown privacy level")
+_DENY_NOT_CREATOR = PermissionResult.deny("Only the creator can access this record")
+_DENY_CONDITION = PermissionResult.deny("Custom rule condition not met")
+_DENY_NO_CONDITION = PermissionResult.deny("Custom rule has no condition")
+_DENY_NO_EVALUATOR = PermissionResult.deny("No expression evaluator configured")
+_DENY_NO_EXPRESSION = PermissionResult.deny("Rule expression not found")
+
+
+@lru_cache(maxsize=1024)
+def _allow_rule(rule_uid: str) -> PermissionResult:
+    """Shared ALLOW result attributed to a rule (read-only)."""
+    return PermissionResult(decision=PermissionDecision.ALLOW, rule_uid=rule_uid)
+
+
+def _custom_rule_result(rule: PrivacyRule, result: Any) -> PermissionResult:
+    """Map a custom rule's evaluated condition to a permission result."""
+    return _allow_rule(rule.uid) if result else _DENY_CONDITION
+
+
+# Interpreted evaluations of a custom rule before it is specialized
+HOT_RULE_THRESHOLD = 50
+
+
+def _evaluate_expression(evaluator: Any, expression: Any, context: ExecutionContext) -> Any:
+    """Worker-pool entry point for custom rule evaluation (must be module-level)."""
+    return evaluator.evaluate(expression, context)
+
+
+# =============================================================================
+# Field Access Plans
+# =============================================================================
+
+# Field access codes in a field plan
+FIELD_ALWAYS = 0
+FIELD_LOGGED_IN = 1
+FIELD_CREATOR_ONLY = 2
+
+_FIELD_CODES = {
+    PrivacyLevel.LOGGED_IN: FIELD_LOGGED_IN,
+    PrivacyLevel.CREATOR_ONLY: FIELD_CREATOR_ONLY,
+}
+
+# Always returned by filter_fields when present
+SYSTEM_FIELDS = ("id", "uid", "created_at", "updated_at")
+
+# Creator keys in precedence order, for rows and for fields
+ROW_CREATOR_KEYS = ("created_by", "creator_id", "owner_id")
+FIELD_CREATOR_KEYS = ("created_by", "creator_id")
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """Flattened per-type field access metadata for filter_fields()."""
+    signature: Tuple[Tuple[DataField, str, PrivacyLevel], ...]  # DataType.field_signature()
+    entries: Tuple[Tuple[str, int], ...]  # (name, FIELD_* code)
+    has_creator_fields: bool
+
+
+def _field_plan(data_type: DataType) -> FieldPlan:
+    """Get the data type's FieldPlan, rebuilding it if any field changed."""
+    plan = data_type._field_plan
+    signature = data_type.field_signature()
+    if plan is not None and plan.signature == signature:
+        return plan
+    
+    entries = tuple(
+        (name, _FIELD_CODES.get(privacy, FIELD_ALWAYS))
+        for _, name, privacy in signature
+    )
+    plan = FieldPlan(
+        signature=signature,
+        entries=entries,
+        has_creator_fields=any(code == FIELD_CREATOR_ONLY for _, code in entries),
+    )
+    data_type._field_plan = plan
+    return plan
+
+
+def _project_fields(
+    plan: FieldPlan,
+    entity: Dict[str, Any],
+    logged_in: bool,
+    user_id: Any,
+) -> Dict[str, Any]:
+    """
+    Apply a field plan to one entity.
+    
+    Field privacy only depends on the user and the entity's creator, so
+    each access code is decided once rather than per field. The user's
+    id is passed in, so filter_list() resolves it once per list.
+    """
+    is_creator = False
+    if logged_in and plan.has_creator_fields:
+        created_by = entity.get("created_by") or entity.get("creator_id")
+        is_creator = created_by == user_id
+    allowed = (True, logged_in, is_creator)
+    
+    result = {}
+    for name, code in plan.entries:
+        if allowed[code] and name in entity:
+            result[name] = entity[name]
+    
+    # Always include system fields
+    for sys_field in SYSTEM_FIELDS:
+        if sys_field in entity:
+            result[sys_field] = entity[sys_field]
+    
+    return result
+
+
 # =============================================================================
 # Permission Gate
 # =============================================================================
@@ -83,6 +241,12 @@ class PermissionGate:
     ):
         self.evaluator = expression_evaluator
         self.expressions = expressions or {}
+        
+        # Hot custom rules: interpreted evaluation counts, and the
+        # specialized callable per condition_expr as (expression, fn),
+        # where fn is None once specialization failed or deoptimized.
+        self._hot_exprs: Dict[str, int] = {}
+        self._compiled_exprs: Dict[str, Tuple[Any, Optional[Callable[[ExecutionContext], Any]]]] = {}
     
     def check(
         self,
@@ -106,7 +270,7 @@ class PermissionGate:
         rule = data_type.get_rule(action)
         
         if rule is None:
-            logger.warning(f"No privacy rule for {action} on {data_type.uid}")
+            logger.warning("No privacy rule for %s on %s", action, data_type.uid)
             return PermissionResult.deny(f"No {action} rule defined")
         
         return self._evaluate_rule(rule, entity, context)
@@ -121,20 +285,20 @@ class PermissionGate:
         level = rule.level
         
         if level == PrivacyLevel.PUBLIC:
-            return PermissionResult.allow()
+            return _ALLOW
         
         if level in (PrivacyLevel.PRIVATE, PrivacyLevel.CREATOR_ONLY):
             return self._check_creator(entity, context, rule.uid)
         
         if level == PrivacyLevel.LOGGED_IN:
             if context.user is not None:
-                return PermissionResult.allow()
-            return PermissionResult.deny("Authentication required")
+                return _ALLOW
+            return _DENY_AUTH
         
         if level == PrivacyLevel.CUSTOM:
             return self._evaluate_custom_rule(rule, entity, context)
         
-        return PermissionResult.deny("Unknown privacy level")
+        return _DENY_UNKNOWN_LEVEL
     
     def _check_creator(
         self,
@@ -144,21 +308,18 @@ class PermissionGate:
     ) -> PermissionResult:
         """Check if current user is the creator."""
         if context.user is None:
-            return PermissionResult.deny("Authentication required")
+            return _DENY_AUTH
         
         if entity is None:
-            return PermissionResult.allow()
+            return _ALLOW
         
-        created_by = entity.get("created_by") or entity.get("creator_id") or entity.get("owner_id")
+        created_by = _creator_of(entity)
         user_id = context.user.get("uid") or context.user.get("id")
         
         if created_by == user_id:
-            return PermissionResult(
-                decision=PermissionDecision.ALLOW,
-                rule_uid=rule_uid
-            )
+            return _allow_rule(rule_uid)
         
-        return PermissionResult.deny("Only the creator can access this record")
+        return _DENY_NOT_CREATOR
     
     def _evaluate_custom_rule(
         self,
@@ -167,33 +328,129 @@ class PermissionGate:
         context: ExecutionContext
     ) -> PermissionResult:
         """Evaluate a custom expression-based rule."""
+        prepared = self._prepare_custom_rule(rule, entity, context)
+        if isinstance(prepared, PermissionResult):
+            return prepared
+        
+        expression, eval_context = prepared
+        try:
+            result = self._run_custom_expression(rule.condition_expr, expression, eval_context)
+        except Exception as e:
+            logger.error("Error evaluating rule %s: %s", rule.uid, e)
+            return PermissionResult.deny(f"Rule evaluation error: {e}")
+        return _custom_rule_result(rule, result)
+    
+    def _run_custom_expression(self, key: str, expression: Any, context: ExecutionContext) -> Any:
+        """
+        Evaluate a custom rule expression, specializing it once hot.
+        
+        After HOT_RULE_THRESHOLD interpreted evaluations the expression is
+        specialized (see _specialize). If the specialized callable raises,
+        it is dropped for good and the interpreter result is returned, so
+        specialization never changes a decision.
+        """
+        cached = self._compiled_exprs.get(key)
+        if cached is not None and cached[0] is expression:
+            fn = cached[1]
+            if fn is not None:
+                try:
+                    return fn(context)
+                except Exception:
+                    logger.debug("Deoptimizing custom rule expression %s", key)
+                    self._compiled_exprs[key] = (expression, None)
+            return self.evaluator.evaluate(expression, context)
+        
+        count = self._hot_exprs.get(key, 0) + 1
+        self._hot_exprs[key] = count
+        if count >= HOT_RULE_THRESHOLD:
+            self._compiled_exprs[key] = (expression, self._specialize(expression))
+            del self._hot_exprs[key]
+        return self.evaluator.evaluate(expression, context)
+    
+    def _specialize(self, expression: Any) -> Optional[Callable[[ExecutionContext], Any]]:
+        """
+        Build a direct callable for an expression, or None.
+        
+        Prefers the evaluator's own compile(expression) hook, which returns
+        a callable taking the evaluation context. Pure IR expressions
+        do not read the context, so their compile_pure() callable is used
+        as-is.
+        """
+        compile_expression = getattr(self.evaluator, "compile", None)
+        if compile_expression is not None:
+            try:
+                return compile_expression(expression)
+            except Exception as e:
+                logger.debug("Custom rule expression not specialized: %s", e)
+                return None
+        
+        compile_pure = getattr(expression, "compile_pure", None)
+        if compile_pure is not None:
+            pure = compile_pure()
+            if pure is not None:
+                return lambda context: pure()
+        return None
+    
+    async def check_async(
+        self,
+        data_type: DataType,
+        action: PrivacyAction,
+        entity: Optional[Dict[str, Any]],
+        context: ExecutionContext
+    ) -> PermissionResult:
+        """
+        Async check() that evaluates custom rules in the CPU worker pool.
+        
+        Custom rule expressions can be arbitrarily expensive, so they run
+        off the event loop; the evaluator, expression and context are
+        pickled to the worker. If they cannot be pickled, the
+        pickle.PicklingError is raised rather than reported as a deny,
+        since it is a configuration error. All other levels are decided
+        inline.
+        """
+        rule = data_type.get_rule(action)
+        
+        if rule is None:
+            logger.warning("No privacy rule for %s on %s", action, data_type.uid)
+            return PermissionResult.deny(f"No {action} rule defined")
+        
+        if rule.level != PrivacyLevel.CUSTOM:
+            return self._evaluate_rule(rule, entity, context)
+        
+        prepared = self._prepare_custom_rule(rule, entity, context)
+        if isinstance(prepared, PermissionResult):
+            return prepared
+        
+        expression, eval_context = prepared
+        try:
+            result = await run_cpu(_evaluate_expression, self.evaluator, expression, eval_context)
+        except pickle.PicklingError:
+            raise
+        except Exception as e:
+            logger.error("Error evaluating rule %s: %s", rule.uid, e)
+            return PermissionResult.deny(f"Rule evaluation error: {e}")
+        return _custom_rule_result(rule, result)
+    
+    def _prepare_custom_rule(
+        self,
+        rule: PrivacyRule,
+        entity: Optional[Dict[str, Any]],
+        context: ExecutionContext
+    ) -> Union[PermissionResult, Tuple[Any, ExecutionContext]]:
+        """Resolve a custom rule's (expression, context), or a deny result."""
         if not rule.condition_expr:
-            return PermissionResult.deny("Custom rule has no condition")
+            return _DENY_NO_CONDITION
         
         if not self.evaluator:
-            return PermissionResult.deny("No expression evaluator configured")
+            return _DENY_NO_EVALUATOR
         
         expression = self.expressions.get(rule.condition_expr)
         if not expression:
-            logger.error(f"Expression {rule.condition_expr} not found")
-            return PermissionResult.deny("Rule expression not found")
+            logger.error("Expression %s not found", rule.condition_expr)
+            return _DENY_NO_EXPRESSION
         
         eval_context = context.with_entity(entity, "record") if entity else context
-        
-        try:
-            result = self.evaluator.evaluate(expression, eval_context)
-            
-            if result:
-                return PermissionResult(
-                    decision=PermissionDecision.ALLOW,
-                    rule_uid=rule.uid
-                )
-            else:
-                return PermissionResult.deny("Custom rule condition not met")
-                
-        except Exception as e:
-            logger.error(f"Error evaluating rule {rule.uid}: {e}")
-            return PermissionResult.deny(f"Rule evaluation error: {e}")
+        return expression, eval_context
     
     # =========================================================================
     # Field-Level Permissions
@@ -206,19 +463,9 @@ class PermissionGate:
         context: ExecutionContext
     ) -> Dict[str, Any]:
         """Filter out fields the user cannot access."""
-        result = {}
-        
-        for field in data_type.fields:
-            if self._can_access_field(field, entity, context):
-                if field.name in entity:
-                    result[field.name] = entity[field.name]
-        
-        # Always include system fields
-        for sys_field in ["id", "uid", "created_at", "updated_at"]:
-            if sys_field in entity:
-                result[sys_field] = entity[sys_field]
-        
-        return result
+        user = context.user
+        user_id = (user.get("uid") or user.get("id")) if user is not None else None
+        return _project_fields(_field_plan(data_type), entity, user is not None, user_id)
     
     def _can_access_field(
         self,
@@ -256,13 +503,153 @@ class PermissionGate:
         action: PrivacyAction,
         context: ExecutionContext
     ) -> List[Dict[str, Any]]:
-        """Filter a list to only include accessible records."""
-        result = []
+        """
+        Filter a list to only include accessible records.
+        
+        Equivalent to check() per entity, but the rule is fetched once and
+        everything that does not depend on the entity (the level branch,
+        authentication, the user's id, the field plan) is decided once per list.
+        """
+        rule = data_type.get_rule(action)
+        if rule is None:
+            logger.warning("No privacy rule for %s on %s", action, data_type.uid)
+            return []
+        
+        level = rule.level
+        user = context.user
+        logged_in = user is not None
+        user_id = (user.get("uid") or user.get("id")) if logged_in else None
+        
+        if level == PrivacyLevel.PUBLIC or (level == PrivacyLevel.LOGGED_IN and logged_in):
+            allowed = entities
+        elif level in (PrivacyLevel.PRIVATE, PrivacyLevel.CREATOR_ONLY) and logged_in:
+            allowed = list(compress(entities, creator_mask(entities, user_id)))
+        elif level == PrivacyLevel.CUSTOM:
+            # Bound once: no attribute or property lookups per row
+            evaluate = self._evaluate_custom_rule
+            deny = PermissionDecision.DENY
+            allowed = [
+                entity for entity in entities
+                if evaluate(rule, entity, context).decision is not deny
+            ]
+        else:
+            # Unauthenticated creator/logged-in rules, unknown levels
+            return []
+        
+        plan = _field_plan(data_type)
+        return [_project_fields(plan, entity, logged_in, user_id) for entity in allowed]
+    
+    async def filter_list_async(
+        self,
+        data_type: DataType,
+        entities: List[Dict[str, Any]],
+        action: PrivacyAction,
+        context: ExecutionContext,
+        concurrency: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        filter_list() for evaluators with an async evaluate().
+        
+        Custom rule evaluations (often RPCs) are overlapped, at most
+        `concurrency` at a time. With a sync evaluator, or for any other
+        rule level, there is nothing to overlap and this is filter_list().
+        """
+        rule = data_type.get_rule(action)
+        evaluate = getattr(self.evaluator, "evaluate", None)
+        if rule is None or rule.level != PrivacyLevel.CUSTOM or not asyncio.iscoroutinefunction(evaluate):
+            return self.filter_list(data_type, entities, action, context)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(entity: Dict[str, Any]) -> bool:
+            async with semaphore:
+                result = await self._evaluate_custom_rule_async(rule, entity, context)
+            return result.is_allowed
+        
+        mask = await asyncio.gather(*map(check, entities))
+        
+        user = context.user
+        user_id = (user.get("uid") or user.get("id")) if user is not None else None
+        plan = _field_plan(data_type)
+        return [_project_fields(plan, entity, user is not None, user_id) for entity in compress(entities, mask)]
+    
+    async def _evaluate_custom_rule_async(
+        self,
+        rule: PrivacyRule,
+        entity: Optional[Dict[str, Any]],
+        context: ExecutionContext
+    ) -> PermissionResult:
+        """_evaluate_custom_rule() awaiting an async evaluator."""
+        prepared = self._prepare_custom_rule(rule, entity, context)
+        if isinstance(prepared, PermissionResult):
+            return prepared
+        
+        expression, eval_context = prepared
+        try:
+            result = await self.evaluator.evaluate(expression, eval_context)
+        except Exception as e:
+            logger.error("Error evaluating rule %s: %s", rule.uid, e)
+            return PermissionResult.deny(f"Rule evaluation error: {e}")
+        return _custom_rule_result(rule, result)
+    
+    def filter_columns(
+        self,
+        data_type: DataType,
+        columns: Dict[str, List[Any]],
+        action: PrivacyAction,
+        context: ExecutionContext
+    ) -> Dict[str, List[Any]]:
+        """
+        Columnar filter_list(): rows are given as equal-length column lists.
+        
+        The row rule becomes one mask over the creator column, applied to
+        each kept column with compress(). Field rules select whole
+        columns; a CREATOR_ONLY column stays, but holds None in rows the
+        user did not create (where filter_list would omit the key).
+        """
+        length = len(next(iter(columns.values()), ()))
+        rule = data_type.get_rule(action)
+        if rule is None:
+            logger.warning("No privacy rule for %s on %s", action, data_type.uid)
+            return {name: [] for name in columns}
+        
+        level = rule.level
+        user = context.user
+        logged_in = user is not None
+        user_id = (user.get("uid") or user.get("id")) if logged_in else None
+        
+        if level == PrivacyLevel.PUBLIC or (level == PrivacyLevel.LOGGED_IN and logged_in):
+            mask = None
+        elif level in (PrivacyLevel.PRIVATE, PrivacyLevel.CREATOR_ONLY) and logged_in:
+            creators = _coalesce_columns(columns, ROW_CREATOR_KEYS, length)
+            mask = list(map(operator.eq, creators, repeat(user_id)))
+        elif level == PrivacyLevel.CUSTOM:
+            names = list(columns)
+            evaluate = self._evaluate_custom_rule
+            deny = PermissionDecision.DENY
+            mask = [
+                evaluate(rule, dict(zip(names, row)), context).decision is not deny
+                for row in zip(*columns.values())
+            ]
+        else:
+            # Unauthenticated creator/logged-in rules, unknown levels
+            return {name: [] for name in columns}
         
-        for entity in entities:
-            permission = self.check(data_type, action, entity, context)
-            if permission.is_allowed:
-                filtered = self.filter_fields(data_type, entity, context)
-                result.append(filtered)
+        if mask is not None:
+            columns = {name: list(compress(values, mask)) for name, values in columns.items()}
+            length = sum(mask)
         
+        plan = _field_plan(data_type)
+        codes = dict(plan.entries)
+        result: Dict[str, List[Any]] = {}
+        is_creator: Optional[List[bool]] = None
+        for name, values in columns.items():
+            code = FIELD_ALWAYS if name in SYSTEM_FIELDS else codes.get(name)
+            if code == FIELD_ALWAYS or (code == FIELD_LOGGED_IN and logged_in):
+                result[name] = values
+            elif code == FIELD_CREATOR_ONLY and logged_in:
+                if is_creator is None:
+                    creators = _coalesce_columns(columns, FIELD_CREATOR_KEYS, length)
+                    is_creator = list(map(operator.eq, creators, repeat(user_id)))
+                result[name] = [value if mine else None for value, mine in zip(values, is_creator)]
         return result
@@ -5,8 +5,8 @@ Simple RBAC implementation for workflow execution permissions.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Set, Optional
-from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, List, Set, Optional
+from dataclasses import dataclass
 from enum import Enum
 import logging
 
@@ -50,13 +50,28 @@ class Permission(str, Enum):
 
 @dataclass
 class Role:
-    """A role with a set of permissions."""
+    """
+    A role with a set of permissions.
+    
+    permissions is stored as a frozenset, so it can only change by being
+    rebound (grant/revoke do this), and every rebind bumps the generation.
+    """
     uid: str
     name: str
     description: Optional[str] = None
-    permissions: Set[Permission] = field(default_factory=set)
+    permissions: FrozenSet[Permission] = frozenset()
     is_system: bool = False  # System roles cannot be modified
     
+    # Bumped whenever any role's permissions change, so cached permission
+    # unions can tell they are stale
+    generation: ClassVar[int] = 0
+    
+    def __setattr__(self, name: str, value) -> None:
+        if name == "permissions":
+            value = frozenset(value)
+            Role.generation += 1
+        object.__setattr__(self, name, value)
+    
     def has_permission(self, permission: Permission) -> bool:
         """Check if role has a permission."""
         return permission in self.permissions
@@ -65,13 +80,13 @@ class Role:
         """Grant a permission to this role."""
         if self.is_system:
             raise ValueError("Cannot modify system role")
-        self.permissions.add(permission)
+        self.permissions = self.permissions | {permission}
     
     def revoke(self, permission: Permission) -> None:
         """Revoke a permission from this role."""
         if self.is_system:
             raise ValueError("Cannot modify system role")
-        self.permissions.discard(permission)
+        self.permissions = self.permissions - {permission}
 
 
 # =============================================================================
@@ -82,7 +97,7 @@ ROLE_ADMIN = Role(
     uid="role_admin",
     name="Administrator",
     description="Full system access",
-    permissions=set(Permission),  # All permissions
+    permissions=frozenset(Permission),  # All permissions
     is_system=True,
 )
 
@@ -138,6 +153,11 @@ class RBACManager:
         
         # User -> Role assignments
         self._user_roles: Dict[str, Set[str]] = {}
+        
+        # User -> union of their roles' permissions, filled lazily and
+        # invalidated on assignment changes or any role grant/revoke
+        self._user_perms_cache: Dict[str, FrozenSet[Permission]] = {}
+        self._cache_generation = Role.generation
     
     def get_role(self, role_uid: str) -> Optional[Role]:
         """Get a role by UID."""
@@ -150,7 +170,7 @@ class RBACManager:
         permissions: Set[Permission],
         description: Optional[str] = None,
     ) -> Role:
-        """Create a new custom role."""
+        """Create a new custom role (permissions are copied into a frozenset)."""
         if uid in self._roles:
             raise ValueError(f"Role already exists: {uid}")
         
@@ -158,7 +178,7 @@ class RBACManager:
             uid=uid,
             name=name,
             description=description,
-            permissions=permissions,
+            permissions=frozenset(permissions),
             is_system=False,
         )
         self._roles[uid] = role
@@ -177,6 +197,7 @@ class RBACManager:
         # Remove from all user assignments
         for roles in self._user_roles.values():
             roles.discard(role_uid)
+        self._user_perms_cache.clear()
         
         return True
     
@@ -189,24 +210,31 @@ class RBACManager:
             self._user_roles[user_uid] = set()
         
         self._user_roles[user_uid].add(role_uid)
-        logger.info(f"Assigned role {role_uid} to user {user_uid}")
+        self._user_perms_cache.pop(user_uid, None)
+        logger.info("Assigned role %s to user %s", role_uid, user_uid)
     
     def revoke_role(self, user_uid: str, role_uid: str) -> None:
         """Revoke a role from a user."""
         if user_uid in self._user_roles:
             self._user_roles[user_uid].discard(role_uid)
-            logger.info(f"Revoked role {role_uid} from user {user_uid}")
+            self._user_perms_cache.pop(user_uid, None)
+            logger.info("Revoked role %s from user %s", role_uid, user_uid)
     
     def get_user_roles(self, user_uid: str) -> List[Role]:
         """Get all roles assigned to a user."""
         role_uids = self._user_roles.get(user_uid, set())
         return [self._roles[uid] for uid in role_uids if uid in self._roles]
     
-    def get_user_permissions(self, user_uid: str) -> Set[Permission]:
+    def get_user_permissions(self, user_uid: str) -> FrozenSet[Permission]:
         """Get all permissions for a user (union of all role permissions)."""
-        permissions: Set[Permission] = set()
-        for role in self.get_user_roles(user_uid):
-            permissions.update(role.permissions)
+        if self._cache_generation != Role.generation:
+            self._user_perms_cache.clear()
+            self._cache_generation = Role.generation
+        
+        permissions = self._user_perms_cache.get(user_uid)
+        if permissions is None:
+            permissions = frozenset().union(*(role.permissions for role in self.get_user_roles(user_uid)))
+            self._user_perms_cache[user_uid] = permissions
         return permissions
     
     def check_permission(self, user_uid: str, permission: Permission) -> bool:
@@ -1,5 +1,7 @@
 """OrionX Persistence Module - Execution state storage."""
 
+from functools import lru_cache
+
 from .base import ExecutionStore
 from .memory import InMemoryExecutionStore
 from .sqlite import SQLiteExecutionStore
@@ -11,10 +13,14 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_execution_store() -> ExecutionStore:
     """
     Get the configured execution store based on environment.
     
+    The store is built once and shared; call get_execution_store.cache_clear()
+    after changing the persistence configuration.
+    
     Returns the appropriate store based on ORIONX_PERSISTENCE_BACKEND:
     - memory: In-memory (default for testing)
     - sqlite: SQLite file-based (default for production)
@@ -34,6 +40,14 @@ def get_execution_store() -> ExecutionStore:
             url=config.persistence.redis_url,
             prefix=config.persistence.redis_prefix,
             ttl=config.persistence.redis_ttl_seconds,
+            cache_reads=config.persistence.redis_cache_reads,
         )
     else:
         return InMemoryExecutionStore()
+
+
+async def close_execution_store() -> None:
+    """Close the shared store, if one was built, and drop it from the cache."""
+    if get_execution_store.cache_info().currsize:
+        await get_execution_store().aclose()
+    get_execution_store.cache_clear()
@@ -10,6 +10,33 @@ from typing import List, Optional
 from datetime import datetime
 
 from ..schemas.execution import ExecutionStatus
+from ..utils.serialization import dumps_bytes
+
+
+_fromisoformat = datetime.fromisoformat
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a timestamp written by to_dict() (or a SQLite row); None/empty -> None.
+    
+    datetime.fromisoformat is implemented in C and already takes the fast
+    path for the canonical YYYY-MM-DDTHH:MM:SS[.ffffff] shape, so it is used
+    directly rather than slicing fields out by hand.
+    """
+    return _fromisoformat(value) if value else None
+
+
+# Status values to members; a dict hit skips Enum.__call__
+_STATUS_INTERN = {status.value: status for status in ExecutionStatus}
+
+
+def parse_status(value: str) -> ExecutionStatus:
+    """Get the ExecutionStatus member for a stored status value."""
+    try:
+        return _STATUS_INTERN[value]
+    except KeyError:
+        return ExecutionStatus(value)
 
 
 class ExecutionRecord:
@@ -18,6 +45,19 @@ class ExecutionRecord:
     
     Separate from ExecutionLog to allow JSON serialization.
     """
+    __slots__ = (
+        "execution_id",
+        "workflow_uid",
+        "user_uid",
+        "status",
+        "started_at",
+        "completed_at",
+        "step_logs",
+        "error",
+        "input_snapshot",
+        "output",
+    )
+    
     def __init__(
         self,
         execution_id: str,
@@ -57,6 +97,15 @@ class ExecutionRecord:
             "output": self.output,
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to JSON bytes in the to_dict() layout.
+        
+        Datetimes and the status enum are handed to the encoder as-is
+        (orjson writes them natively), skipping the isoformat() calls.
+        """
+        return dumps_bytes({name: getattr(self, name) for name in self.__slots__})
+    
     @classmethod
     def from_dict(cls, data: dict) -> "ExecutionRecord":
         """Create from dictionary."""
@@ -64,9 +113,9 @@ class ExecutionRecord:
             execution_id=data["execution_id"],
             workflow_uid=data["workflow_uid"],
             user_uid=data.get("user_uid"),
-            status=ExecutionStatus(data["status"]),
-            started_at=datetime.fromisoformat(data["started_at"]),
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            status=parse_status(data["status"]),
+            started_at=_fromisoformat(data["started_at"]),
+            completed_at=parse_timestamp(data.get("completed_at")),
             step_logs=data.get("step_logs", []),
             error=data.get("error"),
             input_snapshot=data.get("input_snapshot"),
@@ -139,3 +188,7 @@ class ExecutionStore(ABC):
         """List recent executions for a user."""
         all_records = await self.list_active()
         return [r for r in all_records if r.user_uid == user_uid][:limit]
+    
+    async def aclose(self) -> None:
+        """Release connections held by the store (no-op by default)."""
+        pass
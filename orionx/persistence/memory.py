@@ -5,12 +5,17 @@ Fast, non-persistent storage for testing and development.
 """
 
 from typing import Dict, List, Optional
+from collections import defaultdict
 from datetime import datetime
+from itertools import chain, islice
 
-from .base import ExecutionStore, ExecutionRecord
+from .base import ExecutionStore, ExecutionRecord, parse_status
 from ..schemas.execution import ExecutionStatus
 
 
+ACTIVE_STATUSES = (ExecutionStatus.PENDING, ExecutionStatus.RUNNING)
+
+
 class InMemoryExecutionStore(ExecutionStore):
     """
     In-memory execution store (no persistence).
@@ -25,10 +30,32 @@ class InMemoryExecutionStore(ExecutionStore):
     
     def __init__(self):
         self._records: Dict[str, ExecutionRecord] = {}
+        
+        # Secondary indexes (dicts used as insertion-ordered id sets), so
+        # listings touch only matching records. The indexed status is kept
+        # separately, since callers may mutate a record before save().
+        self._status_of: Dict[str, ExecutionStatus] = {}
+        self._by_status: Dict[ExecutionStatus, Dict[str, None]] = defaultdict(dict)
+        self._by_workflow: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_user: Dict[Optional[str], Dict[str, None]] = defaultdict(dict)
     
     async def save(self, record: ExecutionRecord) -> None:
         """Save or update an execution record."""
-        self._records[record.execution_id] = record
+        execution_id = record.execution_id
+        previous = self._records.get(execution_id)
+        if previous is not None:
+            self._unindex(previous)
+        self._records[execution_id] = record
+        self._status_of[execution_id] = record.status
+        self._by_status[record.status][execution_id] = None
+        self._by_workflow[record.workflow_uid][execution_id] = None
+        self._by_user[record.user_uid][execution_id] = None
+    
+    def _unindex(self, record: ExecutionRecord) -> None:
+        execution_id = record.execution_id
+        self._by_status[self._status_of.pop(execution_id)].pop(execution_id, None)
+        self._by_workflow[record.workflow_uid].pop(execution_id, None)
+        self._by_user[record.user_uid].pop(execution_id, None)
     
     async def get(self, execution_id: str) -> Optional[ExecutionRecord]:
         """Get an execution record by ID."""
@@ -36,19 +63,32 @@ class InMemoryExecutionStore(ExecutionStore):
     
     async def delete(self, execution_id: str) -> bool:
         """Delete an execution record."""
-        if execution_id in self._records:
-            del self._records[execution_id]
-            return True
-        return False
+        record = self._records.pop(execution_id, None)
+        if record is None:
+            return False
+        self._unindex(record)
+        return True
     
     async def list_by_status(self, status: ExecutionStatus) -> List[ExecutionRecord]:
         """List executions with a given status."""
-        return [r for r in self._records.values() if r.status == status]
+        return [self._records[eid] for eid in self._by_status.get(status, ())]
     
     async def list_active(self) -> List[ExecutionRecord]:
         """List all active (running/pending) executions."""
-        active_statuses = {ExecutionStatus.PENDING, ExecutionStatus.RUNNING}
-        return [r for r in self._records.values() if r.status in active_statuses]
+        return [
+            self._records[eid]
+            for eid in chain.from_iterable(self._by_status.get(status, ()) for status in ACTIVE_STATUSES)
+        ]
+    
+    async def list_for_workflow(self, workflow_uid: str, limit: int = 100) -> List[ExecutionRecord]:
+        """List recent executions for a workflow (newest first)."""
+        ids = self._by_workflow.get(workflow_uid, {})
+        return [self._records[eid] for eid in islice(reversed(ids), limit)]
+    
+    async def list_for_user(self, user_uid: str, limit: int = 100) -> List[ExecutionRecord]:
+        """List recent executions for a user (newest first)."""
+        ids = self._by_user.get(user_uid, {})
+        return [self._records[eid] for eid in islice(reversed(ids), limit)]
     
     async def update_status(
         self,
@@ -57,9 +97,16 @@ class InMemoryExecutionStore(ExecutionStore):
         error: Optional[dict] = None,
         completed_at: Optional[datetime] = None,
     ) -> bool:
-        """Update execution status."""
+        """Update execution status (a raw status value is coerced to the enum)."""
         record = self._records.get(execution_id)
         if record:
+            if type(status) is not ExecutionStatus:
+                status = parse_status(status)
+            old_status = self._status_of[execution_id]
+            if status != old_status:
+                del self._by_status[old_status][execution_id]
+                self._by_status[status][execution_id] = None
+                self._status_of[execution_id] = status
             record.status = status
             if error is not None:
                 record.error = error
@@ -83,3 +130,7 @@ class InMemoryExecutionStore(ExecutionStore):
     def clear(self) -> None:
         """Clear all records (for testing)."""
         self._records.clear()
+        self._status_of.clear()
+        self._by_status.clear()
+        self._by_workflow.clear()
+        self._by_user.clear()
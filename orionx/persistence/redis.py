@@ -6,16 +6,58 @@ For multi-server deployments and high availability.
 """
 
 from typing import List, Optional
+from collections import OrderedDict
 from datetime import datetime
-import json
 import logging
 
-from .base import ExecutionStore, ExecutionRecord
+from .base import ExecutionStore, ExecutionRecord, parse_status
 from ..schemas.execution import ExecutionStatus
+from ..utils.serialization import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
 
+# Record fields stored in the execution hash, one JSON value each;
+# step_logs live in a separate list so appends never rewrite the record
+HASH_FIELDS = tuple(name for name in ExecutionRecord.__slots__ if name != "step_logs")
+
+# Executions whose last-known status is remembered (with cache_reads)
+STATUS_CACHE_SIZE = 1024
+
+# Writes to an existing record run as scripts, so a record that expired or
+# was deleted is never recreated as a partial hash or an orphan log list.
+# The status sets are derived from the stored status, so they are not
+# declared in KEYS; the store assumes a single Redis node.
+
+# KEYS: record hash, log list
+# ARGV: ttl, status set key prefix, execution id, new status, field/value pairs...
+UPDATE_STATUS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local old = redis.call('HGET', KEYS[1], 'status')
+redis.call('HSET', KEYS[1], unpack(ARGV, 5))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+if old then
+    redis.call('SREM', ARGV[2] .. cjson.decode(old), ARGV[3])
+end
+redis.call('SADD', ARGV[2] .. ARGV[4], ARGV[3])
+return 1
+"""
+
+# KEYS: record hash, log list
+# ARGV: ttl, JSON step log
+APPEND_STEP_LOG_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+
+
 class RedisExecutionStore(ExecutionStore):
     """
     Redis-backed execution store.
@@ -31,6 +73,23 @@ class RedisExecutionStore(ExecutionStore):
     - High-availability requirements
     - Large-scale workflow processing
     
+    Layout:
+    - {prefix}exec:{id}: hash of record fields, one JSON value each
+    - {prefix}exec-logs:{id}: list of JSON step logs
+    - {prefix}exec-status:{status}: set of execution ids
+    
+    These names differ from the earlier single-string layout
+    ({prefix}execution:{id}, {prefix}status:{status}), so records left
+    by older versions are never read as hashes; they expire on their TTL.
+    
+    update_status() and append_step_log() are one script call each, which
+    only writes if the record still exists.
+    
+    With cache_reads, the store remembers the last status it wrote or read
+    for recent executions, so delete() needs no HGET. Entries are dropped
+    when a write finds the record gone. Only enable it when this process
+    is the sole writer of the executions it touches.
+    
     Requires:
     - redis package: pip install redis
     """
@@ -40,11 +99,17 @@ class RedisExecutionStore(ExecutionStore):
         url: Optional[str] = None,
         prefix: str = "orionx:",
         ttl: int = 86400 * 7,  # 7 days
+        cache_reads: bool = False,
     ):
         self.prefix = prefix
+        self._status_prefix = f"{prefix}exec-status:"
         self.ttl = ttl
         self._redis = None
         self._url = url or "redis://localhost:6379/0"
+        self.cache_reads = cache_reads
+        self._status_cache: "OrderedDict[str, ExecutionStatus]" = OrderedDict()
+        self._update_status_script = None
+        self._append_step_log_script = None
         
     def _get_redis(self):
         """Lazy-load Redis connection."""
@@ -59,36 +124,96 @@ class RedisExecutionStore(ExecutionStore):
                 )
         return self._redis
     
+    async def aclose(self) -> None:
+        """Close the Redis client and its connection pool."""
+        client, self._redis = self._redis, None
+        self._update_status_script = self._append_step_log_script = None
+        if client is not None:
+            # aclose() from redis 5; earlier clients only have close()
+            await (getattr(client, "aclose", None) or client.close)()
+    
     def _key(self, execution_id: str) -> str:
         """Generate Redis key for execution."""
-        return f"{self.prefix}execution:{execution_id}"
+        return f"{self.prefix}exec:{execution_id}"
+    
+    def _logs_key(self, execution_id: str) -> str:
+        """Generate Redis key for an execution's step log list."""
+        return f"{self.prefix}exec-logs:{execution_id}"
     
     def _status_key(self, status: ExecutionStatus) -> str:
         """Generate Redis key for status index."""
-        return f"{self.prefix}status:{status.value}"
+        return self._status_prefix + status.value
+    
+    def _scripts(self):
+        """Register the write scripts on first use."""
+        if self._update_status_script is None:
+            redis = self._get_redis()
+            self._update_status_script = redis.register_script(UPDATE_STATUS_SCRIPT)
+            self._append_step_log_script = redis.register_script(APPEND_STEP_LOG_SCRIPT)
+        return self._update_status_script, self._append_step_log_script
+    
+    def _remember(self, execution_id: str, status: ExecutionStatus) -> None:
+        """Record an execution's current status (LRU; no-op without cache_reads)."""
+        if not self.cache_reads:
+            return
+        cache = self._status_cache
+        cache[execution_id] = status
+        cache.move_to_end(execution_id)
+        if len(cache) > STATUS_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    async def _current_status(self, execution_id: str) -> Optional[ExecutionStatus]:
+        """Get an execution's status, from the cache when possible."""
+        status = self._status_cache.get(execution_id)
+        if status is not None:
+            return status
+        raw = await self._get_redis().hget(self._key(execution_id), "status")
+        if raw is None:
+            return None
+        status = parse_status(loads(raw))
+        self._remember(execution_id, status)
+        return status
     
     async def save(self, record: ExecutionRecord) -> None:
         """Save or update an execution record."""
         redis = self._get_redis()
-        key = self._key(record.execution_id)
+        execution_id = record.execution_id
+        key = self._key(execution_id)
+        logs_key = self._logs_key(execution_id)
         
-        # Store as JSON
-        data = json.dumps(record.to_dict())
-        await redis.setex(key, self.ttl, data)
+        fields = {name: dumps_bytes(getattr(record, name)) for name in HASH_FIELDS}
         
-        # Update status index
-        status_key = self._status_key(record.status)
-        await redis.sadd(status_key, record.execution_id)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=fields)
+            pipe.delete(logs_key)
+            if record.step_logs:
+                pipe.rpush(logs_key, *map(dumps_bytes, record.step_logs))
+            pipe.expire(key, self.ttl)
+            pipe.expire(logs_key, self.ttl)
+            pipe.sadd(self._status_key(record.status), execution_id)
+            await pipe.execute()
+        self._remember(execution_id, record.status)
     
     async def get(self, execution_id: str) -> Optional[ExecutionRecord]:
         """Get an execution record by ID."""
+        record = (await self._get_many([execution_id]))[0]
+        if record is not None:
+            self._remember(execution_id, record.status)
+        return record
+    
+    async def _get_many(self, execution_ids: List[str]) -> List[Optional[ExecutionRecord]]:
+        """Fetch records (None where missing) with one pipelined round trip."""
         redis = self._get_redis()
-        key = self._key(execution_id)
+        async with redis.pipeline(transaction=False) as pipe:
+            for execution_id in execution_ids:
+                pipe.hgetall(self._key(execution_id))
+                pipe.lrange(self._logs_key(execution_id), 0, -1)
+            replies = await pipe.execute()
         
-        data = await redis.get(key)
-        if data:
-            return ExecutionRecord.from_dict(json.loads(data))
-        return None
+        return [
+            _decode_record(fields, logs) if fields else None
+            for fields, logs in zip(replies[::2], replies[1::2])
+        ]
     
     async def delete(self, execution_id: str) -> bool:
         """Delete an execution record."""
@@ -96,12 +221,14 @@ class RedisExecutionStore(ExecutionStore):
         key = self._key(execution_id)
         
         # Get current status to remove from index
-        record = await self.get(execution_id)
-        if record:
-            status_key = self._status_key(record.status)
-            await redis.srem(status_key, execution_id)
-        
-        result = await redis.delete(key)
+        status = await self._current_status(execution_id)
+        self._status_cache.pop(execution_id, None)
+        async with redis.pipeline(transaction=False) as pipe:
+            if status is not None:
+                pipe.srem(self._status_key(status), execution_id)
+            pipe.delete(self._logs_key(execution_id))
+            pipe.delete(key)
+            *_, result = await pipe.execute()
         return result > 0
     
     async def list_by_status(self, status: ExecutionStatus) -> List[ExecutionRecord]:
@@ -109,18 +236,24 @@ class RedisExecutionStore(ExecutionStore):
         redis = self._get_redis()
         status_key = self._status_key(status)
         
-        execution_ids = await redis.smembers(status_key)
-        records = []
+        execution_ids = [
+            exec_id.decode() if isinstance(exec_id, bytes) else exec_id
+            for exec_id in await redis.smembers(status_key)
+        ]
+        if not execution_ids:
+            return []
         
-        for exec_id in execution_ids:
-            if isinstance(exec_id, bytes):
-                exec_id = exec_id.decode()
-            record = await self.get(exec_id)
+        records = []
+        stale = []
+        for exec_id, record in zip(execution_ids, await self._get_many(execution_ids)):
             if record:
                 records.append(record)
             else:
-                # Clean up stale index entry
-                await redis.srem(status_key, exec_id)
+                stale.append(exec_id)
+        
+        if stale:
+            # Clean up expired index entries in one command
+            await redis.srem(status_key, *stale)
         
         return records
     
@@ -137,27 +270,23 @@ class RedisExecutionStore(ExecutionStore):
         error: Optional[dict] = None,
         completed_at: Optional[datetime] = None,
     ) -> bool:
-        """Update execution status."""
-        record = await self.get(execution_id)
-        if not record:
-            return False
+        """Update execution status (only the changed hash fields are written)."""
+        if type(status) is not ExecutionStatus:
+            status = parse_status(status)
         
-        redis = self._get_redis()
-        
-        # Remove from old status index
-        old_status_key = self._status_key(record.status)
-        await redis.srem(old_status_key, execution_id)
-        
-        # Update record
-        record.status = status
+        args = [self.ttl, self._status_prefix, execution_id, status.value]
+        args += ["status", dumps_bytes(status)]
         if error is not None:
-            record.error = error
+            args += ["error", dumps_bytes(error)]
         if completed_at is not None:
-            record.completed_at = completed_at
-        
-        # Save updated record
-        await self.save(record)
+            args += ["completed_at", dumps_bytes(completed_at)]
         
+        update_status, _ = self._scripts()
+        keys = [self._key(execution_id), self._logs_key(execution_id)]
+        if not await update_status(keys=keys, args=args):
+            self._status_cache.pop(execution_id, None)
+            return False
+        self._remember(execution_id, status)
         return True
     
     async def append_step_log(
@@ -165,12 +294,20 @@ class RedisExecutionStore(ExecutionStore):
         execution_id: str,
         step_log: dict,
     ) -> bool:
-        """Append a step log to an execution."""
-        record = await self.get(execution_id)
-        if not record:
+        """Append a step log to an execution (one RPUSH; the record is not rewritten)."""
+        _, append_step_log = self._scripts()
+        keys = [self._key(execution_id), self._logs_key(execution_id)]
+        if not await append_step_log(keys=keys, args=[self.ttl, dumps_bytes(step_log)]):
+            self._status_cache.pop(execution_id, None)
             return False
-        
-        record.step_logs.append(step_log)
-        await self.save(record)
-        
         return True
+
+
+def _decode_record(fields: dict, logs: List[bytes]) -> ExecutionRecord:
+    """Rebuild a record from its hash fields and step log list."""
+    data = {
+        (name.decode() if isinstance(name, bytes) else name): loads(value)
+        for name, value in fields.items()
+    }
+    data["step_logs"] = [loads(log) for log in logs]
+    return ExecutionRecord.from_dict(data)
@@ -5,15 +5,46 @@ File-based persistent storage for production use.
 Addresses audit finding: "Zero persistence for workflow execution state"
 """
 
-import json
 import sqlite3
 import asyncio
-from typing import List, Optional
+import threading
+from typing import Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-from .base import ExecutionStore, ExecutionRecord
+from .base import ExecutionStore, ExecutionRecord, parse_status
 from ..schemas.execution import ExecutionStatus
+from ..utils.serialization import dumps, loads
+
+
+# Append one encoded entry to the step_logs array in a single statement.
+# JSON1's json_insert is used where available (SQLite >= 3.31 with JSON1);
+# otherwise, since step_logs is always a compact JSON array written by
+# dumps(), the entry is spliced in by replacing the closing bracket.
+_APPEND_STEP_LOG_JSON1_SQL = """
+    UPDATE executions
+    SET step_logs = json_insert(step_logs, '$[#]', json(:entry)),
+        updated_at = :now
+    WHERE execution_id = :execution_id
+"""
+
+_APPEND_STEP_LOG_SPLICE_SQL = """
+    UPDATE executions
+    SET step_logs = CASE
+            WHEN step_logs = '[]' THEN '[' || :entry || ']'
+            ELSE substr(step_logs, 1, length(step_logs) - 1) || ',' || :entry || ']'
+        END,
+        updated_at = :now
+    WHERE execution_id = :execution_id
+"""
+
+
+def _has_json1(conn: sqlite3.Connection) -> bool:
+    """Check for JSON1 with array-append paths ('$[#]')."""
+    try:
+        return conn.execute("SELECT json_insert('[]', '$[#]', 1)").fetchone()[0] == "[1]"
+    except sqlite3.OperationalError:
+        return False
 
 
 class SQLiteExecutionStore(ExecutionStore):
@@ -25,6 +56,7 @@ class SQLiteExecutionStore(ExecutionStore):
     - Automatic table creation
     - JSON serialization for complex fields
     - Thread-safe via asyncio executor
+    - One long-lived WAL-mode connection per executor thread
     
     Use for:
     - Single-server production deployments
@@ -53,42 +85,98 @@ class SQLiteExecutionStore(ExecutionStore):
     CREATE INDEX IF NOT EXISTS idx_executions_user ON executions(user_uid);
     """
     
+    # Columns read back into an ExecutionRecord, in _row_to_record() order;
+    # rows are plain tuples (no Row factory)
+    RECORD_COLUMNS = (
+        "execution_id, workflow_uid, user_uid, status, started_at, "
+        "completed_at, step_logs, error, input_snapshot, output"
+    )
+    
+    # Upsert rather than INSERT OR REPLACE: an existing row is updated in
+    # place instead of deleted and reinserted, so created_at survives and
+    # index entries are only touched for columns whose values change
+    SAVE_SQL = """
+    INSERT INTO executions
+    (execution_id, workflow_uid, user_uid, status, started_at,
+     completed_at, step_logs, error, input_snapshot, output, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(execution_id) DO UPDATE SET
+        workflow_uid = excluded.workflow_uid,
+        user_uid = excluded.user_uid,
+        status = excluded.status,
+        started_at = excluded.started_at,
+        completed_at = excluded.completed_at,
+        step_logs = excluded.step_logs,
+        error = excluded.error,
+        input_snapshot = excluded.input_snapshot,
+        output = excluded.output,
+        updated_at = excluded.updated_at
+    """
+    
+    # Per-connection settings; WAL lets readers run alongside the writer
+    CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    """
+    
     def __init__(self, db_path: str = "./orionx_executions.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
         self._ensure_db()
     
     def _ensure_db(self) -> None:
         """Ensure database and tables exist."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.executescript(self.CREATE_TABLE_SQL)
+            self._append_sql = _APPEND_STEP_LOG_JSON1_SQL if _has_json1(conn) else _APPEND_STEP_LOG_SPLICE_SQL
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a new database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Get this thread's database connection, opening it on first use.
+        
+        Connections stay open for the store's lifetime, so operations skip
+        the connect and PRAGMA setup; `with conn:` still commits or rolls
+        back each operation.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() may run on any thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.executescript(self.CONNECTION_PRAGMAS)
+            self._local.conn = conn
+            self._connections.append(conn)
         return conn
     
+    def close(self) -> None:
+        """Close all connections opened by this store."""
+        connections, self._connections = self._connections, []
+        self._local = threading.local()
+        for conn in connections:
+            conn.close()
+    
+    async def aclose(self) -> None:
+        """Close all connections opened by this store."""
+        self.close()
+    
     async def save(self, record: ExecutionRecord) -> None:
         """Save or update an execution record."""
         def _save():
             with self._get_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO executions 
-                    (execution_id, workflow_uid, user_uid, status, started_at, 
-                     completed_at, step_logs, error, input_snapshot, output, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                conn.execute(self.SAVE_SQL, (
                     record.execution_id,
                     record.workflow_uid,
                     record.user_uid,
                     record.status.value,
                     record.started_at.isoformat(),
                     record.completed_at.isoformat() if record.completed_at else None,
-                    json.dumps(record.step_logs),
-                    json.dumps(record.error) if record.error else None,
-                    json.dumps(record.input_snapshot) if record.input_snapshot else None,
-                    json.dumps(record.output) if record.output else None,
+                    dumps(record.step_logs),
+                    dumps(record.error) if record.error else None,
+                    dumps(record.input_snapshot) if record.input_snapshot else None,
+                    dumps(record.output) if record.output else None,
                     datetime.utcnow().isoformat(),
                 ))
         
@@ -99,7 +187,7 @@ class SQLiteExecutionStore(ExecutionStore):
         def _get():
             with self._get_connection() as conn:
                 row = conn.execute(
-                    "SELECT * FROM executions WHERE execution_id = ?",
+                    f"SELECT {self.RECORD_COLUMNS} FROM executions WHERE execution_id = ?",
                     (execution_id,)
                 ).fetchone()
                 return self._row_to_record(row) if row else None
@@ -123,9 +211,9 @@ class SQLiteExecutionStore(ExecutionStore):
         def _list():
             with self._get_connection() as conn:
                 rows = conn.execute(
-                    "SELECT * FROM executions WHERE status = ? ORDER BY started_at DESC",
+                    f"SELECT {self.RECORD_COLUMNS} FROM executions WHERE status = ? ORDER BY started_at DESC",
                     (status.value,)
-                ).fetchall()
+                )
                 return [self._row_to_record(row) for row in rows]
         
         return await asyncio.get_event_loop().run_in_executor(None, _list)
@@ -135,9 +223,9 @@ class SQLiteExecutionStore(ExecutionStore):
         def _list():
             with self._get_connection() as conn:
                 rows = conn.execute(
-                    "SELECT * FROM executions WHERE status IN (?, ?) ORDER BY started_at DESC",
+                    f"SELECT {self.RECORD_COLUMNS} FROM executions WHERE status IN (?, ?) ORDER BY started_at DESC",
                     (ExecutionStatus.PENDING.value, ExecutionStatus.RUNNING.value)
-                ).fetchall()
+                )
                 return [self._row_to_record(row) for row in rows]
         
         return await asyncio.get_event_loop().run_in_executor(None, _list)
@@ -155,7 +243,7 @@ class SQLiteExecutionStore(ExecutionStore):
                 if error is not None and completed_at is not None:
                     cursor = conn.execute(
                         "UPDATE executions SET status = ?, error = ?, completed_at = ?, updated_at = ? WHERE execution_id = ?",
-                        (status.value, json.dumps(error), completed_at.isoformat(), datetime.utcnow().isoformat(), execution_id)
+                        (status.value, dumps(error), completed_at.isoformat(), datetime.utcnow().isoformat(), execution_id)
                     )
                 elif completed_at is not None:
                     cursor = conn.execute(
@@ -165,7 +253,7 @@ class SQLiteExecutionStore(ExecutionStore):
                 elif error is not None:
                     cursor = conn.execute(
                         "UPDATE executions SET status = ?, error = ?, updated_at = ? WHERE execution_id = ?",
-                        (status.value, json.dumps(error), datetime.utcnow().isoformat(), execution_id)
+                        (status.value, dumps(error), datetime.utcnow().isoformat(), execution_id)
                     )
                 else:
                     cursor = conn.execute(
@@ -181,24 +269,19 @@ class SQLiteExecutionStore(ExecutionStore):
         execution_id: str,
         step_log: dict,
     ) -> bool:
-        """Append a step log to an execution."""
+        """
+        Append a step log to an execution.
+        
+        The encoded entry is appended to the stored JSON array in SQL, so
+        an append neither reads nor re-encodes the existing step logs in Python.
+        """
+        entry = dumps(step_log)
+        
         def _append():
             with self._get_connection() as conn:
-                # Get current step_logs
-                row = conn.execute(
-                    "SELECT step_logs FROM executions WHERE execution_id = ?",
-                    (execution_id,)
-                ).fetchone()
-                
-                if not row:
-                    return False
-                
-                current_logs = json.loads(row["step_logs"])
-                current_logs.append(step_log)
-                
                 cursor = conn.execute(
-                    "UPDATE executions SET step_logs = ?, updated_at = ? WHERE execution_id = ?",
-                    (json.dumps(current_logs), datetime.utcnow().isoformat(), execution_id)
+                    self._append_sql,
+                    {"entry": entry, "now": datetime.utcnow().isoformat(), "execution_id": execution_id}
                 )
                 return cursor.rowcount > 0
         
@@ -209,9 +292,9 @@ class SQLiteExecutionStore(ExecutionStore):
         def _list():
             with self._get_connection() as conn:
                 rows = conn.execute(
-                    "SELECT * FROM executions WHERE workflow_uid = ? ORDER BY started_at DESC LIMIT ?",
+                    f"SELECT {self.RECORD_COLUMNS} FROM executions WHERE workflow_uid = ? ORDER BY started_at DESC LIMIT ?",
                     (workflow_uid, limit)
-                ).fetchall()
+                )
                 return [self._row_to_record(row) for row in rows]
         
         return await asyncio.get_event_loop().run_in_executor(None, _list)
@@ -221,24 +304,28 @@ class SQLiteExecutionStore(ExecutionStore):
         def _list():
             with self._get_connection() as conn:
                 rows = conn.execute(
-                    "SELECT * FROM executions WHERE user_uid = ? ORDER BY started_at DESC LIMIT ?",
+                    f"SELECT {self.RECORD_COLUMNS} FROM executions WHERE user_uid = ? ORDER BY started_at DESC LIMIT ?",
                     (user_uid, limit)
-                ).fetchall()
+                )
                 return [self._row_to_record(row) for row in rows]
         
         return await asyncio.get_event_loop().run_in_executor(None, _list)
     
-    def _row_to_record(self, row: sqlite3.Row) -> ExecutionRecord:
-        """Convert a database row to an ExecutionRecord."""
+    def _row_to_record(self, row: Tuple[Any, ...]) -> ExecutionRecord:
+        """Convert a RECORD_COLUMNS row tuple to an ExecutionRecord."""
+        (
+            execution_id, workflow_uid, user_uid, status, started_at,
+            completed_at, step_logs, error, input_snapshot, output,
+        ) = row
         return ExecutionRecord(
-            execution_id=row["execution_id"],
-            workflow_uid=row["workflow_uid"],
-            user_uid=row["user_uid"],
-            status=ExecutionStatus(row["status"]),
-            started_at=datetime.fromisoformat(row["started_at"]),
-            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-            step_logs=json.loads(row["step_logs"]),
-            error=json.loads(row["error"]) if row["error"] else None,
-            input_snapshot=json.loads(row["input_snapshot"]) if row["input_snapshot"] else None,
-            output=json.loads(row["output"]) if row["output"] else None,
+            execution_id=execution_id,
+            workflow_uid=workflow_uid,
+            user_uid=user_uid,
+            status=parse_status(status),
+            started_at=datetime.fromisoformat(started_at),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            step_logs=loads(step_logs),
+            error=loads(error) if error else None,
+            input_snapshot=loads(input_snapshot) if input_snapshot else None,
+            output=loads(output) if output else None,
         )
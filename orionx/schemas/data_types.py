@@ -6,8 +6,8 @@ Copied from OrionX with minimal changes.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from enum import Enum
 from uuid import uuid4
 
@@ -143,6 +143,13 @@ class DataType(BaseModel):
     # Soft delete
     soft_delete: bool = False
     
+    # PermissionGate's field access plan, built on first use
+    _field_plan: Optional[Any] = PrivateAttr(default=None)
+    
+    # Lookup indexes, built on first use as (signature, index)
+    _field_index: Optional[tuple] = PrivateAttr(default=None)
+    _rule_index: Optional[tuple] = PrivateAttr(default=None)
+    
     @field_validator("uid")
     @classmethod
     def validate_uid(cls, v: str) -> str:
@@ -150,16 +157,38 @@ class DataType(BaseModel):
             raise ValueError("DataType UID must start with 'type_'")
         return v
     
+    def field_signature(self) -> Tuple[Tuple[DataField, str, PrivacyLevel], ...]:
+        """
+        Get (field, name, privacy) for every field.
+        
+        Caches derived from the fields compare this to decide whether to
+        rebuild, so adding, removing or replacing a field, or renaming or
+        re-classifying one in place, is always picked up.
+        """
+        return tuple([(field, field.name, field.privacy) for field in self.fields])
+    
     def get_field(self, name: str) -> Optional[DataField]:
         """Get a field by name."""
-        for field in self.fields:
-            if field.name == name:
-                return field
-        return None
+        cached = self._field_index
+        signature = self.field_signature()
+        if cached is None or cached[0] != signature:
+            cached = (signature, _first_by(self.fields, "name"))
+            self._field_index = cached
+        return cached[1].get(name)
     
     def get_rule(self, action: PrivacyAction) -> Optional[PrivacyRule]:
         """Get the privacy rule for a specific action."""
-        for rule in self.privacy_rules:
-            if rule.action == action:
-                return rule
-        return None
+        cached = self._rule_index
+        signature = tuple([(rule, rule.action) for rule in self.privacy_rules])
+        if cached is None or cached[0] != signature:
+            cached = (signature, _first_by(self.privacy_rules, "action"))
+            self._rule_index = cached
+        return cached[1].get(action)
+
+
+def _first_by(items: List[Any], attr: str) -> Dict[Any, Any]:
+    """Index items by an attribute, keeping the first item per key (as a scan would)."""
+    index: Dict[Any, Any] = {}
+    for item in items:
+        index.setdefault(getattr(item, attr), item)
+    return index
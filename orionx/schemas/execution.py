@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from ..utils.compat import DATACLASS_SLOTS
+
 
 # =============================================================================
 # Execution Status
@@ -30,7 +32,7 @@ class ExecutionStatus(str, Enum):
 # Execution Context
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionContext:
     """
     Context for workflow execution.
@@ -60,28 +62,42 @@ class ExecutionContext:
     parent: Optional["ExecutionContext"] = None
     
     def get(self, name: str) -> Any:
-        """Get a named value from context."""
+        """
+        Get a named value from context.
+        
+        Looks in execution_state, input_params, then workflow_data, then up
+        the parent chain. The walk is a loop, and dicts shared with a child
+        (with_entity() shares input_params and workflow_data) are not
+        probed twice.
+        """
         # Check built-in contexts
         if name == "Current User":
             return self.user
         if name.startswith("This "):
             return self.current_entity
         
-        # Check execution state
-        if name in self.execution_state:
-            return self.execution_state[name]
-        
-        # Check input params
-        if name in self.input_params:
-            return self.input_params[name]
-        
-        # Check workflow data
-        if name in self.workflow_data:
-            return self.workflow_data[name]
-        
-        # Check parent
-        if self.parent:
-            return self.parent.get(name)
+        context = self
+        input_params = workflow_data = None
+        while context is not None:
+            # Check execution state
+            state = context.execution_state
+            if name in state:
+                return state[name]
+            
+            # Check input params
+            if context.input_params is not input_params:
+                input_params = context.input_params
+                if name in input_params:
+                    return input_params[name]
+            
+            # Check workflow data
+            if context.workflow_data is not workflow_data:
+                workflow_data = context.workflow_data
+                if name in workflow_data:
+                    return workflow_data[name]
+            
+            # Check parent
+            context = context.parent
         
         return None
     
@@ -110,7 +126,7 @@ class ExecutionContext:
 # Step Result
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StepResult:
     """
     Result of a single step execution.
@@ -122,23 +138,44 @@ class StepResult:
     started_at: datetime
     completed_at: Optional[datetime] = None
     duration_ms: Optional[int] = None
-    inputs: Dict[str, Any] = field(default_factory=dict)
+    inputs: Optional[Dict[str, Any]] = field(default_factory=dict)  # None when not recorded
     result: Optional[Any] = None
     error: Optional[str] = None
     skipped: bool = False
     skip_reason: Optional[str] = None
     
+    # Cached API summary (built on first to_summary() call)
+    _summary: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def success(self) -> bool:
         """Check if step completed successfully."""
         return self.error is None and not self.skipped
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """
+        Get the API summary dict for this step.
+        
+        Built once and reused, since a step is final by the time it is
+        recorded on the execution log. Callers must not mutate it.
+        """
+        if self._summary is None:
+            self._summary = {
+                "step_uid": self.step_uid,
+                "step_type": self.step_type,
+                "success": self.success,
+                "duration_ms": self.duration_ms,
+                "error": self.error,
+                "skipped": self.skipped,
+            }
+        return self._summary
 
 
 # =============================================================================
 # Workflow Result
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowResult:
     """
     Final result of workflow execution.
@@ -165,17 +202,7 @@ class WorkflowResult:
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "status": self.status.value,
-            "steps": [
-                {
-                    "step_uid": s.step_uid,
-                    "step_type": s.step_type,
-                    "success": s.success,
-                    "duration_ms": s.duration_ms,
-                    "error": s.error,
-                    "skipped": s.skipped,
-                }
-                for s in self.steps
-            ],
+            "steps": [s.to_summary() for s in self.steps],
             "output": self.output,
             "error": self.error,
         }
@@ -185,21 +212,21 @@ class WorkflowResult:
 # Execution Events
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionEvent:
     """Base class for execution events."""
     execution_id: str
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionStartedEvent(ExecutionEvent):
     """Emitted when workflow execution starts."""
     workflow_uid: str = ""
     user_uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StepCompletedEvent(ExecutionEvent):
     """Emitted when a step completes successfully."""
     step_uid: str = ""
@@ -207,21 +234,21 @@ class StepCompletedEvent(ExecutionEvent):
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StepFailedEvent(ExecutionEvent):
     """Emitted when a step fails."""
     step_uid: str = ""
     error: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowCompletedEvent(ExecutionEvent):
     """Emitted when workflow completes successfully."""
     status: ExecutionStatus = ExecutionStatus.COMPLETED
     output: Optional[Any] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowFailedEvent(ExecutionEvent):
     """Emitted when workflow fails."""
     error: str = ""
@@ -6,8 +6,8 @@ Refactored from OrionX to remove element_event, page_load, and other UI concepts
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from enum import Enum
 from uuid import uuid4
 
@@ -135,6 +135,9 @@ class WorkflowStep(BaseModel):
     max_retries: int = Field(default=0, ge=0, le=5)
     retry_delay_ms: int = Field(default=1000, ge=100, le=60000)
     
+    # Executor's compiled param plan, keyed by the params dict it was built from
+    _param_plan: Optional[Tuple[Dict[str, Any], Tuple]] = PrivateAttr(default=None)
+    
     @field_validator("uid")
     @classmethod
     def validate_uid(cls, v: str) -> str:
@@ -179,6 +182,9 @@ class Workflow(BaseModel):
     # Timeout for entire workflow (milliseconds)
     timeout_ms: int = Field(default=300000, ge=1000, le=3600000)  # 5 min default, 1 hour max
     
+    # Executor's CompiledWorkflow, built on first execution
+    _compiled: Optional[Any] = PrivateAttr(default=None)
+    
     @field_validator("uid")
     @classmethod
     def validate_uid(cls, v: str) -> str:
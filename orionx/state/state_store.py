@@ -166,7 +166,7 @@ class StateStore:
                 try:
                     callback(value)
                 except Exception as e:
-                    logger.error(f"Subscriber error for {key}: {e}")
+                    logger.error("Subscriber error for %s: %s", key, e)
     
     # =========================================================================
     # Batch Operations
@@ -247,7 +247,7 @@ class StateStore:
                 for key, value in values.items():
                     self.set(key, value, scope)
             except ValueError:
-                logger.warning(f"Unknown scope: {scope_name}")
+                logger.warning("Unknown scope: %s", scope_name)
     
     # =========================================================================
     # Computed Values
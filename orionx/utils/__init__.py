@@ -1,6 +1,22 @@
 """OneX Utils Module - Utility functions."""
 
-# Placeholder for utilities
+from .serialization import dumps, dumps_bytes, loads, canonical_bytes, fingerprint
+from .compat import DATACLASS_SLOTS
+from .batching import drain_batches
+from .http import create_http_session
+from .ids import next_id, token_id
+
 # Expression evaluator and parser will be added here
 
-__all__ = []
+__all__ = [
+    "dumps",
+    "dumps_bytes",
+    "loads",
+    "canonical_bytes",
+    "fingerprint",
+    "DATACLASS_SLOTS",
+    "drain_batches",
+    "create_http_session",
+    "next_id",
+    "token_id",
+]
@@ -0,0 +1,50 @@
+"""
+OneX Batching Utilities
+
+Size-or-interval queue draining shared by the write-behind log storage
+and the webhook batcher.
+"""
+
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, List
+import asyncio
+
+
+async def drain_batches(
+    queue: asyncio.Queue,
+    max_batch_size: int,
+    interval: float,
+    flush: Callable[[List[Any]], Awaitable[None]],
+) -> None:
+    """
+    Drain a queue in batches until a None sentinel is received.
+
+    A batch opens with the first item and is flushed when it reaches
+    max_batch_size or interval seconds have passed. Items queued before
+    the sentinel are flushed before returning.
+    """
+    loop = asyncio.get_running_loop()
+    stopping = False
+
+    while not stopping:
+        first = await queue.get()
+        if first is None:
+            break
+
+        batch = [first]
+        deadline = loop.time() + interval
+
+        while len(batch) < max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+
+        await flush(batch)
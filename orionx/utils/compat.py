@@ -0,0 +1,17 @@
+"""
+OrionX Compatibility Helpers
+
+Feature switches for the supported Python versions (3.9+).
+"""
+
+import sys
+
+
+# Keyword arguments enabling __slots__ on dataclasses (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Native asyncio.timeout (Python 3.11+), else the async-timeout backport
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
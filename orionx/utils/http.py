@@ -0,0 +1,35 @@
+"""
+OrionX HTTP Helpers
+
+Pooled aiohttp session factory for outbound calls.
+"""
+
+import aiohttp
+
+
+# Connection pool settings shared by all outbound HTTP
+POOL_LIMIT = 64
+POOL_LIMIT_PER_HOST = 10
+KEEPALIVE_TIMEOUT_SECONDS = 30
+DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+def create_http_session(timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS) -> aiohttp.ClientSession:
+    """
+    Create a keep-alive HTTP session with a bounded connection pool.
+    
+    timeout_seconds is the session-wide total timeout; individual
+    requests may override it. Must be called from a running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=POOL_LIMIT,
+        limit_per_host=POOL_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+        headers={"Connection": "keep-alive"},
+    )
@@ -0,0 +1,42 @@
+"""
+OrionX ID Helpers
+
+next_id() gives cheap unique IDs for internal identifiers (debug session
+IDs). A random per-process tag keeps IDs from different workers apart;
+a counter makes them unique within the process without an os.urandom()
+call per ID. The tag is redrawn and the counter reset in forked children,
+so workers forked after import (gunicorn --preload, multiprocessing)
+never share a sequence.
+
+token_id() is for IDs that are handed to clients and double as access
+handles (execution IDs): they carry random bits per ID, so knowing one
+does not reveal others.
+"""
+
+import itertools
+import os
+import secrets
+
+
+_PROCESS_TAG = secrets.token_hex(4)
+_COUNTER = itertools.count(1)
+
+
+def _reseed() -> None:
+    global _PROCESS_TAG, _COUNTER
+    _PROCESS_TAG = secrets.token_hex(4)
+    _COUNTER = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def next_id(prefix: str) -> str:
+    """Get a new process-unique ID, e.g. next_id("debug") -> "debug_1a2b3c4d_1f"."""
+    return f"{prefix}_{_PROCESS_TAG}_{next(_COUNTER):x}"
+
+
+def token_id(prefix: str) -> str:
+    """Get a new unguessable ID, e.g. token_id("exec") -> "exec_9f86d081884c7d659a2feaa0"."""
+    return f"{prefix}_{secrets.token_hex(12)}"
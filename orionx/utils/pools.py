@@ -0,0 +1,66 @@
+"""
+OrionX Worker Pools
+
+Process pool for CPU-bound work, kept apart from the event loop (which
+serves requests and outbound I/O) and from the default thread pool
+(which serves sync handlers and blocking I/O). CPU-heavy calls run in
+separate processes, so they neither stall the loop nor contend for its GIL.
+
+Workers are started with "spawn": the pool is created lazily from a
+process that already runs threads (the log listener, the worker thread
+pool), and forking a threaded process can copy held locks.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+import asyncio
+import multiprocessing
+import pickle
+
+from ..config import get_config
+
+
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_cpu_pool() -> ProcessPoolExecutor:
+    """Get the shared CPU worker pool (created on first use, sized by cpu_workers)."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = ProcessPoolExecutor(
+            max_workers=get_config().cpu_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _cpu_pool
+
+
+async def run_cpu(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a CPU-bound callable in the worker pool and await its result.
+    
+    fn and its arguments are pickled to reach the worker process, so they
+    must be module-level callables and picklable values. They are pickled
+    here, before submission, so a value that cannot be sent raises
+    pickle.PicklingError in the caller rather than failing inside the pool.
+    """
+    try:
+        payload = pickle.dumps(partial(fn, *args, **kwargs))
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise pickle.PicklingError(f"Cannot send {fn!r} to the CPU worker pool: {e}") from e
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_pool(), _call_pickled, payload)
+
+
+def _call_pickled(payload: bytes) -> Any:
+    """Worker entry point: unpickle and run a call built by run_cpu()."""
+    return pickle.loads(payload)()
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """Shut down the CPU worker pool; queued work not yet started is cancelled."""
+    global _cpu_pool
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown(wait=wait, cancel_futures=True)
+        _cpu_pool = None
@@ -0,0 +1,68 @@
+"""
+OrionX Serialization Helpers
+
+JSON encode/decode helpers used on hot paths.
+Uses orjson when installed and falls back to the stdlib json module.
+
+Install the fast path with: pip install orionx[fast]
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Union
+from datetime import date, datetime
+from enum import Enum
+import dataclasses
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+    
+    Dataclass instances (slotted or not), datetimes and enums are
+    serialized directly; with orjson no intermediate dict is built.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_dataclass_default).encode()
+
+
+def _dataclass_default(obj: Any) -> Any:
+    """Mirror orjson's native handling of dataclasses, datetimes and enums."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Deserialize a JSON string or bytes. Bound directly to the decoder
+# (no wrapper frame), since row and record decoding call it per value.
+loads: Callable[[Union[str, bytes]], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def canonical_bytes(obj: Any) -> bytes:
+    """Serialize an object to canonical (key-sorted, compact) JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def fingerprint(obj: Any) -> str:
+    """Get a stable content hash of a JSON-compatible object."""
+    return hashlib.blake2b(canonical_bytes(obj), digest_size=16).hexdigest()
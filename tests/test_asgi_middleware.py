@@ -0,0 +1,71 @@
+"""
+OrionX ASGI Middleware Tests
+
+Tests for the pure ASGI CORS middleware.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from orionx.api.asgi_middleware import PureCORSMiddleware
+
+
+def make_client(**cors):
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    @app.get("/docs-like")
+    def docs_like():
+        return {"ok": True}
+
+    app.add_middleware(PureCORSMiddleware, **cors)
+    return TestClient(app)
+
+
+class TestPureCORSMiddleware:
+    """Test CORS handling without Starlette request wrappers."""
+
+    def test_preflight_short_circuits(self):
+        """Test that preflights are answered with the allowed methods and headers."""
+        client = make_client(allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+        response = client.options("/ping", headers={
+            "Origin": "https://app.example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "x-token",
+        })
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "x-token"
+
+    def test_simple_request_echoes_origin_with_credentials(self):
+        """Test that credentialed CORS responses echo the origin."""
+        client = make_client(allow_origins=["*"], allow_credentials=True)
+        response = client.get("/ping", headers={"Origin": "https://app.example.com"})
+
+        assert response.json() == {"ok": True}
+        assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+    def test_disallowed_origin(self):
+        """Test that unknown origins get no CORS headers and failed preflights."""
+        client = make_client(allow_origins=["https://app.example.com"])
+
+        assert "access-control-allow-origin" not in client.get("/ping", headers={"Origin": "https://evil.example"}).headers
+        preflight = client.options("/ping", headers={
+            "Origin": "https://evil.example",
+            "Access-Control-Request-Method": "GET",
+        })
+        assert preflight.status_code == 400
+
+    def test_path_prefixes_scope_cors(self):
+        """Test that paths outside path_prefixes bypass CORS handling."""
+        client = make_client(allow_origins=["*"], path_prefixes=["/ping"])
+        headers = {"Origin": "https://app.example.com"}
+
+        assert "access-control-allow-origin" in client.get("/ping", headers=headers).headers
+        assert "access-control-allow-origin" not in client.get("/docs-like", headers=headers).headers
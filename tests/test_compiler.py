@@ -0,0 +1,372 @@
+"""
+OrionX Compiler Tests
+
+Tests for workflow compilation into execution plans.
+"""
+
+import pytest
+
+from orionx.compiler import (
+    WorkflowCompiler,
+    compiler_cache_stats,
+    workflow_compiler,
+    IR_Expr,
+    IR_Step,
+    IR_Workflow,
+    Opcode,
+)
+from orionx.compiler.execution_plan import CompilationError, ExecutionPlan
+from orionx.compiler.workflow_compiler import is_valid_uid
+from orionx.compiler.ir_types import IR_Type
+
+
+@pytest.fixture
+def compiler():
+    return WorkflowCompiler()
+
+
+@pytest.fixture
+def diamond_ir():
+    """trigger -> a -> (b, c) -> d"""
+    return {
+        "uid": "wf_diamond",
+        "version": 1,
+        "nodes": [
+            {"uid": "step_aaa", "type": "log", "config": {}},
+            {"uid": "step_bbb", "type": "log", "config": {}},
+            {"uid": "step_ccc", "type": "log", "config": {}},
+            {"uid": "step_ddd", "type": "log", "config": {}},
+        ],
+        "edges": [
+            {"uid": "edge_ta", "source": "trigger", "target": "step_aaa"},
+            {"uid": "edge_ab", "source": "step_aaa", "target": "step_bbb"},
+            {"uid": "edge_ac", "source": "step_aaa", "target": "step_ccc"},
+            {"uid": "edge_bd", "source": "step_bbb", "target": "step_ddd"},
+            {"uid": "edge_cd", "source": "step_ccc", "target": "step_ddd"},
+        ],
+    }
+
+
+class TestCompile:
+    """Test plan compilation."""
+
+    def test_parallel_groups(self, compiler, diamond_ir):
+        """Test that nodes are grouped by depth."""
+        plan = compiler.compile(diamond_ir)
+
+        assert [g.node_uids for g in plan.groups] == [
+            ("trigger",),
+            ("step_aaa",),
+            ("step_bbb", "step_ccc"),
+            ("step_ddd",),
+        ]
+        assert plan.total_steps == 5
+        assert plan.max_parallelism == 2
+
+    def test_compiled_at_is_formatted_lazily(self, compiler, diamond_ir):
+        """Test that the compile timestamp is stored raw and formatted on access."""
+        plan = compiler.compile(diamond_ir)
+
+        assert plan.compiled_at_ts > 0
+        assert plan.compiled_at.startswith("20")
+        assert plan.compiled_at is plan.compiled_at
+
+    def test_compiled_at_string_is_accepted(self):
+        """Test that plans can still be built from an ISO compiled_at string."""
+        plan = ExecutionPlan(workflow_uid="wf_x", version=1, compiled_at="2024-01-02T03:04:05")
+
+        assert plan.compiled_at == "2024-01-02T03:04:05"
+        assert plan.compiled_at_ts == 1704164645.0
+
+    def test_cycle_rejected(self, compiler, diamond_ir):
+        """Test that cyclic workflows fail to compile."""
+        diamond_ir["edges"].append(
+            {"uid": "edge_da", "source": "step_ddd", "target": "step_aaa"}
+        )
+
+        with pytest.raises(CompilationError) as exc_info:
+            compiler.compile(diamond_ir)
+
+        assert exc_info.value.code == "E_CYCLE"
+
+    def test_all_cycles_reported(self, compiler, diamond_ir):
+        """Test that every independent cycle is reported in one validation."""
+        diamond_ir["edges"] += [
+            {"uid": "edge_cb", "source": "step_ccc", "target": "step_aaa"},
+            {"uid": "edge_dd", "source": "step_ddd", "target": "step_ddd"},
+        ]
+
+        result = compiler.validate(diamond_ir)
+
+        assert [e.nodes for e in result.errors] == [["step_aaa", "step_ccc"], ["step_ddd"]]
+
+    def test_orphan_warning(self, compiler, diamond_ir):
+        """Test that nodes unreachable from the trigger are warned about."""
+        diamond_ir["nodes"].append({"uid": "step_eee", "type": "log", "config": {}})
+
+        result = compiler.validate(diamond_ir)
+
+        assert result.valid
+        assert [w.nodes for w in result.warnings] == [["step_eee"]]
+
+    def test_missing_config_warning(self, compiler, diamond_ir):
+        """Test that steps lacking required config fields are flagged."""
+        diamond_ir["nodes"][0] = {"uid": "step_aaa", "type": "api_call", "config": {"url": "http://x"}}
+
+        result = compiler.validate(diamond_ir)
+
+        assert result.valid
+        assert [(w.code, w.nodes) for w in result.warnings] == [("W_MISSING_CONFIG", ["step_aaa"])]
+
+
+class TestCompileStream:
+    """Test incremental compilation from a JSON file."""
+
+    def test_stream_matches_in_memory_compile(self, compiler, diamond_ir, tmp_path):
+        """Test that streamed and in-memory compiles produce the same groups."""
+        pytest.importorskip("ijson")
+        import json
+
+        diamond_ir = {**diamond_ir, "variables": {"limit": {"default": 3, "tags": ["a"]}}}
+        path = tmp_path / "workflow.json"
+        path.write_text(json.dumps(diamond_ir))
+
+        streamed = compiler.compile_stream(str(path))
+        in_memory = WorkflowCompiler().compile(diamond_ir)
+
+        assert streamed.workflow_uid == "wf_diamond"
+        assert streamed.groups == in_memory.groups
+        assert streamed.variable_bindings == diamond_ir["variables"]
+        assert compiler.compile_stream(str(path)) is streamed
+        assert compiler.cache_stats()["hits"] == 1
+
+
+class TestUIDPatterns:
+    """Test UID validation helpers."""
+
+    @pytest.mark.parametrize("kind,uid,expected", [
+        ("node", "step_abc", True),
+        ("node", "node_abc123", True),
+        ("node", "task_abc", False),
+        ("edge", "edge_ab", False),
+        ("trigger", "trigger", True),
+        ("trigger", "triggers", False),
+    ])
+    def test_is_valid_uid(self, kind, uid, expected):
+        assert is_valid_uid(kind, uid) is expected
+
+
+class TestPlanCache:
+    """Test compiled plan memoization."""
+
+    def test_identical_workflow_reuses_plan(self, compiler, diamond_ir):
+        """Test that recompiling the same workflow is a cache hit."""
+        first = compiler.compile(diamond_ir)
+        second = compiler.compile(dict(diamond_ir))
+
+        assert second is first
+        assert first.checksum is not None
+        assert compiler.cache_stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_changed_workflow_recompiles(self, compiler, diamond_ir):
+        """Test that a content change produces a new plan."""
+        first = compiler.compile(diamond_ir)
+        diamond_ir["nodes"] = diamond_ir["nodes"][:1]
+        diamond_ir["edges"] = diamond_ir["edges"][:1]
+        second = compiler.compile(diamond_ir)
+
+        assert second is not first
+        assert second.checksum != first.checksum
+        assert second.total_steps == 2
+
+    def test_groups_shared_across_plans(self, compiler, diamond_ir):
+        """Test that identical groups are interned across distinct plans."""
+        first = compiler.compile(diamond_ir)
+        diamond_ir["name"] = "Renamed"
+        second = compiler.compile(diamond_ir)
+
+        assert second is not first
+        assert all(a is b for a, b in zip(first.groups, second.groups))
+
+    def test_validate_reuses_cached_plan(self, compiler, diamond_ir):
+        """Test that validating a compiled workflow skips re-analysis."""
+        plan = compiler.compile(diamond_ir)
+
+        assert compiler.validate(dict(diamond_ir)) is plan.validation
+
+    def test_singleton_stats(self):
+        """Test module-level stats helper."""
+        assert compiler_cache_stats() == workflow_compiler.cache_stats()
+
+
+class TestIRExpr:
+    """Test IR expression bytecode layout."""
+
+    def test_freeze_builds_parallel_arrays(self):
+        """Test that freeze() splits instructions into opcodes and operands."""
+        expr = IR_Expr(uid="expr_1").add(Opcode.PUSH_CONST, 2).add(Opcode.PUSH_CONST, 3).add(Opcode.ADD)
+        expr.freeze()
+
+        assert list(expr.opcodes) == [Opcode.PUSH_CONST, Opcode.PUSH_CONST, Opcode.ADD]
+        assert expr.operands == (2, 3, None)
+
+    def test_add_invalidates_frozen_arrays(self):
+        """Test that appending after freeze() drops stale arrays."""
+        expr = IR_Expr(uid="expr_1").add(Opcode.NOP).freeze()
+        assert expr.frozen
+
+        expr.add(Opcode.HALT)
+        assert not expr.frozen
+
+    def test_compile_pure_numeric_expression(self):
+        """Test that pure numeric expressions compile to a cached callable."""
+        expr = IR_Expr(uid="expr_1", result_type=IR_Type.INT, pure=True)
+        expr.add(Opcode.PUSH_CONST, 2).add(Opcode.PUSH_CONST, 3).add(Opcode.MUL).add(Opcode.NEG)
+
+        fn = expr.compile_pure()
+
+        assert fn() == -6
+        assert expr.compile_pure() is fn
+
+    def test_compile_pure_rejects_impure(self):
+        """Test that impure or unsupported streams are not compiled."""
+        impure = IR_Expr(uid="expr_1", result_type=IR_Type.INT, pure=False).add(Opcode.PUSH_CONST, 1)
+        context_load = IR_Expr(uid="expr_2", result_type=IR_Type.INT, pure=True).add(Opcode.LOAD_PARAM, "id")
+
+        assert impure.compile_pure() is None
+        assert context_load.compile_pure() is None
+
+
+class TestIRWorkflow:
+    """Test IR workflow index layout."""
+
+    def test_freeze_builds_csr_dependencies(self):
+        """Test that freeze() assigns dense ids and CSR dependency arrays."""
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={
+                "step_a": IR_Step(uid="step_a", type="log"),
+                "step_b": IR_Step(uid="step_b", type="log", depends_on=["step_a"]),
+                "step_c": IR_Step(uid="step_c", type="log", depends_on=["step_a", "step_b"]),
+            },
+            execution_order=["step_a", "step_b", "step_c"],
+            dependency_graph={
+                "step_a": set(),
+                "step_b": {"step_a"},
+                "step_c": {"step_a", "step_b"},
+            },
+        ).freeze()
+
+        assert workflow.step_ids == {"step_a": 0, "step_b": 1, "step_c": 2}
+        assert list(workflow.execution_order_ids) == [0, 1, 2]
+        assert list(workflow.dependencies_of(0)) == []
+        assert list(workflow.dependencies_of(2)) == [0, 1]
+        assert workflow.steps_by_id[1].uid == "step_b"
+
+    def test_ready_ids_from_bitmasks(self):
+        """Test ready-set computation against a completed-step mask."""
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={uid: IR_Step(uid=uid, type="log") for uid in ("step_a", "step_b", "step_c")},
+            dependency_graph={"step_b": {"step_a"}, "step_c": {"step_a", "step_b"}},
+        ).freeze()
+
+        assert workflow.dep_masks == [0b000, 0b001, 0b011]
+        assert workflow.ready_ids(0b000) == [0]
+        assert workflow.ready_ids(0b001) == [1]
+        assert workflow.ready_ids(0b011) == [2]
+
+    def test_ready_ids_without_bitmasks(self, monkeypatch):
+        """Test that large workflows fall back to the CSR layout."""
+        import orionx.compiler.ir_types as ir_types
+
+        monkeypatch.setattr(ir_types, "BITSET_MAX_STEPS", 1)
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={uid: IR_Step(uid=uid, type="log") for uid in ("step_a", "step_b")},
+            dependency_graph={"step_b": {"step_a"}},
+        ).freeze()
+
+        assert workflow.dep_masks == []
+        assert workflow.ready_ids(0b00) == [0]
+        assert workflow.ready_ids(0b01) == [1]
+
+    @pytest.mark.asyncio
+    async def test_specialize_runs_steps_in_order(self):
+        """Test that static workflows compile to a cached inline runner."""
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={
+                "step_a": IR_Step(uid="step_a", type="log", static_params={"message": "a"}),
+                "step_b": IR_Step(uid="step_b", type="log", static_params={"message": "b"}),
+            },
+            execution_order=["step_b", "step_a"],
+        )
+        calls = []
+
+        async def log_handler(ctx, params):
+            calls.append(params["message"])
+            return ctx["n"]
+
+        runner = workflow.specialize()
+        results = await runner({"n": 1}, {"log": log_handler})
+
+        assert calls == ["b", "a"]
+        assert results == {"step_b": 1, "step_a": 1}
+        assert workflow.specialize() is runner
+
+    def test_specialize_rejects_dynamic_steps(self):
+        """Test that steps needing runtime evaluation are not specialized."""
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={"step_a": IR_Step(uid="step_a", type="log", condition_expr="expr_1")},
+        )
+
+        assert workflow.specialize() is None
+
+    def test_freeze_resolves_expression_refs(self):
+        """Test that step expression UIDs resolve to IR_Expr objects."""
+        local = IR_Expr(uid="expr_local")
+        shared = IR_Expr(uid="expr_shared")
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={
+                "step_a": IR_Step(
+                    uid="step_a",
+                    type="log",
+                    expressions={"expr_local": local},
+                    dynamic_params={"message": "expr_local"},
+                    condition_expr="expr_shared",
+                ),
+            },
+            expressions={"expr_shared": shared},
+        ).freeze()
+
+        step = workflow.steps["step_a"]
+        assert step.condition is shared
+        assert step.dynamic_exprs == {"message": local}
+
+    def test_freeze_rejects_unknown_expression_refs(self):
+        """Test that dangling expression references fail at freeze time."""
+        workflow = IR_Workflow(
+            uid="wf_test",
+            version=1,
+            steps={"step_a": IR_Step(uid="step_a", type="log", condition_expr="expr_gone")},
+        )
+
+        with pytest.raises(CompilationError) as exc_info:
+            workflow.freeze()
+
+        assert exc_info.value.code == "E_MISSING_REF"
+
+    def test_plan_groups_carry_node_ids(self, diamond_ir):
+        """Test that compiled groups expose dense node ids."""
+        plan = WorkflowCompiler().compile(diamond_ir)
+
+        assert [g.node_ids for g in plan.groups] == [(0,), (1,), (2, 3), (4,)]
@@ -0,0 +1,132 @@
+"""
+OrionX Execution Logger Tests
+
+Tests for execution log storage.
+"""
+
+import pytest
+from datetime import datetime
+
+from orionx.core.execution_logger import (
+    BatchedLogStorage,
+    ExecutionLog,
+    ExpressionTracer,
+    InMemoryLogStorage,
+    StepLog,
+    decode_log,
+    encode_log,
+)
+from orionx.schemas.execution import ExecutionStatus
+import orionx.utils.serialization as serialization
+
+
+def make_log(execution_id, workflow_uid="wf_test", user_uid="user_1"):
+    return ExecutionLog(
+        execution_id=execution_id,
+        workflow_uid=workflow_uid,
+        user_uid=user_uid,
+        started_at=datetime.utcnow(),
+    )
+
+
+class TestLogEncoding:
+    """Test execution log serialization."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, monkeypatch, use_orjson):
+        """Test that encode/decode preserves logs with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(serialization, "orjson", None)
+
+        log = make_log("exec_1")
+        log.status = ExecutionStatus.COMPLETED
+        log.completed_at = datetime.utcnow()
+        log.step_logs.append(StepLog(step_uid="step_1", step_type="log", started_at=datetime.utcnow(), duration_ms=3))
+
+        assert decode_log(encode_log(log)) == log
+
+
+class TestInMemoryLogStorage:
+    """Test indexed in-memory log storage."""
+
+    @pytest.mark.asyncio
+    async def test_indexed_listing(self):
+        """Test that listings follow insertion order and honor limit."""
+        storage = InMemoryLogStorage()
+        await storage.save_logs([make_log("exec_1"), make_log("exec_2", user_uid="user_2")])
+        await storage.save_log(make_log("exec_3", workflow_uid="wf_other"))
+
+        assert [log.execution_id for log in await storage.get_logs_for_workflow("wf_test")] == ["exec_1", "exec_2"]
+        assert [log.execution_id for log in await storage.get_logs_for_workflow("wf_test", limit=1)] == ["exec_1"]
+        assert [log.execution_id for log in await storage.get_logs_for_user("user_1")] == ["exec_1", "exec_3"]
+
+    @pytest.mark.asyncio
+    async def test_resave_does_not_duplicate(self):
+        """Test that saving the same execution twice keeps one index entry."""
+        storage = InMemoryLogStorage()
+        log = make_log("exec_1")
+        await storage.save_log(log)
+        await storage.save_log(log)
+
+        assert len(await storage.get_logs_for_workflow("wf_test")) == 1
+
+
+class TestBatchedLogStorage:
+    """Test write-behind log batching."""
+
+    @pytest.mark.asyncio
+    async def test_batches_flush_on_stop(self):
+        """Test that queued logs are readable early and persisted on stop."""
+        backend = InMemoryLogStorage()
+        storage = BatchedLogStorage(backend, flush_interval_ms=10_000)
+        await storage.start()
+
+        await storage.save_log(make_log("exec_1"))
+        await storage.save_log(make_log("exec_2"))
+
+        assert (await storage.get_log("exec_1")).execution_id == "exec_1"
+
+        await storage.stop()
+
+        assert [log.execution_id for log in await backend.get_logs_for_workflow("wf_test")] == ["exec_1", "exec_2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        """Test that logs stay pending after a failed write and persist on the next flush."""
+        backend = InMemoryLogStorage()
+        storage = BatchedLogStorage(backend, flush_interval_ms=10_000)
+        await storage.start()
+
+        async def failing_save_logs(logs):
+            raise ConnectionError("backend down")
+
+        backend.save_logs = failing_save_logs
+        await storage.save_log(make_log("exec_1"))
+        await storage.flush()
+
+        assert await backend.get_log("exec_1") is None
+        assert (await storage.get_log("exec_1")).execution_id == "exec_1"
+
+        del backend.save_logs
+        await storage.save_log(make_log("exec_2"))
+        await storage.stop()
+
+        assert [log.execution_id for log in await backend.get_logs_for_workflow("wf_test")] == ["exec_1", "exec_2"]
+        assert storage._pending == {}
+
+
+class TestExpressionTracer:
+    """Test expression trace retention."""
+
+    def test_traces_are_bounded(self):
+        """Test that finished traces are kept per UID and the oldest evicted."""
+        tracer = ExpressionTracer(max_traces=2)
+        for uid in ("expr_1", "expr_2", "expr_3"):
+            tracer.start("1 + 1", uid)
+            tracer.step(1, "BinOp", "1 + 1", 2, "2")
+            tracer.finish(2)
+
+        assert tracer.get_trace("expr_1") is None
+        assert tracer.get_trace("expr_3").final_result == 2
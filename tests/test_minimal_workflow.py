@@ -16,11 +16,12 @@ Validates:
 - No UI code is invoked
 """
 
+import json
 import pytest
 import asyncio
 from datetime import datetime
 
-from orionx.core.executor import OneXEngine, WorkflowExecutor
+from orionx.core.executor import ExecutionLog, OneXEngine, WorkflowExecutor
 from orionx.core.action_handlers import StepHandlers, StepResult
 from orionx.schemas.workflow import (
     Workflow,
@@ -231,6 +232,37 @@ class TestOneXEngine:
             # Note: duration_ms may be None for very fast mock handlers
 
 
+    @pytest.mark.asyncio
+    async def test_deferred_execution(self, test_workflow, mock_api_handler, mock_entity_handler, mock_transform_handler):
+        """Test that a registered execution is pending until run."""
+        engine = OneXEngine()
+        engine.register_step_handler(StepType.API_CALL, mock_api_handler)
+        engine.register_step_handler(StepType.CREATE_ENTITY, mock_entity_handler)
+        engine.register_step_handler(StepType.TRANSFORM_DATA, mock_transform_handler)
+        
+        execution_id = engine.create_execution(test_workflow)
+        assert engine.query_execution(execution_id).status == ExecutionStatus.PENDING
+        
+        await engine.run_execution(execution_id, test_workflow)
+        
+        result = engine.query_execution(execution_id)
+        assert result.status == ExecutionStatus.COMPLETED
+        assert len(result.steps) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_execution(self, test_workflow):
+        """Test that cancelling before the run starts stops it from running."""
+        engine = OneXEngine()
+        execution_id = engine.create_execution(test_workflow)
+
+        assert await engine.cancel_workflow(execution_id) is True
+        await engine.run_execution(execution_id, test_workflow)
+
+        result = engine.query_execution(execution_id)
+        assert result.status == ExecutionStatus.CANCELLED
+        assert result.steps == []
+
+
 class TestWorkflowExecutor:
     """Test the low-level WorkflowExecutor."""
     
@@ -267,6 +299,104 @@ class TestWorkflowExecutor:
         assert len(log.step_logs) == 1
         assert log.step_logs[0].step_uid == "step_log"
 
+    def test_param_plan_is_cached_per_params(self):
+        """Test that compiled params resolve refs and rebuild when params change."""
+        executor = WorkflowExecutor()
+        step = WorkflowStep(uid="step_p", type=StepType.LOG, params={"x": "$foo", "y": 1})
+
+        plan = executor._compile_params(step)
+        assert executor._compile_params(step) is plan
+        assert executor._evaluate_params(plan, ExecutionContext(), {"foo": 42}) == {"x": 42, "y": 1}
+
+        step.params = {"y": 2}
+        assert executor._evaluate_params(executor._compile_params(step), ExecutionContext(), {}) == {"y": 2}
+
+    @pytest.mark.asyncio
+    async def test_literal_params_are_not_shared(self):
+        """Test that a handler mutating nested literal params leaves the definition intact."""
+        workflow = Workflow(
+            uid="wf_shared_params",
+            name="Shared Params",
+            version=1,
+            trigger=WorkflowTrigger(type=TriggerType.MANUAL),
+            steps=[
+                WorkflowStep(uid="step_a", type=StepType.API_CALL, params={"headers": {"a": "1"}}),
+                WorkflowStep(uid="step_b", type=StepType.API_CALL, params={"headers": {}, "ref": "$step_a"}),
+            ],
+        )
+
+        async def handler(params, context):
+            params["headers"]["x-token"] = "secret"
+            return dict(params["headers"])
+
+        executor = WorkflowExecutor()
+        executor.register_handler(StepType.API_CALL, handler)
+        await executor.execute(workflow, ExecutionContext())
+
+        assert workflow.steps[0].params == {"headers": {"a": "1"}}
+        assert workflow.steps[1].params == {"headers": {}, "ref": "$step_a"}
+
+    def test_compiled_workflow_is_cached(self, test_workflow):
+        """Test that the compiled graph is reused until the workflow version changes."""
+        executor = WorkflowExecutor()
+        compiled = executor._compile_workflow(test_workflow)
+        assert executor._compile_workflow(test_workflow) is compiled
+
+        test_workflow.version += 1
+        assert executor._compile_workflow(test_workflow) is not compiled
+
+    @pytest.mark.asyncio
+    async def test_step_edits_apply_to_later_executions(self):
+        """Test that replacing params or depends_on is seen by the next execution."""
+        workflow = Workflow(
+            uid="wf_edit_test",
+            name="Edit Test",
+            version=1,
+            trigger=WorkflowTrigger(type=TriggerType.MANUAL),
+            steps=[
+                WorkflowStep(uid="step_a", type=StepType.LOG, params={"message": "$greeting"}),
+                WorkflowStep(uid="step_b", type=StepType.LOG, params={"message": "b"}),
+            ],
+        )
+        executor = WorkflowExecutor()
+        context = ExecutionContext(input_params={"greeting": "hi", "other": "bye"})
+
+        log = await executor.execute(workflow, context)
+        assert log.step_logs[0].result == {"logged": "hi"}
+
+        workflow.steps[0].params = {"message": "$other"}
+        workflow.steps[1].depends_on = ["step_missing"]
+        log = await executor.execute(workflow, context)
+
+        assert log.step_logs[0].result == {"logged": "bye"}
+        assert [step.step_uid for step in log.step_logs] == ["step_a"]
+
+    def test_input_snapshot_is_frozen_as_json(self):
+        """Test that a snapshot passed to ExecutionLog is encoded and detached from its source."""
+        snapshot = {"input_params": {"when": datetime(2024, 1, 2), "tags": ("a",)}}
+        log = ExecutionLog(
+            execution_id="exec_snap",
+            workflow_uid="wf_test",
+            user_uid=None,
+            started_at=datetime.utcnow(),
+            input_snapshot=snapshot,
+        )
+        snapshot["input_params"]["tags"] = ()
+
+        assert log.input_snapshot == {"input_params": {"when": "2024-01-02T00:00:00", "tags": ["a"]}}
+        assert json.loads(log.input_snapshot_bytes) == log.input_snapshot
+
+    def test_recorded_inputs_follow_config(self):
+        """Test that step inputs can be dropped or size-capped."""
+        executor = WorkflowExecutor()
+        params = {"small": "ok", "big": "x" * 100}
+
+        executor._max_input_bytes = 20
+        assert executor._recorded_inputs(params) == {"small": "ok", "big": {"_truncated": True, "bytes": 102}}
+
+        executor._capture_inputs = False
+        assert executor._recorded_inputs(params) is None
+
 
 class TestNoUICode:
     """Test that no UI code is invoked."""
@@ -349,6 +479,19 @@ class TestExecutionContext:
         assert ctx.get("counter") == 5
         assert ctx.get("nonexistent") is None
     
+    def test_context_get_walks_parents(self):
+        """Test lookup order across entity child contexts and their parents."""
+        root = ExecutionContext(execution_state={"a": 1}, input_params={"b": 2})
+        nested = ExecutionContext(execution_state={"c": 3}, parent=root)
+        child = nested.with_entity({"id": "e1"}, "Note")
+        child.set_state("a", "child")
+        
+        assert child.get("a") == "child"
+        assert child.get("b") == 2
+        assert child.get("c") == 3
+        assert child.get("This Note") == {"id": "e1"}
+        assert child.get("nonexistent") is None
+    
     def test_context_state_mutation(self):
         """Test setting state in context."""
         ctx = ExecutionContext()
@@ -360,6 +503,57 @@ class TestExecutionContext:
         assert ctx.workflow_data["step_1"] == {"data": 123}
 
 
+class TestStepSummary:
+    """Test API step summaries."""
+    
+    def test_summary_is_built_once(self):
+        """Test that the summary dict is cached on the step result."""
+        from orionx.schemas.execution import StepResult as ExecStepResult
+        
+        step = ExecStepResult(
+            step_uid="step_1",
+            step_type="log",
+            started_at=datetime.utcnow(),
+            duration_ms=5,
+            error="boom",
+        )
+        
+        summary = step.to_summary()
+        
+        assert summary["success"] is False
+        assert summary["error"] == "boom"
+        assert step.to_summary() is summary
+
+    def test_handler_result_serializes_directly(self):
+        """Test that handler results serialize to JSON bytes."""
+        result = StepResult(success=True, data={"id": 1})
+        
+        assert json.loads(result.to_json()) == result.to_dict()
+
+
+class TestExecuteGroup:
+    """Test concurrent execution of compiled groups."""
+    
+    @pytest.mark.asyncio
+    async def test_group_steps_run_concurrently(self):
+        """Test that a group's steps are dispatched together, in group order."""
+        from orionx.compiler.execution_plan import ExecutionGroup
+        
+        handlers = StepHandlers()
+        group = ExecutionGroup(depth=1, node_uids=("trigger", "step_a", "step_b", "step_c"))
+        steps = {
+            "step_a": (StepType.LOG, {"message": "a"}),
+            "step_b": (StepType.SEND_EMAIL, {}),
+            "step_c": (StepType.LOG, {"message": "c"}),
+        }
+        
+        results = await handlers.execute_group(group, steps, ExecutionContext())
+        
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].data == {"logged": "a"}
+        assert results[1].error == "Missing recipient"
+
+
 # =============================================================================
 # Run Tests
 # =============================================================================
@@ -0,0 +1,311 @@
+"""
+OrionX Permission Tests
+
+Tests for row- and field-level permission enforcement.
+"""
+
+import asyncio
+import pickle
+import threading
+
+import pytest
+
+from orionx.permissions.permission_gate import HOT_RULE_THRESHOLD, PermissionGate, creator_mask
+from orionx.permissions.rbac import Permission, RBACManager
+from orionx.schemas.data_types import (
+    DataField,
+    DataType,
+    FieldType,
+    PrivacyAction,
+    PrivacyLevel,
+    PrivacyRule,
+)
+from orionx.schemas.execution import ExecutionContext
+from orionx.utils.pools import shutdown_pools
+
+
+ENTITIES = [
+    {"id": 1, "title": "a", "secret": "s1", "created_by": "user_1"},
+    {"id": 2, "title": "b", "secret": "s2", "created_by": "user_2"},
+    {"id": 3, "title": "c", "owner_id": "user_1"},
+]
+
+
+def make_type(level):
+    return DataType(
+        name="Note",
+        fields=[
+            DataField(name="title", type=FieldType.TEXT),
+            DataField(name="secret", type=FieldType.TEXT, privacy=PrivacyLevel.CREATOR_ONLY),
+        ],
+        privacy_rules=[PrivacyRule(action=PrivacyAction.VIEW, level=level)],
+    )
+
+
+class TestDataTypeLookups:
+    """Test cached field and rule lookups."""
+
+    def test_lookups_follow_list_changes(self):
+        """Test that the indexes keep first-match order and see appended items."""
+        data_type = make_type(PrivacyLevel.PUBLIC)
+        first = data_type.get_rule(PrivacyAction.VIEW)
+
+        data_type.privacy_rules.append(PrivacyRule(action=PrivacyAction.VIEW, level=PrivacyLevel.PRIVATE))
+        data_type.privacy_rules.append(PrivacyRule(action=PrivacyAction.DELETE, level=PrivacyLevel.PRIVATE))
+
+        assert data_type.get_rule(PrivacyAction.VIEW) is first
+        assert data_type.get_rule(PrivacyAction.DELETE).level == PrivacyLevel.PRIVATE
+        assert data_type.get_field("secret").privacy == PrivacyLevel.CREATOR_ONLY
+        assert data_type.get_field("missing") is None
+
+
+class TestFilterList:
+    """Test bulk list filtering."""
+
+    @pytest.mark.parametrize("level", [PrivacyLevel.PUBLIC, PrivacyLevel.LOGGED_IN, PrivacyLevel.CREATOR_ONLY])
+    @pytest.mark.parametrize("user", [None, {"uid": "user_1"}])
+    def test_matches_per_entity_check(self, level, user):
+        """Test that filter_list agrees with check() + filter_fields() per entity."""
+        gate = PermissionGate()
+        data_type = make_type(level)
+        context = ExecutionContext(user=user)
+
+        expected = [
+            gate.filter_fields(data_type, entity, context)
+            for entity in ENTITIES
+            if gate.check(data_type, PrivacyAction.VIEW, entity, context).is_allowed
+        ]
+
+        assert gate.filter_list(data_type, ENTITIES, PrivacyAction.VIEW, context) == expected
+
+    def test_creator_mask(self):
+        """Test that the creator mask honours the created_by/creator_id/owner_id fallbacks."""
+        entities = [{"created_by": "u1"}, {"creator_id": "u1"}, {"owner_id": "u1"}, {"created_by": "u2"}, {}]
+        assert creator_mask(entities, "u1") == [True, True, True, False, False]
+
+    def test_missing_rule_denies_all(self):
+        """Test that a list with no rule for the action is fully filtered."""
+        gate = PermissionGate()
+        assert gate.filter_list(make_type(PrivacyLevel.PUBLIC), ENTITIES, PrivacyAction.DELETE, ExecutionContext()) == []
+
+
+class TestFilterColumns:
+    """Test columnar list filtering."""
+
+    COLUMNS = {
+        "id": [1, 2, 3],
+        "title": ["a", "b", "c"],
+        "secret": ["s1", "s2", None],
+        "created_by": ["user_1", "user_2", None],
+        "owner_id": [None, None, "user_1"],
+    }
+
+    def test_creator_rows(self):
+        """Test that the row mask follows the created_by/owner_id fallback."""
+        gate = PermissionGate()
+        context = ExecutionContext(user={"uid": "user_1"})
+
+        result = gate.filter_columns(make_type(PrivacyLevel.CREATOR_ONLY), self.COLUMNS, PrivacyAction.VIEW, context)
+
+        assert result == {"id": [1, 3], "title": ["a", "c"], "secret": ["s1", None]}
+
+    def test_creator_fields_masked_per_row(self):
+        """Test that CREATOR_ONLY columns keep only the user's own values."""
+        gate = PermissionGate()
+
+        public = gate.filter_columns(
+            make_type(PrivacyLevel.PUBLIC), self.COLUMNS, PrivacyAction.VIEW, ExecutionContext(user={"uid": "user_2"})
+        )
+        anonymous = gate.filter_columns(make_type(PrivacyLevel.PUBLIC), self.COLUMNS, PrivacyAction.VIEW, ExecutionContext())
+
+        assert public["secret"] == [None, "s2", None]
+        assert anonymous == {"id": [1, 2, 3], "title": ["a", "b", "c"]}
+
+
+class TestFilterFields:
+    """Test field-level filtering."""
+
+    @pytest.mark.parametrize("user", [None, {"uid": "user_1"}, {"id": "user_2"}])
+    def test_matches_per_field_check(self, user):
+        """Test that the cached field plan agrees with _can_access_field()."""
+        gate = PermissionGate()
+        data_type = make_type(PrivacyLevel.PUBLIC)
+        context = ExecutionContext(user=user)
+
+        for entity in ENTITIES:
+            expected = {
+                field.name: entity[field.name]
+                for field in data_type.fields
+                if field.name in entity and gate._can_access_field(field, entity, context)
+            }
+            expected["id"] = entity["id"]
+            assert gate.filter_fields(data_type, entity, context) == expected
+
+    def test_plan_follows_in_place_field_changes(self):
+        """Test that appending a field or re-classifying one in place takes effect."""
+        gate = PermissionGate()
+        data_type = make_type(PrivacyLevel.PUBLIC)
+        context = ExecutionContext(user={"uid": "user_2"})
+        entity = {**ENTITIES[0], "notes": "n1"}
+
+        assert gate.filter_fields(data_type, entity, context) == {"id": 1, "title": "a"}
+
+        data_type.fields.append(DataField(name="notes", type=FieldType.TEXT))
+        data_type.get_field("title").privacy = PrivacyLevel.CREATOR_ONLY
+
+        assert gate.filter_fields(data_type, entity, context) == {"id": 1, "notes": "n1"}
+
+
+class TestRBACManager:
+    """Test cached role permission lookups."""
+
+    def test_cache_follows_role_changes(self):
+        """Test that cached permissions track assign/revoke and role grants."""
+        rbac = RBACManager()
+        rbac.create_role("role_ops", "Ops", {Permission.WORKFLOW_VIEW})
+        rbac.assign_role("user_1", "role_ops")
+        assert rbac.check_permission("user_1", Permission.WORKFLOW_VIEW)
+        assert not rbac.check_permission("user_1", Permission.WORKFLOW_EXECUTE)
+
+        rbac.get_role("role_ops").grant(Permission.WORKFLOW_EXECUTE)
+        assert rbac.check_permission("user_1", Permission.WORKFLOW_EXECUTE)
+
+        rbac.revoke_role("user_1", "role_ops")
+        assert rbac.get_user_permissions("user_1") == frozenset()
+
+        rbac.assign_role("user_1", "role_admin")
+        assert rbac.check_permission("user_1", Permission.ADMIN_AUDIT)
+
+    def test_cache_cannot_miss_in_place_changes(self):
+        """Test that role permissions are copied and frozen, and rebinding them invalidates."""
+        rbac = RBACManager()
+        permissions = {Permission.WORKFLOW_EXECUTE}
+        role = rbac.create_role("role_ops", "Ops", permissions)
+        rbac.assign_role("user_1", "role_ops")
+        assert rbac.check_permission("user_1", Permission.WORKFLOW_EXECUTE)
+
+        permissions.discard(Permission.WORKFLOW_EXECUTE)
+        assert rbac.check_permission("user_1", Permission.WORKFLOW_EXECUTE)
+        with pytest.raises(AttributeError):
+            role.permissions.discard(Permission.WORKFLOW_EXECUTE)
+
+        role.permissions = set()
+        assert not rbac.check_permission("user_1", Permission.WORKFLOW_EXECUTE)
+
+
+class RecordFieldEvaluator:
+    """Picklable stand-in evaluator: the expression names a truthy record field."""
+
+    def evaluate(self, expression, context):
+        return context.current_entity.get(expression)
+
+
+class CompilingEvaluator(RecordFieldEvaluator):
+    """Evaluator whose compiled form counts calls and rejects entities without the field."""
+
+    def __init__(self):
+        self.compiled_calls = 0
+
+    def compile(self, expression):
+        def fn(context):
+            self.compiled_calls += 1
+            return context.current_entity[expression]
+        return fn
+
+
+class TestHotCustomRules:
+    """Test specialization of hot custom rule expressions."""
+
+    def test_specializes_then_deoptimizes(self):
+        """Test that hot rules switch to the compiled form and fall back on error."""
+        data_type = DataType(
+            name="Note",
+            privacy_rules=[PrivacyRule(action=PrivacyAction.VIEW, condition_expr="expr_published")],
+        )
+        evaluator = CompilingEvaluator()
+        gate = PermissionGate(evaluator, {"expr_published": "published"})
+        context = ExecutionContext()
+
+        for _ in range(HOT_RULE_THRESHOLD):
+            assert gate.check(data_type, PrivacyAction.VIEW, {"published": True}, context).is_allowed
+        assert evaluator.compiled_calls == 0
+
+        assert not gate.check(data_type, PrivacyAction.VIEW, {"published": False}, context).is_allowed
+        assert evaluator.compiled_calls == 1
+
+        # KeyError in the compiled form: interpreter decides, compiled form is dropped
+        assert not gate.check(data_type, PrivacyAction.VIEW, {}, context).is_allowed
+        assert gate.check(data_type, PrivacyAction.VIEW, {"published": True}, context).is_allowed
+        assert evaluator.compiled_calls == 2
+
+
+class AsyncRecordFieldEvaluator:
+    """Async evaluator that records its peak number of in-flight evaluations."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def evaluate(self, expression, context):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return context.current_entity.get(expression)
+
+
+class TestFilterListAsync:
+    """Test concurrent custom rule evaluation for lists."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_fan_out(self):
+        """Test that evaluations overlap up to the limit and keep list order."""
+        data_type = DataType(
+            name="Note",
+            fields=[DataField(name="title", type=FieldType.TEXT)],
+            privacy_rules=[PrivacyRule(action=PrivacyAction.VIEW, condition_expr="expr_published")],
+        )
+        evaluator = AsyncRecordFieldEvaluator()
+        gate = PermissionGate(evaluator, {"expr_published": "published"})
+        entities = [{"id": i, "title": str(i), "published": i % 2 == 0} for i in range(10)]
+
+        result = await gate.filter_list_async(data_type, entities, PrivacyAction.VIEW, ExecutionContext(), concurrency=3)
+
+        assert [entity["id"] for entity in result] == [0, 2, 4, 6, 8]
+        assert evaluator.peak == 3
+
+
+class TestCheckAsync:
+    """Test custom rule evaluation in the CPU worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_custom_rule_runs_in_worker(self):
+        """Test that check_async agrees with check for custom rules."""
+        data_type = DataType(
+            name="Note",
+            privacy_rules=[PrivacyRule(action=PrivacyAction.VIEW, condition_expr="expr_published")],
+        )
+        gate = PermissionGate(RecordFieldEvaluator(), {"expr_published": "published"})
+        context = ExecutionContext()
+
+        try:
+            for entity, allowed in (({"published": True}, True), ({"published": False}, False)):
+                assert gate.check(data_type, PrivacyAction.VIEW, entity, context).is_allowed is allowed
+                result = await gate.check_async(data_type, PrivacyAction.VIEW, entity, context)
+                assert result.is_allowed is allowed
+        finally:
+            shutdown_pools()
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_evaluator_fails_loudly(self):
+        """Test that an evaluator the pool cannot receive raises instead of denying."""
+        data_type = DataType(
+            name="Note",
+            privacy_rules=[PrivacyRule(action=PrivacyAction.VIEW, condition_expr="expr_published")],
+        )
+        evaluator = RecordFieldEvaluator()
+        evaluator.lock = threading.Lock()  # not picklable
+        gate = PermissionGate(evaluator, {"expr_published": "published"})
+
+        with pytest.raises(pickle.PicklingError):
+            await gate.check_async(data_type, PrivacyAction.VIEW, {"published": True}, ExecutionContext())
@@ -13,9 +13,11 @@ from pathlib import Path
 
 from orionx.persistence.base import ExecutionRecord
 from orionx.persistence.memory import InMemoryExecutionStore
+from orionx.persistence.redis import APPEND_STEP_LOG_SCRIPT, UPDATE_STATUS_SCRIPT, RedisExecutionStore
 from orionx.persistence.sqlite import SQLiteExecutionStore
 from orionx.schemas.execution import ExecutionStatus
 from orionx.config import get_config, reset_config, load_config
+from orionx.utils.serialization import loads
 
 
 class TestInMemoryStore:
@@ -100,6 +102,33 @@ class TestInMemoryStore:
         assert len(active) == 2
         statuses = {r.status for r in active}
         assert statuses == {ExecutionStatus.PENDING, ExecutionStatus.RUNNING}
+
+    @pytest.mark.asyncio
+    async def test_status_index_follows_updates(self, store, sample_record):
+        """Test that status listings track update_status, re-save and delete."""
+        await store.save(sample_record)
+        await store.update_status(sample_record.execution_id, ExecutionStatus.COMPLETED)
+
+        assert await store.list_active() == []
+        assert await store.list_by_status(ExecutionStatus.COMPLETED) == [sample_record]
+
+        sample_record.status = ExecutionStatus.FAILED
+        await store.save(sample_record)
+        assert await store.list_by_status(ExecutionStatus.COMPLETED) == []
+        assert await store.list_for_workflow("wf_test") == [sample_record]
+
+        await store.delete(sample_record.execution_id)
+        assert await store.list_by_status(ExecutionStatus.FAILED) == []
+        assert await store.list_for_user("user_123") == []
+
+    @pytest.mark.asyncio
+    async def test_update_status_coerces_values(self, store, sample_record):
+        """Test that a raw status string is stored as the enum member."""
+        await store.save(sample_record)
+        await store.update_status(sample_record.execution_id, "completed")
+        
+        assert sample_record.status is ExecutionStatus.COMPLETED
+        assert await store.list_by_status(ExecutionStatus.COMPLETED) == [sample_record]
     
     @pytest.mark.asyncio
     async def test_delete(self, store, sample_record):
@@ -113,6 +142,27 @@ class TestInMemoryStore:
         assert retrieved is None
 
 
+class TestExecutionRecord:
+    """Test execution record serialization."""
+    
+    def test_json_bytes_matches_dict(self):
+        """Test that to_json_bytes() encodes the to_dict() layout."""
+        record = ExecutionRecord(
+            execution_id="exec_json",
+            workflow_uid="wf_test",
+            user_uid="user_123",
+            status=ExecutionStatus.COMPLETED,
+            started_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            completed_at=datetime(2024, 1, 2, 3, 4, 6),
+            step_logs=[{"step_uid": "step_1"}],
+        )
+        
+        data = loads(record.to_json_bytes())
+        
+        assert data == record.to_dict()
+        assert ExecutionRecord.from_dict(data).started_at == record.started_at
+
+
 class TestSQLiteStore:
     """Test SQLite execution store."""
     
@@ -159,6 +209,29 @@ class TestSQLiteStore:
         assert retrieved.workflow_uid == "wf_test"
         assert retrieved.user_uid == "user_456"
     
+    def test_connection_reused_in_wal_mode(self, store):
+        """Test that a thread keeps one WAL-mode connection until close()."""
+        conn = store._get_connection()
+        
+        assert store._get_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        
+        store.close()
+        assert store._get_connection() is not conn
+    
+    @pytest.mark.asyncio
+    async def test_append_step_log(self, store, sample_record):
+        """Test that appended step logs accumulate in order."""
+        await store.save(sample_record)
+        
+        for i in range(3):
+            assert await store.append_step_log(sample_record.execution_id, {"step_uid": f"step_{i}", "note": "a,]"})
+        assert await store.append_step_log("exec_missing", {}) is False
+        
+        retrieved = await store.get(sample_record.execution_id)
+        assert [log["step_uid"] for log in retrieved.step_logs] == ["step_0", "step_1", "step_2"]
+        assert retrieved.step_logs[0]["note"] == "a,]"
+    
     @pytest.mark.asyncio
     async def test_complex_data_serialization(self, store):
         """Test that complex data (step logs, errors) serialize correctly."""
@@ -186,6 +259,223 @@ class TestSQLiteStore:
         assert retrieved.input_snapshot["params"]["id"] == 123
 
 
+class FakeRedis:
+    """
+    In-process stand-in for redis.asyncio.Redis (the package is optional).
+    
+    Implements only the commands the store uses; every awaited command
+    and every executed pipeline counts as one round trip.
+    """
+    
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+    
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        op = getattr(self, "_" + name)
+        
+        async def command(*args, **kwargs):
+            self.round_trips += 1
+            return op(*args, **kwargs)
+        
+        return command
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def register_script(self, script):
+        """Run the store's Lua scripts as Python equivalents."""
+        op = {
+            UPDATE_STATUS_SCRIPT: self._update_status_script,
+            APPEND_STEP_LOG_SCRIPT: self._append_step_log_script,
+        }[script]
+        
+        async def run(keys, args):
+            self.round_trips += 1
+            return op(keys, args)
+        
+        return run
+    
+    def _update_status_script(self, keys, args):
+        if not self._exists(keys[0]):
+            return 0
+        ttl, status_prefix, execution_id, status, *pairs = args
+        old = self._hget(keys[0], "status")
+        self._hset(keys[0], mapping=dict(zip(pairs[::2], pairs[1::2])))
+        self._expire(keys[0], ttl)
+        self._expire(keys[1], ttl)
+        if old is not None:
+            self._srem(status_prefix + loads(old), execution_id)
+        self._sadd(status_prefix + status, execution_id)
+        return 1
+    
+    def _append_step_log_script(self, keys, args):
+        if not self._exists(keys[0]):
+            return 0
+        self._rpush(keys[1], args[1])
+        self._expire(keys[1], args[0])
+        return 1
+    
+    def _typed(self, key, kind):
+        value = self.data.setdefault(key, kind())
+        if type(value) is not kind:
+            raise TypeError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+    
+    def _hset(self, key, mapping):
+        self._typed(key, dict).update(mapping)
+    
+    def _hget(self, key, field):
+        return self.data[key].get(field) if key in self.data else None
+    
+    def _hgetall(self, key):
+        return dict(self._typed(key, dict)) if key in self.data else {}
+    
+    def _rpush(self, key, *values):
+        self._typed(key, list).extend(values)
+    
+    def _lrange(self, key, start, end):
+        return list(self._typed(key, list)) if key in self.data else []
+    
+    def _sadd(self, key, *members):
+        self._typed(key, set).update(members)
+    
+    def _srem(self, key, *members):
+        if key in self.data:
+            self._typed(key, set).difference_update(members)
+    
+    def _smembers(self, key):
+        return set(self._typed(key, set)) if key in self.data else set()
+    
+    def _exists(self, key):
+        return int(key in self.data)
+    
+    def _expire(self, key, seconds):
+        if key not in self.data:
+            return 0
+        self.ttls[key] = seconds
+        return 1
+    
+    def _delete(self, *keys):
+        self.ttls.update((key, None) for key in keys)
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute()."""
+    
+    def __init__(self, client):
+        self._client = client
+        self._queued = []
+    
+    def __getattr__(self, name):
+        op = getattr(self._client, "_" + name)
+        return lambda *args, **kwargs: self._queued.append((op, args, kwargs))
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def execute(self):
+        self._client.round_trips += 1
+        queued, self._queued = self._queued, []
+        return [op(*args, **kwargs) for op, args, kwargs in queued]
+
+
+class TestRedisStore:
+    """Test the Redis execution store against an in-process fake client."""
+    
+    @pytest.fixture
+    def client(self):
+        return FakeRedis()
+    
+    @pytest.fixture
+    def store(self, client):
+        store = RedisExecutionStore(ttl=60)
+        store._redis = client
+        return store
+    
+    @pytest.fixture
+    def sample_record(self):
+        return ExecutionRecord(
+            execution_id="exec_redis_001",
+            workflow_uid="wf_test",
+            user_uid="user_789",
+            status=ExecutionStatus.RUNNING,
+            started_at=datetime(2024, 1, 2, 3, 4, 5),
+            step_logs=[{"step_uid": "step_0"}],
+        )
+    
+    @pytest.mark.asyncio
+    async def test_save_update_append_and_list(self, store, sample_record):
+        """Test the hash/list round trip and that status moves between index sets."""
+        await store.save(sample_record)
+        assert await store.append_step_log(sample_record.execution_id, {"step_uid": "step_1"})
+        assert await store.update_status(
+            sample_record.execution_id,
+            ExecutionStatus.FAILED,
+            error={"type": "RuntimeError"},
+        )
+        
+        retrieved = await store.get(sample_record.execution_id)
+        assert retrieved.status == ExecutionStatus.FAILED
+        assert retrieved.started_at == sample_record.started_at
+        assert retrieved.error == {"type": "RuntimeError"}
+        assert [log["step_uid"] for log in retrieved.step_logs] == ["step_0", "step_1"]
+        
+        assert await store.list_active() == []
+        assert [r.execution_id for r in await store.list_by_status(ExecutionStatus.FAILED)] == ["exec_redis_001"]
+        
+        assert await store.delete(sample_record.execution_id) is True
+        assert await store.get(sample_record.execution_id) is None
+        assert await store.append_step_log(sample_record.execution_id, {}) is False
+        assert await store.update_status(sample_record.execution_id, ExecutionStatus.COMPLETED) is False
+    
+    @pytest.mark.asyncio
+    async def test_update_status_refreshes_ttl(self, store, client, sample_record):
+        """Test that update_status keeps the hash and its log list expiring together."""
+        await store.save(sample_record)
+        client.ttls.clear()
+        
+        await store.update_status(sample_record.execution_id, ExecutionStatus.COMPLETED)
+        
+        assert client.ttls == {store._key("exec_redis_001"): 60, store._logs_key("exec_redis_001"): 60}
+    
+    @pytest.mark.asyncio
+    async def test_cached_writes_skip_missing_records(self, client, sample_record):
+        """Test that a cached status never recreates an expired record."""
+        store = RedisExecutionStore(cache_reads=True)
+        store._redis = client
+        await store.save(sample_record)
+        
+        client.round_trips = 0
+        assert await store.append_step_log(sample_record.execution_id, {"step_uid": "step_1"})
+        assert await store.update_status(sample_record.execution_id, ExecutionStatus.COMPLETED)
+        assert client.round_trips == 2
+        
+        client.data.clear()  # the record expires
+        assert await store.update_status(sample_record.execution_id, ExecutionStatus.FAILED) is False
+        assert await store.append_step_log(sample_record.execution_id, {}) is False
+        assert client.data == {}
+        assert sample_record.execution_id not in store._status_cache
+    
+    @pytest.mark.asyncio
+    async def test_old_layout_keys_are_ignored(self, store, client, sample_record):
+        """Test that string records from the previous layout never reach HGETALL."""
+        client.data["orionx:execution:exec_old"] = b"{}"
+        client.data["orionx:status:running"] = {"exec_old"}
+        
+        await store.save(sample_record)
+        
+        assert [r.execution_id for r in await store.list_active()] == ["exec_redis_001"]
+        assert await store.get("exec_old") is None
+
+
 class TestConfig:
     """Test configuration loading."""
     
@@ -219,6 +509,50 @@ class TestConfig:
         assert config.limits.max_api_calls == 50
         assert config.limits.workflow_timeout_seconds == 600.0
     
+    def test_worker_threads_config(self, monkeypatch):
+        """Test worker thread pool sizing from environment."""
+        monkeypatch.setenv("ORIONX_WORKER_THREADS", "3")
+        
+        config = load_config()
+        
+        assert config.worker_threads == 3
+    
+    def test_execution_store_is_shared(self, monkeypatch):
+        """Test that the configured store is built once until the cache is cleared."""
+        from orionx.persistence import get_execution_store
+        
+        monkeypatch.setenv("ORIONX_PERSISTENCE_BACKEND", "memory")
+        get_execution_store.cache_clear()
+        try:
+            store = get_execution_store()
+            assert isinstance(store, InMemoryExecutionStore)
+            assert get_execution_store() is store
+            
+            get_execution_store.cache_clear()
+            assert get_execution_store() is not store
+        finally:
+            get_execution_store.cache_clear()
+    
+    @pytest.mark.asyncio
+    async def test_close_execution_store(self, monkeypatch, tmp_path):
+        """Test that shutdown closes the shared store before dropping it."""
+        from orionx.persistence import close_execution_store, get_execution_store
+        
+        monkeypatch.setenv("ORIONX_PERSISTENCE_BACKEND", "sqlite")
+        monkeypatch.setenv("ORIONX_SQLITE_PATH", str(tmp_path / "shared.db"))
+        get_execution_store.cache_clear()
+        try:
+            store = get_execution_store()
+            assert isinstance(store, SQLiteExecutionStore)
+            store._get_connection()
+            
+            await close_execution_store()
+            
+            assert store._connections == []
+            assert get_execution_store.cache_info().currsize == 0
+        finally:
+            get_execution_store.cache_clear()
+    
     def test_persistence_backend_config(self, monkeypatch):
         """Test persistence backend configuration."""
         from orionx.config import PersistenceBackend
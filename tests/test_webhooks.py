@@ -0,0 +1,75 @@
+"""
+OrionX Webhook Tests
+
+Tests for batched outbound webhook delivery.
+"""
+
+import pytest
+import hashlib
+import hmac
+import json
+
+from orionx.api.routes import WebhookConfig
+from orionx.api.webhook_batcher import WebhookBatcher, SIGNATURE_HEADER
+
+
+class FakeResponse:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Records POSTs instead of sending them."""
+
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, data=None, headers=None):
+        self.posts.append((url, data, headers))
+        return FakeResponse()
+
+
+class TestWebhookBatcher:
+    """Test event coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_events_coalesced_into_batches(self):
+        """Test that events are grouped up to the max batch size."""
+        session = FakeSession()
+        batcher = WebhookBatcher(max_batch_size=10, batch_interval_ms=50, http_client=session)
+        batcher.subscribe(WebhookConfig(url="https://hooks.example.com/a"))
+
+        await batcher.start()
+        for i in range(25):
+            batcher.emit({"event": "step_completed", "step_uid": f"step_{i}"})
+        await batcher.stop()
+
+        sizes = [len(json.loads(data)["events"]) for _, data, _ in session.posts]
+        assert sizes == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_subscription_filter_and_signature(self):
+        """Test event filtering per subscriber and HMAC signing."""
+        session = FakeSession()
+        batcher = WebhookBatcher(http_client=session)
+        batcher.subscribe(WebhookConfig(
+            url="https://hooks.example.com/failures",
+            events=["step_failed"],
+            secret="s3cret",
+        ))
+
+        await batcher.start()
+        batcher.emit({"event": "step_completed", "step_uid": "step_1"})
+        batcher.emit({"event": "step_failed", "step_uid": "step_2"})
+        await batcher.stop()
+
+        assert len(session.posts) == 1
+        _, body, headers = session.posts[0]
+        assert [e["step_uid"] for e in json.loads(body)["events"]] == ["step_2"]
+        expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        assert headers[SIGNATURE_HEADER] == f"sha256={expected}"